@@ -0,0 +1,403 @@
+"""Benchmarks for the FoxyPack dispatch and fallback paths.
+
+Fake modules with configurable latency and failure distributions are
+registered on a controller and the public lookup APIs are timed across
+module counts and concurrency levels. Results are written as JSON so runs
+of different foxypack versions can be compared when run with the same
+parameters::
+
+    uv run python benchmarks/bench_controller.py --output before.json
+    uv run python benchmarks/bench_controller.py --compare before.json
+
+``--compare`` exits with status 1 when a throughput drops by more than
+``--tolerance``.
+"""
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import math
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from foxypack import (
+    AnswersAnalysis,
+    AnswersSocialContent,
+    AnswersStatistics,
+    FoxyAnalysis,
+    FoxyError,
+    FoxyPack,
+    FoxyStatistics,
+    ServiceUnavailableError,
+)
+
+PLATFORM = "Bench"
+
+
+class Latency:
+    """Log-normal latency around ``median`` seconds that fails at ``failure_rate``."""
+
+    def __init__(
+        self, median: float, sigma: float, failure_rate: float, rng: random.Random
+    ) -> None:
+        self.median = median
+        self.sigma = sigma
+        self.failure_rate = failure_rate
+        self.rng = rng
+
+    def sample(self) -> tuple[float, bool]:
+        delay = 0.0
+        if self.median > 0:
+            delay = self.rng.lognormvariate(math.log(self.median), self.sigma)
+        return delay, self.rng.random() < self.failure_rate
+
+
+class BenchAnalysis(FoxyAnalysis):
+    latency: Latency
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        delay, failed = self.latency.sample()
+        if delay:
+            time.sleep(delay)
+        if failed:
+            raise ServiceUnavailableError()
+        return AnswersAnalysis(url=url, social_platform=PLATFORM, type_content="video")
+
+    async def get_analysis_async(self, url: str) -> AnswersAnalysis:
+        delay, failed = self.latency.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        if failed:
+            raise ServiceUnavailableError()
+        return AnswersAnalysis(url=url, social_platform=PLATFORM, type_content="video")
+
+
+class BenchStatistics(FoxyStatistics):
+    supported_platforms = (PLATFORM,)
+    latency: Latency
+
+    def get_statistics(self, answers_analysis: AnswersAnalysis) -> AnswersStatistics:
+        delay, failed = self.latency.sample()
+        if delay:
+            time.sleep(delay)
+        if failed:
+            raise ServiceUnavailableError()
+        return _answer(answers_analysis)
+
+    async def get_statistics_async(
+        self, answers_analysis: AnswersAnalysis
+    ) -> AnswersStatistics:
+        delay, failed = self.latency.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        if failed:
+            raise ServiceUnavailableError()
+        return _answer(answers_analysis)
+
+
+def _answer(answers_analysis: AnswersAnalysis) -> AnswersSocialContent:
+    return AnswersSocialContent(
+        system_id="bench",
+        title="Bench",
+        views=1,
+        publish_date=date(2024, 1, 1),
+        analysis_status=answers_analysis,
+    )
+
+
+def build_controller(
+    args: argparse.Namespace, modules: int, rng: random.Random
+) -> tuple[FoxyPack, list[str]]:
+    """Controller with ``modules`` analysis and statistics modules, plus URLs.
+
+    Modules compare by class name, so each one gets its own subclass. Every
+    analysis module owns one host and the URLs cycle through all of them;
+    every statistics module can answer, so failures fall back to the next.
+    """
+    foxypack = FoxyPack()
+    for index in range(modules):
+        analysis = type(
+            f"BenchAnalysis{index}",
+            (BenchAnalysis,),
+            {"supported_hosts": (f"bench{index}.example",)},
+        )()
+        analysis.latency = Latency(args.analysis_latency_ms / 1000, args.sigma, 0, rng)
+        statistics = type(f"BenchStatistics{index}", (BenchStatistics,), {})()
+        statistics.latency = Latency(
+            args.latency_ms / 1000, args.sigma, args.failure_rate, rng
+        )
+        foxypack.with_module(analysis, statistics)
+    urls = [
+        f"https://bench{index % modules}.example/content/{index}"
+        for index in range(args.requests)
+    ]
+    return foxypack, urls
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(
+    name: str,
+    modules: int,
+    concurrency: int,
+    latencies: list[float],
+    items: int,
+    errors: int,
+    elapsed: float,
+) -> dict[str, Any]:
+    p50 = percentile(latencies, 0.50)
+    p99 = percentile(latencies, 0.99)
+    return {
+        "benchmark": name,
+        "modules": modules,
+        "concurrency": concurrency,
+        "requests": items,
+        "errors": errors,
+        "seconds": elapsed,
+        "throughput": items / elapsed if elapsed else None,
+        "p50_ms": p50 * 1000 if p50 is not None else None,
+        "p99_ms": p99 * 1000 if p99 is not None else None,
+    }
+
+
+def run_sync(
+    call: Callable[[str], object], urls: list[str], concurrency: int
+) -> tuple[list[float], int, float]:
+    def timed(url: str) -> tuple[float, bool]:
+        started = time.perf_counter()
+        try:
+            call(url)
+        except FoxyError:
+            return time.perf_counter() - started, False
+        return time.perf_counter() - started, True
+
+    started = time.perf_counter()
+    if concurrency == 1:
+        outcomes = [timed(url) for url in urls]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = list(pool.map(timed, urls))
+    elapsed = time.perf_counter() - started
+    return [latency for latency, _ in outcomes], _failures(outcomes), elapsed
+
+
+async def run_async(
+    foxypack: FoxyPack, urls: list[str], concurrency: int
+) -> tuple[list[float], int, float]:
+    pending = iter(urls)
+    outcomes: list[tuple[float, bool]] = []
+
+    async def worker() -> None:
+        for url in pending:
+            started = time.perf_counter()
+            try:
+                await foxypack.get_statistics_async(url)
+            except FoxyError:
+                outcomes.append((time.perf_counter() - started, False))
+            else:
+                outcomes.append((time.perf_counter() - started, True))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return [latency for latency, _ in outcomes], _failures(outcomes), elapsed
+
+
+async def run_batches(
+    foxypack: FoxyPack,
+    urls: list[str],
+    concurrency: int,
+    batch_size: int,
+    streaming: bool,
+) -> tuple[list[float], int, float]:
+    """Time ``urls`` in batches; latencies are per batch, not per URL."""
+    latencies: list[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for offset in range(0, len(urls), batch_size):
+        batch = urls[offset : offset + batch_size]
+        batch_started = time.perf_counter()
+        if streaming:
+            results = [
+                result
+                async for _, result in foxypack.iter_statistics(batch, concurrency)
+            ]
+        else:
+            results = list(await foxypack.get_statistics_many(batch, concurrency))
+        latencies.append(time.perf_counter() - batch_started)
+        errors += sum(isinstance(result, FoxyError) for result in results)
+    return latencies, errors, time.perf_counter() - started
+
+
+def _failures(outcomes: list[tuple[float, bool]]) -> int:
+    return sum(not succeeded for _, succeeded in outcomes)
+
+
+def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    results = []
+    for modules in args.modules:
+        for concurrency in args.concurrency:
+            rng = random.Random(args.seed)
+            foxypack, urls = build_controller(args, modules, rng)
+            with foxypack:
+                for name in args.benchmarks:
+                    if name == "get_analysis":
+                        outcome = run_sync(foxypack.get_analysis, urls, concurrency)
+                    elif name == "get_statistics":
+                        outcome = run_sync(foxypack.get_statistics, urls, concurrency)
+                    elif name == "get_statistics_async":
+                        outcome = asyncio.run(run_async(foxypack, urls, concurrency))
+                    else:
+                        outcome = asyncio.run(
+                            run_batches(
+                                foxypack,
+                                urls,
+                                concurrency,
+                                args.batch_size,
+                                streaming=name == "iter_statistics",
+                            )
+                        )
+                    latencies, errors, elapsed = outcome
+                    result = summarize(
+                        name,
+                        modules,
+                        concurrency,
+                        latencies,
+                        len(urls),
+                        errors,
+                        elapsed,
+                    )
+                    results.append(result)
+                    print(_format(result), file=sys.stderr)
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Regressions of throughput larger than ``tolerance`` against ``baseline``."""
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get(_key(result))
+        if before is None or not before["throughput"] or not result["throughput"]:
+            continue
+        ratio = result["throughput"] / before["throughput"]
+        if ratio < 1 - tolerance:
+            regressions.append(f"{_format(result)}: throughput {ratio:.0%} of baseline")
+    return regressions
+
+
+def _key(result: dict[str, Any]) -> tuple[str, int, int]:
+    return result["benchmark"], result["modules"], result["concurrency"]
+
+
+def _format(result: dict[str, Any]) -> str:
+    p50 = result["p50_ms"] or 0.0
+    p99 = result["p99_ms"] or 0.0
+    return (
+        f"{result['benchmark']:<22} modules={result['modules']:<3} "
+        f"concurrency={result['concurrency']:<4} "
+        f"{result['throughput'] or 0:>10.0f}/s p50={p50:.3f}ms p99={p99:.3f}ms "
+        f"errors={result['errors']}"
+    )
+
+
+def _version() -> str:
+    try:
+        return importlib.metadata.version("foxypack")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+BENCHMARKS = (
+    "get_analysis",
+    "get_statistics",
+    "get_statistics_async",
+    "get_statistics_many",
+    "iter_statistics",
+)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=_int_list, default=[1, 4, 16])
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="median statistics latency"
+    )
+    parser.add_argument(
+        "--analysis-latency-ms", type=float, default=0.0, help="median analysis latency"
+    )
+    parser.add_argument("--sigma", type=float, default=0.5, help="log-normal spread")
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="share of statistics calls that fail and fall back to the next module",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS)
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed throughput drop against the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run(args)
+    report = {
+        "foxypack": _version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "created": time.time(),
+        "parameters": {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in vars(args).items()
+        },
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare is not None:
+        regressions = compare(
+            results, json.loads(args.compare.read_text()), args.tolerance
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
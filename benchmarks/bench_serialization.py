@@ -0,0 +1,134 @@
+"""Benchmarks for answer serialization against ``dataclasses.asdict``.
+
+Times the dict, JSON Lines and binary codecs of ``foxypack.serialization``
+on a batch of ``AnswersSocialContent`` records and prints (or writes) the
+results as JSON::
+
+    uv run python benchmarks/bench_serialization.py --records 10000
+"""
+
+import argparse
+import dataclasses
+import io
+import json
+import pickle
+import platform
+import sys
+import time
+from collections.abc import Callable, Sequence
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from foxypack import AnswersAnalysis, AnswersSocialContent
+from foxypack.serialization import (
+    JSONLinesWriter,
+    decode_binary,
+    encode_binary,
+    from_dict,
+    read_json_lines,
+    to_dict,
+)
+
+
+def make_records(count: int) -> list[AnswersSocialContent]:
+    return [
+        AnswersSocialContent(
+            system_id=f"VID_{index:06d}",
+            title=f"Video number {index}",
+            views=index * 37,
+            publish_date=date(2024, 1, 1) + timedelta(days=index % 365),
+            analysis_status=AnswersAnalysis(
+                url=f"https://fakesocialmedia.com/watch?v={index}",
+                social_platform="FakeSocialMedia",
+                type_content="video",
+            ),
+        )
+        for index in range(count)
+    ]
+
+
+def asdict_json_lines(records: list[AnswersSocialContent]) -> str:
+    return "".join(
+        json.dumps(dataclasses.asdict(record), default=str) + "\n" for record in records
+    )
+
+
+def json_lines(records: list[AnswersSocialContent]) -> str:
+    stream = io.StringIO()
+    JSONLinesWriter(stream).write_all(records)
+    return stream.getvalue()
+
+
+def cases(records: list[AnswersSocialContent]) -> dict[str, Callable[[], object]]:
+    dicts = [to_dict(record) for record in records]
+    lines = json_lines(records)
+    blobs = [encode_binary(record) for record in records]
+    pickles = [pickle.dumps(record) for record in records]
+    return {
+        "asdict": lambda: [dataclasses.asdict(record) for record in records],
+        "to_dict": lambda: [to_dict(record) for record in records],
+        "from_dict": lambda: [from_dict(data) for data in dicts],
+        "asdict_json_lines": lambda: asdict_json_lines(records),
+        "json_lines_write": lambda: json_lines(records),
+        "json_lines_read": lambda: list(read_json_lines(lines.splitlines())),
+        "binary_encode": lambda: [encode_binary(record) for record in records],
+        "binary_decode": lambda: [decode_binary(blob) for blob in blobs],
+        "pickle_dumps": lambda: [pickle.dumps(record) for record in records],
+        "pickle_loads": lambda: [pickle.loads(blob) for blob in pickles],
+    }
+
+
+def measure(func: Callable[[], object], records: int, repeat: int) -> dict[str, Any]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        "best_seconds": best,
+        "records_per_second": records / best,
+        "microseconds_per_record": best / records * 1e6,
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    records = make_records(args.records)
+    results = {}
+    for name, func in cases(records).items():
+        results[name] = measure(func, args.records, args.repeat)
+        print(
+            f"{name:<18} {results[name]['microseconds_per_record']:>8.2f} us/record",
+            file=sys.stderr,
+        )
+    sizes = {
+        "binary": sum(len(encode_binary(record)) for record in records),
+        "pickle": sum(len(pickle.dumps(record)) for record in records),
+        "json_lines": len(json_lines(records).encode()),
+    }
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "records": args.records,
+        "results": results,
+        "bytes": sizes,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
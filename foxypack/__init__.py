@@ -7,6 +7,26 @@ from foxypack.foxypack_abc.answers import (
     AnswersSocialContent,
 )
 from foxypack.controller import FoxyPack
+from foxypack.balancer import AdaptiveBalancer, ModuleHealth
+from foxypack.batching import MicroBatcher
+from foxypack.cache import (
+    CacheBackend,
+    CacheStats,
+    LRUCache,
+    NegativeCache,
+    StatisticsCache,
+    TieredCache,
+)
+from foxypack.circuit import CircuitBreaker, CircuitBreakers, CircuitState
+from foxypack.columns import StatisticsColumns
+from foxypack.deadline import remaining_time
+from foxypack.hedging import HedgingPolicy
+from foxypack.interning import AnalysisPool
+from foxypack.metrics import FoxyMetrics, InMemoryMetrics
+from foxypack.ratelimit import RateLimit, RateLimiter, TokenBucket
+from foxypack.retry import RetryBudget, RetryPolicy
+from foxypack.sqlitecache import SQLiteCache
+from foxypack.trace import AttemptRecord
 
 from foxypack.exceptions import (
     FoxyError,
@@ -28,6 +48,31 @@ __all__ = [
     "FoxyAnalysis",
     "FoxyStatistics",
     "FoxyPack",
+    "CacheBackend",
+    "LRUCache",
+    "CacheStats",
+    "StatisticsCache",
+    "NegativeCache",
+    "TieredCache",
+    "SQLiteCache",
+    "RateLimit",
+    "RateLimiter",
+    "TokenBucket",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitState",
+    "RetryBudget",
+    "RetryPolicy",
+    "HedgingPolicy",
+    "AdaptiveBalancer",
+    "ModuleHealth",
+    "MicroBatcher",
+    "FoxyMetrics",
+    "InMemoryMetrics",
+    "AttemptRecord",
+    "StatisticsColumns",
+    "AnalysisPool",
+    "remaining_time",
     "AnswersAnalysis",
     "AnswersStatistics",
     "AnswersSocialContainer",
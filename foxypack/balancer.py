@@ -0,0 +1,124 @@
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from foxypack.exceptions import ConfigurationError
+
+M = TypeVar("M")
+
+
+@dataclass(slots=True)
+class ModuleHealth:
+    """Smoothed observations for one module on one social platform."""
+
+    latency: float
+    success: float
+    samples: int = 1
+    current_weight: float = 0.0
+
+    @property
+    def cost(self) -> float:
+        """Expected seconds spent per successful answer."""
+        if self.success <= 0:
+            return float("inf")
+        return self.latency / self.success
+
+
+class AdaptiveBalancer:
+    """Orders statistics modules by observed success ratio and latency.
+
+    Every call updates an exponentially weighted moving average (``alpha``)
+    of latency and success per module and ``social_platform``. Modules are
+    tried cheapest first; modules whose cost is within ``tolerance`` times
+    the cheapest one are considered equivalent and take turns at the front
+    by smooth weighted round-robin, weighted by inverse cost. Modules with
+    no observations yet are tried first so they get measured. Modules whose
+    success ratio is below ``min_success`` come after all the others,
+    however fast they fail.
+    """
+
+    def __init__(
+        self, alpha: float = 0.2, tolerance: float = 1.25, min_success: float = 0.05
+    ) -> None:
+        if not 0 < alpha <= 1 or tolerance < 1 or not 0 <= min_success < 1:
+            raise ConfigurationError(
+                "Invalid balancer configuration",
+                details={
+                    "alpha": alpha,
+                    "tolerance": tolerance,
+                    "min_success": min_success,
+                },
+            )
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.min_success = min_success
+        self._health: dict[tuple[str, str], ModuleHealth] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, module: object, platform: str, latency: float, success: bool
+    ) -> None:
+        key = (type(module).__name__, platform)
+        outcome = 1.0 if success else 0.0
+        with self._lock:
+            health = self._health.get(key)
+            if health is None:
+                self._health[key] = ModuleHealth(latency=latency, success=outcome)
+                return
+            health.latency += self.alpha * (latency - health.latency)
+            health.success += self.alpha * (outcome - health.success)
+            health.samples += 1
+
+    def order(self, modules: Iterable[M], platform: str) -> list[M]:
+        """Modules in the order they should be tried for ``platform``."""
+        with self._lock:
+            unknown: list[M] = []
+            known: list[tuple[ModuleHealth, M]] = []
+            for module in modules:
+                health = self._health.get((type(module).__name__, platform))
+                if health is None:
+                    unknown.append(module)
+                else:
+                    known.append((health, module))
+            if not known:
+                return unknown
+            known.sort(
+                key=lambda item: (item[0].success < self.min_success, item[0].cost)
+            )
+            healthy = known[0][0].success >= self.min_success
+            limit = known[0][0].cost * self.tolerance
+            group = [
+                item
+                for item in known
+                if item[0].cost <= limit
+                and (item[0].success >= self.min_success) == healthy
+            ]
+            if len(group) > 1:
+                chosen = self._pick_weighted(group)
+                known.remove(chosen)
+                known.insert(0, chosen)
+            return unknown + [module for _, module in known]
+
+    def snapshot(self) -> dict[tuple[str, str], ModuleHealth]:
+        """Copy of the observations keyed by ``(module, platform)``."""
+        with self._lock:
+            return {
+                key: ModuleHealth(
+                    latency=health.latency,
+                    success=health.success,
+                    samples=health.samples,
+                )
+                for key, health in self._health.items()
+            }
+
+    @staticmethod
+    def _pick_weighted(
+        group: list[tuple[ModuleHealth, M]],
+    ) -> tuple[ModuleHealth, M]:
+        weights = [1.0 / max(health.cost, 1e-6) for health, _ in group]
+        for (health, _), weight in zip(group, weights, strict=True):
+            health.current_weight += weight
+        chosen = max(group, key=lambda item: item[0].current_weight)
+        chosen[0].current_weight -= sum(weights)
+        return chosen
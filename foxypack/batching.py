@@ -0,0 +1,113 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Generic, TypeVar
+
+from foxypack.exceptions import (
+    ConfigurationError,
+    FoxyError,
+    ImplementationContractError,
+)
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+Flush = Callable[[list[I]], Awaitable[Sequence[R | FoxyError]]]
+
+
+class _Batch(Generic[I, R]):
+    __slots__ = ("flush", "futures", "items", "timer")
+
+    def __init__(self, flush: Flush[I, R]) -> None:
+        self.items: list[I] = []
+        self.futures: list[asyncio.Future[R]] = []
+        self.flush = flush
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher(Generic[I, R]):
+    """Groups concurrent single-item async calls into batch calls.
+
+    Items submitted under the same key are queued until ``max_size`` of
+    them are waiting (or the caller's smaller limit) or ``max_wait``
+    seconds have passed since the first one, then sent to the flush
+    function together. Every caller gets its own result or error back.
+    """
+
+    def __init__(self, max_size: int = 50, max_wait: float = 0.01) -> None:
+        if max_size < 1 or max_wait < 0:
+            raise ConfigurationError(
+                "Invalid micro-batching window",
+                details={"max_size": max_size, "max_wait": max_wait},
+            )
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: dict[Hashable, _Batch[I, R]] = {}
+        self._flushing: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self,
+        key: Hashable,
+        item: I,
+        flush: Flush[I, R],
+        limit: int | None = None,
+    ) -> R:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(flush)
+            batch.timer = loop.call_later(self.max_wait, self._flush, key, batch)
+        future: asyncio.Future[R] = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        size = self.max_size if limit is None else min(self.max_size, limit)
+        if len(batch.items) >= size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _Batch[I, R]) -> None:
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        # The batch serves many callers, so it does not run with the
+        # deadline or trace of whichever caller happened to be first.
+        task = asyncio.get_running_loop().create_task(
+            self._run(batch), context=contextvars.Context()
+        )
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    @staticmethod
+    async def _run(batch: _Batch[I, R]) -> None:
+        waiting = [
+            (item, future)
+            for item, future in zip(batch.items, batch.futures, strict=True)
+            if not future.done()
+        ]
+        if not waiting:
+            return
+        try:
+            results = await batch.flush([item for item, _ in waiting])
+            if len(results) != len(waiting):
+                raise ImplementationContractError(
+                    "Batch call returned a different number of results",
+                    details={"expected": len(waiting), "returned": len(results)},
+                )
+        except asyncio.CancelledError:
+            for _, future in waiting:
+                future.cancel()
+            raise
+        except Exception as error:  # noqa: BLE001 - handed to every waiter
+            for _, future in waiting:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), result in zip(waiting, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, FoxyError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,377 @@
+import copy
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from foxypack.exceptions import (
+    ConfigurationError,
+    ContentAccessError,
+    ContentNotFoundError,
+    ContentPrivateError,
+    ContentRegionRestrictedError,
+)
+from foxypack.foxypack_abc.answers import AnswersAnalysis, AnswersStatistics
+from foxypack.routing import canonical_url
+
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters used to size a cache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+class CacheBackend(ABC, Generic[V]):
+    """Key-value store with per-entry lifetimes used by the answer caches.
+
+    ``blocking`` is true for backends whose calls can wait on I/O or locks
+    held by other processes; the async controller path calls them in a
+    worker thread.
+    """
+
+    stats: CacheStats
+    blocking: bool = False
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def get(self, key: str) -> V | None:
+        entry = self.get_entry(key, allow_stale=False)
+        return entry[0] if entry is not None else None
+
+    @abstractmethod
+    def get_entry(
+        self, key: str, allow_stale: bool = True
+    ) -> tuple[V, bool] | None: ...
+
+    @abstractmethod
+    def peek(self, key: str) -> tuple[V, float, float] | None:
+        """``(value, seconds to expiry, seconds to end of stale period)``.
+
+        Does not count towards ``stats`` or affect eviction.
+        """
+
+    @abstractmethod
+    def set(
+        self, key: str, value: V, ttl: float | None = None, stale_ttl: float = 0.0
+    ) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class LRUCache(CacheBackend[V]):
+    """Size-bounded least-recently-used cache with optional expiry.
+
+    Entries older than ``ttl`` seconds are treated as missing; when the cache
+    is full the least recently used entry is evicted. An entry stored with a
+    ``stale_ttl`` is kept that much longer and returned by ``get_entry`` as
+    stale. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ConfigurationError(
+                "Cache maxsize must be positive", details={"maxsize": maxsize}
+            )
+        if ttl is not None and ttl <= 0:
+            raise ConfigurationError("Cache ttl must be positive", details={"ttl": ttl})
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._data: OrderedDict[str, tuple[V, float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_entry(self, key: str, allow_stale: bool = True) -> tuple[V, bool] | None:
+        """Return ``(value, fresh)`` for ``key`` or ``None`` on a miss."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at, stale_until = item
+            now = self._clock()
+            if expires_at > now:
+                self._data.move_to_end(key)
+                self.stats.hits += 1
+                return value, True
+            if stale_until <= now:
+                del self._data[key]
+                self.stats.expirations += 1
+            elif allow_stale:
+                self._data.move_to_end(key)
+                self.stats.stale_hits += 1
+                return value, False
+            self.stats.misses += 1
+            return None
+
+    def peek(self, key: str) -> tuple[V, float, float] | None:
+        with self._lock:
+            item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at, stale_until = item
+        now = self._clock()
+        return value, expires_at - now, stale_until - now
+
+    def set(
+        self, key: str, value: V, ttl: float | None = None, stale_ttl: float = 0.0
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._data[key] = (value, expires_at, expires_at + stale_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache(CacheBackend[V]):
+    """A fast ``front`` tier, usually in memory, over a shared ``back`` tier.
+
+    Reads try ``front`` first and fall back to ``back``, copying fresh
+    entries forward with their remaining lifetime; writes go to both. With
+    an ``SQLiteCache`` as ``back`` the process keeps its hot entries in
+    memory while restarts and sibling processes reuse the disk entries.
+    """
+
+    def __init__(self, front: CacheBackend[V], back: CacheBackend[V]) -> None:
+        self.front = front
+        self.back = back
+        self.blocking = front.blocking or back.blocking
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.back)
+
+    def get_entry(self, key: str, allow_stale: bool = True) -> tuple[V, bool] | None:
+        entry = self.front.get_entry(key, allow_stale=False)
+        if entry is None:
+            entry = self._from_back(key, allow_stale)
+        with self._lock:
+            if entry is None:
+                self.stats.misses += 1
+            elif entry[1]:
+                self.stats.hits += 1
+            else:
+                self.stats.stale_hits += 1
+        return entry
+
+    def _from_back(self, key: str, allow_stale: bool) -> tuple[V, bool] | None:
+        item = self.back.peek(key)
+        if item is None:
+            return None
+        value, expires_in, stale_in = item
+        if expires_in > 0:
+            if math.isinf(expires_in):
+                self.front.set(key, value)
+            else:
+                self.front.set(
+                    key, value, ttl=expires_in, stale_ttl=stale_in - expires_in
+                )
+            return value, True
+        if allow_stale and stale_in > 0:
+            return value, False
+        return None
+
+    def peek(self, key: str) -> tuple[V, float, float] | None:
+        item = self.front.peek(key)
+        if item is not None and item[1] > 0:
+            return item
+        return self.back.peek(key)
+
+    def set(
+        self, key: str, value: V, ttl: float | None = None, stale_ttl: float = 0.0
+    ) -> None:
+        self.back.set(key, value, ttl=ttl, stale_ttl=stale_ttl)
+        self.front.set(key, value, ttl=ttl, stale_ttl=stale_ttl)
+
+    def delete(self, key: str) -> None:
+        self.back.delete(key)
+        self.front.delete(key)
+
+    def clear(self) -> None:
+        self.back.clear()
+        self.front.clear()
+
+
+class StatisticsCache:
+    """Cache of statistics answers with lifetimes per platform and content type.
+
+    ``ttls`` maps ``(social_platform, type_content)`` to a lifetime in
+    seconds; either part may be ``None`` to match any value. The most
+    specific key wins and ``ttl`` is used when nothing matches. Answers older
+    than their lifetime stay available as stale for another ``stale_ttl``
+    seconds so the async path can serve them while refreshing.
+
+    Entries live in an ``LRUCache`` of ``maxsize`` unless another
+    ``backend``, such as a ``TieredCache`` over an ``SQLiteCache``, is given.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: float = 300.0,
+        ttls: Mapping[tuple[str | None, str | None], float] | None = None,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        backend: CacheBackend[AnswersStatistics] | None = None,
+    ) -> None:
+        if stale_ttl < 0:
+            raise ConfigurationError(
+                "Cache stale_ttl must not be negative", details={"stale_ttl": stale_ttl}
+            )
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self._entries: CacheBackend[AnswersStatistics] = (
+            backend
+            if backend is not None
+            else LRUCache(maxsize=maxsize, ttl=ttl, clock=clock)
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._entries.stats
+
+    @property
+    def blocking(self) -> bool:
+        return self._entries.blocking
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, answers_analysis: AnswersAnalysis) -> float:
+        platform = answers_analysis.social_platform
+        type_content = answers_analysis.type_content
+        for key in (
+            (platform, type_content),
+            (platform, None),
+            (None, type_content),
+        ):
+            ttl = self.ttls.get(key)
+            if ttl is not None:
+                return ttl
+        return self.ttl
+
+    def lookup(self, url: str) -> tuple[AnswersStatistics, bool] | None:
+        """Return ``(statistics, fresh)`` for ``url`` or ``None`` on a miss."""
+        return self._entries.get_entry(canonical_url(url))
+
+    def store(
+        self,
+        url: str,
+        answers_analysis: AnswersAnalysis,
+        statistics: AnswersStatistics,
+    ) -> None:
+        self._entries.set(
+            canonical_url(url),
+            statistics,
+            ttl=self.ttl_for(answers_analysis),
+            stale_ttl=self.stale_ttl,
+        )
+
+    def invalidate(self, url: str) -> None:
+        self._entries.delete(canonical_url(url))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class NegativeCache:
+    """Remembers permanent content errors so they are not re-queried.
+
+    ``ttls`` maps ``ContentAccessError`` subclasses to a lifetime in
+    seconds; the closest class in an error's hierarchy decides. Errors with
+    no matching entry are not cached. Errors are kept without their
+    traceback, and every lookup returns a fresh copy to raise.
+    """
+
+    DEFAULT_TTLS: Mapping[type[ContentAccessError], float] = {
+        ContentNotFoundError: 3600.0,
+        ContentPrivateError: 600.0,
+        ContentRegionRestrictedError: 3600.0,
+    }
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttls: Mapping[type[ContentAccessError], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self._entries: LRUCache[ContentAccessError] = LRUCache(
+            maxsize=maxsize, clock=clock
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._entries.stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, error: ContentAccessError) -> float | None:
+        for error_type in type(error).__mro__:
+            ttl = self.ttls.get(error_type)
+            if ttl is not None:
+                return ttl
+        return None
+
+    def lookup(self, url: str) -> ContentAccessError | None:
+        error = self._entries.get(canonical_url(url))
+        return None if error is None else _detached(error)
+
+    def store(self, url: str, error: ContentAccessError) -> None:
+        ttl = self.ttl_for(error)
+        if ttl is not None and ttl > 0:
+            self._entries.set(canonical_url(url), _detached(error), ttl=ttl)
+
+    def invalidate(self, url: str) -> None:
+        self._entries.delete(canonical_url(url))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _detached(error: ContentAccessError) -> ContentAccessError:
+    """Copy ``error`` without its traceback, cause chain or context."""
+    return copy.copy(error)
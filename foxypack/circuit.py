@@ -0,0 +1,132 @@
+import threading
+import time
+from collections.abc import Callable
+from enum import Enum
+
+from foxypack.exceptions import (
+    ConfigurationError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding a single statistics module.
+
+    The circuit opens after ``failure_threshold`` consecutive tripping
+    errors, rejects calls for ``recovery_timeout`` seconds and then lets one
+    trial call through (half-open). A successful trial closes the circuit, a
+    failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        trip_on: tuple[type[Exception], ...] = (ServiceUnavailableError, TimeoutError),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1 or recovery_timeout <= 0:
+            raise ConfigurationError(
+                "Circuit breaker needs a positive threshold and recovery timeout",
+                details={
+                    "failure_threshold": failure_threshold,
+                    "recovery_timeout": recovery_timeout,
+                },
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.trip_on = trip_on
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if (
+                self._state is CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.recovery_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; half-open admits one trial."""
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            now = self._clock()
+            if self._state is CircuitState.OPEN:
+                if now - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+            # A trial that never reported back (cancelled, crashed) does not
+            # keep the circuit half-open forever.
+            if (
+                self._probe_started is not None
+                and now - self._probe_started < self.recovery_timeout
+            ):
+                return False
+            self._probe_started = now
+            return True
+
+    def record(self, error: BaseException | None) -> None:
+        """Report the outcome of an allowed call; ``None`` means success."""
+        with self._lock:
+            self._probe_started = None
+            if error is None or not isinstance(error, self.trip_on):
+                self._state = CircuitState.CLOSED
+                self._failures = 0
+                return
+            self._failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+
+class CircuitBreakers:
+    """Per-module circuit breakers created on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        trip_on: tuple[type[Exception], ...] = (ServiceUnavailableError, TimeoutError),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Fail on a bad configuration now rather than on the first call.
+        CircuitBreaker(failure_threshold, recovery_timeout, trip_on, clock)
+        self._factory = lambda: CircuitBreaker(
+            failure_threshold, recovery_timeout, trip_on, clock
+        )
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, module: object) -> CircuitBreaker:
+        name = type(module).__name__
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, self._factory())
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Current state of every known module, for monitoring."""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import importlib
+from array import array
+from collections import Counter
+from collections.abc import AsyncIterable, Iterable, Iterator
+from datetime import date
+from types import ModuleType
+from typing import Any
+
+from foxypack.exceptions import ConfigurationError, FoxyError, InvalidUsageError
+from foxypack.foxypack_abc.answers import (
+    AnswersAnalysis,
+    AnswersSocialContainer,
+    AnswersSocialContent,
+    AnswersStatistics,
+)
+
+
+class DictionaryColumn:
+    """Strings stored as ``int32`` codes into a table of distinct values."""
+
+    __slots__ = ("_index", "codes", "values")
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def append(self, value: str) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def code(self, value: str) -> int | None:
+        return self._index.get(value)
+
+
+class StatisticsColumns:
+    """Column-oriented store for large numbers of statistics answers.
+
+    Rows are kept in typed arrays instead of one object each: ``views``
+    and ``subscribers`` as ``int64`` (0 where they do not apply), the
+    publish or creation ``date`` as an ``int32`` ordinal (0 when unknown),
+    and ``kind`` (``"content"`` or ``"container"``), ``answer_type`` (the
+    class name), ``social_platform`` and ``type_content`` dictionary
+    encoded. ``system_id``, ``title`` and ``url`` stay as string lists.
+    Rows of answer subclasses are rebuilt as their base answer class.
+
+    Numeric columns and dictionary codes are exported without copying
+    through ``column`` (a ``memoryview``) or ``to_numpy``. As with any
+    ``array``, appending while such a view is alive raises ``BufferError``.
+    """
+
+    INT_COLUMNS = ("views", "subscribers", "date")
+    DICTIONARY_COLUMNS = ("kind", "answer_type", "social_platform", "type_content")
+    CONTENT = "content"
+    CONTAINER = "container"
+
+    def __init__(self) -> None:
+        self.views = array("q")
+        self.subscribers = array("q")
+        self.date = array("i")
+        self.kind = DictionaryColumn()
+        self.answer_type = DictionaryColumn()
+        self.social_platform = DictionaryColumn()
+        self.type_content = DictionaryColumn()
+        self.system_id: list[str] = []
+        self.title: list[str] = []
+        self.url: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.views)
+
+    def append(self, answer: AnswersStatistics) -> None:
+        if isinstance(answer, AnswersSocialContent):
+            kind, views, subscribers = self.CONTENT, answer.views, 0
+            day = answer.publish_date
+        elif isinstance(answer, AnswersSocialContainer):
+            kind, views, subscribers = self.CONTAINER, 0, answer.subscribers
+            day = answer.creation_date
+        else:
+            raise InvalidUsageError(
+                "Only social content and container answers can be stored",
+                details={"type": type(answer).__name__},
+            )
+        try:
+            counters = array("q", (views, subscribers))
+        except OverflowError as error:
+            raise InvalidUsageError(
+                "Counter does not fit in int64",
+                details={"system_id": answer.system_id},
+                cause=error,
+            ) from error
+        self.views.append(counters[0])
+        self.subscribers.append(counters[1])
+        self.date.append(day.toordinal() if day is not None else 0)
+        analysis = answer.analysis_status
+        self.kind.append(kind)
+        self.answer_type.append(type(answer).__name__)
+        self.social_platform.append(analysis.social_platform)
+        self.type_content.append(analysis.type_content)
+        self.system_id.append(answer.system_id)
+        self.title.append(answer.title)
+        self.url.append(analysis.url)
+
+    def extend(self, answers: Iterable[AnswersStatistics]) -> None:
+        for answer in answers:
+            self.append(answer)
+
+    async def fill(
+        self, results: AsyncIterable[tuple[str, AnswersStatistics | FoxyError]]
+    ) -> dict[str, FoxyError]:
+        """Append answers streamed by ``FoxyPack.iter_statistics``.
+
+        Returns the errors of the URLs that failed, keyed by URL.
+        """
+        errors: dict[str, FoxyError] = {}
+        async for url, result in results:
+            if isinstance(result, FoxyError):
+                errors[url] = result
+            else:
+                self.append(result)
+        return errors
+
+    def row(self, index: int) -> AnswersStatistics:
+        """Rebuild the answer stored at ``index``."""
+        ordinal = self.date[index]
+        day = date.fromordinal(ordinal) if ordinal else None
+        analysis = AnswersAnalysis(
+            url=self.url[index],
+            social_platform=self.social_platform[index],
+            type_content=self.type_content[index],
+        )
+        if self.kind[index] == self.CONTAINER:
+            return AnswersSocialContainer(
+                system_id=self.system_id[index],
+                title=self.title[index],
+                subscribers=self.subscribers[index],
+                creation_date=day,
+                analysis_status=analysis,
+            )
+        return AnswersSocialContent(
+            system_id=self.system_id[index],
+            title=self.title[index],
+            views=self.views[index],
+            publish_date=day,
+            analysis_status=analysis,
+        )
+
+    def __iter__(self) -> Iterator[AnswersStatistics]:
+        return (self.row(index) for index in range(len(self)))
+
+    def total(self, column: str) -> int:
+        return sum(self._ints(column))
+
+    def sum(self, column: str, by: str) -> dict[str, int]:
+        """Total of an integer ``column`` per value of a dictionary column.
+
+        Computed in one pass over the rows, with NumPy when it is installed.
+        """
+        values = self._ints(column)
+        groups = self._dictionary(by)
+        totals = _numpy_group_sums(values, groups)
+        if totals is None:
+            totals = [0] * len(groups.values)
+            for code, value in zip(groups.codes, values, strict=True):
+                totals[code] += value
+        return dict(zip(groups.values, totals, strict=True))
+
+    def count(self, by: str) -> dict[str, int]:
+        groups = self._dictionary(by)
+        counts = Counter(groups.codes)
+        return {name: counts[code] for code, name in enumerate(groups.values)}
+
+    def mean(self, column: str, by: str) -> dict[str, float]:
+        counts = self.count(by)
+        return {
+            name: total / counts[name] for name, total in self.sum(column, by).items()
+        }
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of an integer column or of dictionary codes."""
+        if name in self.DICTIONARY_COLUMNS:
+            return memoryview(self._dictionary(name).codes)
+        return memoryview(self._ints(name))
+
+    def categories(self, name: str) -> list[str]:
+        """Values of a dictionary column, indexed by code."""
+        return list(self._dictionary(name).values)
+
+    def to_numpy(self, name: str) -> Any:
+        """Zero-copy NumPy array of ``column(name)``; requires NumPy."""
+        numpy = _numpy()
+        if numpy is None:
+            raise ConfigurationError("NumPy is required for to_numpy")
+        view = self.column(name)
+        return numpy.frombuffer(view, dtype=view.format)
+
+    def _ints(self, column: str) -> array[int]:
+        if column not in self.INT_COLUMNS:
+            raise InvalidUsageError(
+                "Unknown integer column",
+                details={"column": column, "columns": list(self.INT_COLUMNS)},
+            )
+        values: array[int] = getattr(self, column)
+        return values
+
+    def _dictionary(self, column: str) -> DictionaryColumn:
+        if column not in self.DICTIONARY_COLUMNS:
+            raise InvalidUsageError(
+                "Unknown dictionary column",
+                details={"column": column, "columns": list(self.DICTIONARY_COLUMNS)},
+            )
+        values: DictionaryColumn = getattr(self, column)
+        return values
+
+
+def _numpy() -> ModuleType | None:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def _numpy_group_sums(values: array[int], groups: DictionaryColumn) -> list[int] | None:
+    """Per-code totals via ``bincount``, or ``None`` if NumPy cannot be used."""
+    numpy = _numpy()
+    if numpy is None or not values:
+        return None
+    weights = numpy.frombuffer(values, dtype=values.typecode)
+    largest = max(int(weights.max()), -int(weights.min()))
+    if largest * len(values) >= 2**53:
+        # bincount adds in float64, which is only exact below 2**53.
+        return None
+    codes = numpy.frombuffer(groups.codes, dtype=groups.codes.typecode)
+    totals = numpy.bincount(codes, weights=weights, minlength=len(groups.values))
+    return [int(total) for total in totals]
@@ -1,9 +1,54 @@
-from typing import Self
+import asyncio
+import contextvars
+import functools
+import time
+import weakref
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Self, TypeVar, cast
 
-from foxypack.exceptions import FoxyError, ConfigurationError, UnsupportedOperationError
+from foxypack.balancer import AdaptiveBalancer
+from foxypack.batching import MicroBatcher
+from foxypack.cache import LRUCache, NegativeCache, StatisticsCache
+from foxypack.circuit import CircuitBreaker, CircuitBreakers
+from foxypack.deadline import (
+    deadline,
+    expired,
+    remaining_time,
+    share,
+    within_deadline,
+)
+from foxypack.exceptions import (
+    ContentAccessError,
+    FoxyError,
+    ConfigurationError,
+    InvalidUsageError,
+    TimeoutError,
+    UnsupportedOperationError,
+)
 from foxypack.foxypack_abc.foxyanalysis import FoxyAnalysis
 from foxypack.foxypack_abc.foxystatistics import FoxyStatistics
 from foxypack.foxypack_abc.answers import AnswersAnalysis, AnswersStatistics
+from foxypack.hedging import HedgingPolicy
+from foxypack.interning import AnalysisPool
+from foxypack.metrics import FoxyMetrics
+from foxypack.ratelimit import RateLimiter
+from foxypack.retry import RetryPolicy
+from foxypack.routing import AnalysisRouter, StatisticsDispatcher, canonical_url
+from foxypack.singleflight import SingleFlight
+from foxypack.trace import (
+    AttemptRecord,
+    exhausted_error,
+    record_attempt,
+    replay,
+    tracing,
+)
+
+T = TypeVar("T")
+
+# Outcome of a coalesced fetch with its attempts and start time.
+_Recorded = tuple[AnswersStatistics | FoxyError, list[AttemptRecord], float]
 
 
 class FoxyPack:
@@ -13,53 +58,867 @@ class FoxyPack:
         self,
         queue_foxy_analysis: set[FoxyAnalysis] | None = None,
         queue_foxy_statistics: set[FoxyStatistics] | None = None,
+        analysis_cache: LRUCache[AnswersAnalysis] | None = None,
+        statistics_cache: StatisticsCache | None = None,
+        max_workers: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        coalesce: bool = False,
+        balancer: AdaptiveBalancer | None = None,
+        negative_cache: NegativeCache | None = None,
+        metrics: FoxyMetrics | None = None,
+        timeout: float | None = None,
+        batcher: MicroBatcher[AnswersAnalysis, AnswersStatistics] | None = None,
+        analysis_pool: AnalysisPool | None = None,
     ) -> None:
         self._queue_foxy_analysis = queue_foxy_analysis or set()
         self._queue_foxy_statistics = queue_foxy_statistics or set()
+        self._router: AnalysisRouter | None = None
+        self._dispatcher: StatisticsDispatcher | None = None
+        self._analysis_cache = analysis_cache
+        self._statistics_cache = statistics_cache
+        self._negative_cache = negative_cache
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        if max_workers is not None and max_workers <= 0:
+            raise ConfigurationError(
+                "max_workers must be positive", details={"max_workers": max_workers}
+            )
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._rate_limiter = rate_limiter
+        self._circuit_breakers = circuit_breakers
+        self._retry_policy = retry_policy
+        self._hedging_policy = hedging_policy
+        self._balancer = balancer
+        self._metrics = metrics
+        if timeout is not None and timeout <= 0:
+            raise ConfigurationError(
+                "timeout must be positive", details={"timeout": timeout}
+            )
+        self._timeout = timeout
+        self._batcher = batcher
+        self._analysis_pool = analysis_pool
+        # Batch-wide failures, shared by every item of the batch, with the
+        # retry decision once one item has made it.
+        self._batch_failures: weakref.WeakKeyDictionary[FoxyError, bool | None] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._single_flight: SingleFlight[AnswersStatistics] | None = (
+            SingleFlight() if coalesce else None
+        )
+        self._single_flight_async: SingleFlight[_Recorded] | None = (
+            SingleFlight() if coalesce else None
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool started for sync modules, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor | None:
+        if self._max_workers is None:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="foxypack"
+            )
+        return self._executor
+
+    async def _run_in_thread(self, func: Callable[..., T], /, *args: Any) -> T:
+        """Run a blocking call in the controller pool, or the loop default one."""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(context.run, func, *args)
+        )
 
     def with_module(
         self, foxy_analysis: FoxyAnalysis, foxy_statistics: FoxyStatistics | None = None
     ) -> Self:
         self._queue_foxy_analysis.add(foxy_analysis)
+        self._router = None
         if foxy_statistics:
             self._queue_foxy_statistics.add(foxy_statistics)
+            self._dispatcher = None
         return self
 
-    def get_analysis(self, url: str) -> AnswersAnalysis:
+    def _get_router(self) -> AnalysisRouter:
+        if self._router is None:
+            self._router = AnalysisRouter(self._queue_foxy_analysis)
+        return self._router
+
+    def get_analysis(
+        self, url: str, trace: list[AttemptRecord] | None = None
+    ) -> AnswersAnalysis:
+        """Analyze ``url``; attempts made are appended to ``trace`` if given."""
         if not self._queue_foxy_analysis:
             raise ConfigurationError()
-        for foxy_analysis in self._queue_foxy_analysis:
+        with tracing(trace):
+            return self._get_analysis(url)
+
+    def _get_analysis(self, url: str) -> AnswersAnalysis:
+        if self._analysis_cache is None:
+            return self._analyze(url)
+        key = canonical_url(url)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+        result_analysis = self._analyze(url)
+        self._analysis_cache.set(key, result_analysis)
+        return result_analysis
+
+    def _analyze(self, url: str) -> AnswersAnalysis:
+        for foxy_analysis in self._route(url):
+            if expired():
+                break
+            started = time.perf_counter()
             try:
                 result_analysis = foxy_analysis.get_analysis(url=url)
-                return result_analysis
-            except FoxyError:
+            except FoxyError as error:
+                self._observe_analysis(foxy_analysis, started, error)
+                if isinstance(error, ContentAccessError):
+                    raise
                 continue
-        raise UnsupportedOperationError()
+            self._observe_analysis(foxy_analysis, started, result_analysis)
+            return self._shared(result_analysis)
+        raise _exhausted(
+            "No analysis module could analyze the URL", {"url": url}, "analysis"
+        )
 
-    def get_statistics(self, url: str) -> AnswersStatistics:
-        answers_analysis = self.get_analysis(url)
-        if not self._queue_foxy_statistics:
+    async def get_analysis_async(
+        self, url: str, trace: list[AttemptRecord] | None = None
+    ) -> AnswersAnalysis:
+        if not self._queue_foxy_analysis:
             raise ConfigurationError()
-        for foxy_stat in self._queue_foxy_statistics:
+        with tracing(trace):
+            return await self._get_analysis_async(url)
+
+    async def _get_analysis_async(self, url: str) -> AnswersAnalysis:
+        if self._analysis_cache is None:
+            return await self._analyze_async(url)
+        key = canonical_url(url)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+        result_analysis = await self._analyze_async(url)
+        self._analysis_cache.set(key, result_analysis)
+        return result_analysis
+
+    def _shared(self, answers_analysis: AnswersAnalysis) -> AnswersAnalysis:
+        if self._analysis_pool is None:
+            return answers_analysis
+        return self._analysis_pool.intern(answers_analysis)
+
+    async def _analyze_async(self, url: str) -> AnswersAnalysis:
+        for foxy_analysis in self._route(url):
+            if expired():
+                break
+            started = time.perf_counter()
             try:
-                result_analysis = foxy_stat.get_statistics(
-                    answers_analysis=answers_analysis
-                )
-                return result_analysis
-            except FoxyError:
+                if _overrides(foxy_analysis, FoxyAnalysis, "get_analysis_async"):
+                    result_analysis = await foxy_analysis.get_analysis_async(url=url)
+                else:
+                    result_analysis = await self._run_in_thread(
+                        foxy_analysis.get_analysis, url
+                    )
+            except FoxyError as error:
+                self._observe_analysis(foxy_analysis, started, error)
+                if isinstance(error, ContentAccessError):
+                    raise
                 continue
-        raise UnsupportedOperationError()
+            self._observe_analysis(foxy_analysis, started, result_analysis)
+            return self._shared(result_analysis)
+        raise _exhausted(
+            "No analysis module could analyze the URL", {"url": url}, "analysis"
+        )
 
-    async def get_statistics_async(self, url: str) -> AnswersStatistics:
-        answers_analysis = self.get_analysis(url)
+    def _observe_analysis(
+        self,
+        foxy_analysis: FoxyAnalysis,
+        started: float,
+        outcome: AnswersAnalysis | FoxyError,
+    ) -> None:
+        duration = time.perf_counter() - started
+        error: FoxyError | None = None
+        if isinstance(outcome, FoxyError):
+            error = outcome
+            platform = getattr(error, "platform", None) or ""
+            label = type(error).__name__
+        else:
+            platform = outcome.social_platform
+            label = "ok"
+        if self._metrics is not None:
+            self._metrics.observe(
+                "analysis", type(foxy_analysis).__name__, platform, label, duration
+            )
+        record_attempt(
+            "analysis", foxy_analysis, platform, label, started, duration, error
+        )
+
+    def _route(self, url: str) -> list[FoxyAnalysis]:
+        candidates = self._get_router().route(url)
+        if not candidates:
+            raise UnsupportedOperationError(
+                "No analysis module handles the URL", details={"url": url}
+            )
+        return candidates
+
+    def get_statistics(
+        self,
+        url: str,
+        trace: list[AttemptRecord] | None = None,
+        timeout: float | None = None,
+    ) -> AnswersStatistics:
+        """Collect statistics for ``url``.
+
+        Every module call made for the lookup, including analysis and
+        retries, is appended to ``trace`` as an ``AttemptRecord`` if given.
+
+        ``timeout`` (default: the controller ``timeout``) bounds the whole
+        lookup and is split evenly across the remaining fallback modules;
+        modules can read their share with ``remaining_time()``. ``TimeoutError``
+        is raised once it runs out. Sync modules cannot be interrupted, so
+        here the deadline is enforced between attempts.
+        """
+        with tracing(trace), deadline(self._timeout_for(timeout)):
+            return self._get_statistics(url)
+
+    def _get_statistics(self, url: str) -> AnswersStatistics:
+        if self._statistics_cache is not None:
+            cached = self._statistics_cache.lookup(url)
+            if cached is not None and cached[1]:
+                return cached[0]
+        self._check_missing(url)
+        if self._single_flight is not None:
+            return self._single_flight.do(
+                canonical_url(url), lambda: self._fetch_statistics(url)
+            )
+        return self._fetch_statistics(url)
+
+    def _fetch_statistics(self, url: str) -> AnswersStatistics:
+        try:
+            answers_analysis = self.get_analysis(url)
+            result_analysis = self._collect_statistics(answers_analysis)
+        except ContentAccessError as error:
+            self._remember_missing(url, error)
+            raise
+        if self._analysis_pool is not None:
+            self._analysis_pool.share(result_analysis)
+        if self._statistics_cache is not None:
+            self._statistics_cache.store(url, answers_analysis, result_analysis)
+        return result_analysis
+
+    def _collect_statistics(
+        self, answers_analysis: AnswersAnalysis
+    ) -> AnswersStatistics:
         if not self._queue_foxy_statistics:
             raise ConfigurationError()
-        for foxy_stat in self._queue_foxy_statistics:
+        if self._retry_policy is not None:
+            self._retry_policy.budget.deposit()
+        modules = list(self._statistics_modules(answers_analysis))
+        for index, foxy_stat in enumerate(modules):
+            if expired():
+                break
+            breaker = self._breaker_for(foxy_stat)
+            if self._circuit_open(breaker, foxy_stat, answers_analysis):
+                continue
             try:
-                result_analysis = await foxy_stat.get_statistics_async(
-                    answers_analysis=answers_analysis
-                )
+                with deadline(share(len(modules) - index)):
+                    return self._call_statistics(foxy_stat, answers_analysis, breaker)
+            except ContentAccessError:
+                # Other modules cannot bring back deleted or private content.
+                raise
+            except FoxyError:
+                continue
+        raise self._statistics_exhausted(answers_analysis)
+
+    def _check_missing(self, url: str) -> None:
+        if self._negative_cache is not None:
+            error = self._negative_cache.lookup(url)
+            if error is not None:
+                raise error
+
+    def _remember_missing(self, url: str, error: ContentAccessError) -> None:
+        if self._negative_cache is not None:
+            self._negative_cache.store(url, error)
+
+    def _call_statistics(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+    ) -> AnswersStatistics:
+        attempt = 1
+        while True:
+            try:
+                return self._attempt_statistics(foxy_stat, answers_analysis, breaker)
+            except FoxyError as error:
+                delay = self._retry_delay(error, attempt, breaker)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    def _attempt_statistics(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+    ) -> AnswersStatistics:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(answers_analysis.social_platform)
+        started = time.perf_counter()
+        try:
+            result_analysis = foxy_stat.get_statistics(
+                answers_analysis=answers_analysis
+            )
+        except FoxyError as error:
+            self._finish_attempt(foxy_stat, answers_analysis, breaker, started, error)
+            raise
+        self._finish_attempt(foxy_stat, answers_analysis, breaker, started, None)
+        return result_analysis
+
+    def _finish_attempt(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+        started: float,
+        error: FoxyError | None,
+    ) -> None:
+        duration = time.perf_counter() - started
+        platform = answers_analysis.social_platform
+        outcome = "ok" if error is None else type(error).__name__
+        if breaker is not None:
+            breaker.record(error)
+        if self._metrics is not None:
+            self._metrics.observe(
+                "statistics", type(foxy_stat).__name__, platform, outcome, duration
+            )
+        if self._balancer is not None:
+            self._balancer.record(foxy_stat, platform, duration, error is None)
+        record_attempt(
+            "statistics", foxy_stat, platform, outcome, started, duration, error
+        )
+
+    def _cancel_attempt(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        started: float,
+    ) -> None:
+        """Record an attempt cancelled, e.g. after losing a hedge race.
+
+        The circuit breaker is left alone since the module did not fail, but
+        the balancer counts it as a failure after the time spent so far, so
+        a module that keeps losing moves back instead of staying in front.
+        """
+        duration = time.perf_counter() - started
+        platform = answers_analysis.social_platform
+        if self._metrics is not None:
+            self._metrics.observe(
+                "statistics", type(foxy_stat).__name__, platform, "cancelled", duration
+            )
+        if self._balancer is not None:
+            self._balancer.record(foxy_stat, platform, duration, False)
+        record_attempt(
+            "statistics", foxy_stat, platform, "cancelled", started, duration
+        )
+
+    def _statistics_modules(
+        self, answers_analysis: AnswersAnalysis
+    ) -> Iterable[FoxyStatistics]:
+        if self._dispatcher is None:
+            self._dispatcher = StatisticsDispatcher(self._queue_foxy_statistics)
+        modules = self._dispatcher.applicable(answers_analysis)
+        if not modules:
+            raise UnsupportedOperationError(
+                "No statistics module handles the content",
+                details=_content_details(answers_analysis),
+            )
+        if self._balancer is None:
+            return modules
+        return self._balancer.order(modules, answers_analysis.social_platform)
+
+    @staticmethod
+    def _statistics_exhausted(answers_analysis: AnswersAnalysis) -> FoxyError:
+        return _exhausted(
+            "No statistics module could collect the content",
+            _content_details(answers_analysis),
+            "statistics",
+        )
+
+    def _retry_delay(
+        self, error: FoxyError, attempt: int, breaker: CircuitBreaker | None
+    ) -> float | None:
+        """Backoff before retrying a failed attempt, or ``None`` to give up."""
+        if self._retry_policy is None:
+            return None
+        delay = self._retry_policy.backoff(attempt)
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            return None
+        if not self._should_retry(self._retry_policy, error, attempt):
+            return None
+        if breaker is not None and not breaker.allow():
+            return None
+        return delay
+
+    def _should_retry(
+        self, policy: RetryPolicy, error: FoxyError, attempt: int
+    ) -> bool:
+        """Retry decision; a batch-wide failure draws from the budget once."""
+        if error not in self._batch_failures:
+            return policy.should_retry(error, attempt)
+        decision = self._batch_failures[error]
+        if decision is None:
+            decision = self._batch_failures[error] = policy.should_retry(error, attempt)
+        return decision
+
+    def _circuit_open(
+        self,
+        breaker: CircuitBreaker | None,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+    ) -> bool:
+        if breaker is None or breaker.allow():
+            return False
+        platform = answers_analysis.social_platform
+        if self._metrics is not None:
+            self._metrics.observe(
+                "statistics", type(foxy_stat).__name__, platform, "circuit_open", 0.0
+            )
+        record_attempt(
+            "statistics", foxy_stat, platform, "circuit_open", time.perf_counter(), 0.0
+        )
+        return True
+
+    def _breaker_for(self, foxy_stat: FoxyStatistics) -> CircuitBreaker | None:
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.breaker_for(foxy_stat)
+
+    async def get_statistics_async(
+        self,
+        url: str,
+        trace: list[AttemptRecord] | None = None,
+        timeout: float | None = None,
+    ) -> AnswersStatistics:
+        """Async ``get_statistics``; calls running at the deadline are cancelled."""
+        with tracing(trace), deadline(self._timeout_for(timeout)):
+            return await self._get_statistics_async(url)
+
+    def _timeout_for(self, timeout: float | None) -> float | None:
+        if timeout is None:
+            return self._timeout
+        if timeout <= 0:
+            raise InvalidUsageError(
+                "timeout must be positive", details={"timeout": timeout}
+            )
+        return timeout
+
+    async def _get_statistics_async(self, url: str) -> AnswersStatistics:
+        if self._statistics_cache is not None:
+            cached = await self._cache_io(self._statistics_cache.lookup, url)
+            if cached is not None:
+                result_analysis, fresh = cached
+                if not fresh:
+                    self._schedule_refresh(url)
                 return result_analysis
+        self._check_missing(url)
+        if self._single_flight_async is not None:
+            fetch = self._fetch_coalesced_async(self._single_flight_async, url)
+        else:
+            fetch = self._fetch_statistics_async(url)
+        return await within_deadline(
+            fetch,
+            {"url": url},
+            lambda: exhausted_error(
+                "Deadline exceeded", {"url": url}, None, TimeoutError
+            ),
+        )
+
+    async def _fetch_coalesced_async(
+        self, single_flight: SingleFlight[_Recorded], url: str
+    ) -> AnswersStatistics:
+        """Share one fetch between concurrent callers of the same URL.
+
+        The shared fetch runs outside every caller's deadline and trace;
+        each caller bounds its wait by its own deadline and gets the
+        attempts of the shared fetch added to its own trace.
+        """
+        outcome, records, started = await single_flight.do_async(
+            canonical_url(url), lambda: self._fetch_recorded_async(url)
+        )
+        replay(records, started)
+        if isinstance(outcome, FoxyError):
+            raise outcome
+        return outcome
+
+    async def _fetch_recorded_async(self, url: str) -> _Recorded:
+        records: list[AttemptRecord] = []
+        started = time.perf_counter()
+        outcome: AnswersStatistics | FoxyError
+        with tracing(records):
+            try:
+                outcome = await self._fetch_statistics_async(url)
+            except FoxyError as error:
+                outcome = error
+        return outcome, records, started
+
+    async def _fetch_statistics_async(self, url: str) -> AnswersStatistics:
+        try:
+            answers_analysis = await self.get_analysis_async(url)
+            if not self._queue_foxy_statistics:
+                raise ConfigurationError()
+            if self._retry_policy is not None:
+                self._retry_policy.budget.deposit()
+            if self._hedging_policy is not None:
+                result_analysis = await self._hedge_statistics_async(
+                    self._hedging_policy, answers_analysis
+                )
+            else:
+                result_analysis = await self._collect_statistics_async(answers_analysis)
+        except ContentAccessError as error:
+            self._remember_missing(url, error)
+            raise
+        if self._analysis_pool is not None:
+            self._analysis_pool.share(result_analysis)
+        if self._statistics_cache is not None:
+            await self._cache_io(
+                self._statistics_cache.store, url, answers_analysis, result_analysis
+            )
+        return result_analysis
+
+    async def _cache_io(self, func: Callable[..., T], /, *args: Any) -> T:
+        """Call a statistics cache method without blocking the event loop.
+
+        Caches whose backend does I/O, such as ``SQLiteCache``, are called
+        in a worker thread; in-memory ones are called directly.
+        """
+        if self._statistics_cache is not None and self._statistics_cache.blocking:
+            return await self._run_in_thread(func, *args)
+        return func(*args)
+
+    async def _collect_statistics_async(
+        self, answers_analysis: AnswersAnalysis
+    ) -> AnswersStatistics:
+        modules = list(self._statistics_modules(answers_analysis))
+        for index, foxy_stat in enumerate(modules):
+            if expired():
+                break
+            breaker = self._breaker_for(foxy_stat)
+            if self._circuit_open(breaker, foxy_stat, answers_analysis):
+                continue
+            try:
+                with deadline(share(len(modules) - index)):
+                    return await self._call_statistics_async(
+                        foxy_stat, answers_analysis, breaker
+                    )
+            except ContentAccessError:
+                raise
             except FoxyError:
                 continue
-        raise UnsupportedOperationError()
+        raise self._statistics_exhausted(answers_analysis)
+
+    async def _hedge_statistics_async(
+        self, policy: HedgingPolicy, answers_analysis: AnswersAnalysis
+    ) -> AnswersStatistics:
+        """Race statistics modules, starting a backup when one is slow.
+
+        A module is started when the previous one fails or has not answered
+        within the hedging delay; the first answer wins and the other calls
+        are cancelled.
+        """
+        modules = iter(self._statistics_modules(answers_analysis))
+        running: dict[asyncio.Future[AnswersStatistics], FoxyStatistics] = {}
+        hedges = 0
+
+        def start_next() -> FoxyStatistics | None:
+            for foxy_stat in modules:
+                breaker = self._breaker_for(foxy_stat)
+                if self._circuit_open(breaker, foxy_stat, answers_analysis):
+                    continue
+                task = asyncio.ensure_future(
+                    self._timed_statistics_async(
+                        policy, foxy_stat, answers_analysis, breaker
+                    )
+                )
+                running[task] = foxy_stat
+                return foxy_stat
+            return None
+
+        latest = start_next()
+        try:
+            while running:
+                timeout = None
+                if latest is not None and hedges < policy.max_hedges:
+                    timeout = policy.hedge_delay(latest)
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    latest = start_next()
+                    hedges += 1
+                    continue
+                for task in done:
+                    del running[task]
+                    try:
+                        return task.result()
+                    except ContentAccessError:
+                        raise
+                    except FoxyError:
+                        pass
+                if not running:
+                    latest = start_next()
+            raise self._statistics_exhausted(answers_analysis)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                # Let the losers record their cancelled attempts first.
+                await asyncio.wait(running)
+
+    async def _timed_statistics_async(
+        self,
+        policy: HedgingPolicy,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+    ) -> AnswersStatistics:
+        started = time.perf_counter()
+        result_analysis = await self._call_statistics_async(
+            foxy_stat, answers_analysis, breaker
+        )
+        policy.record(foxy_stat, time.perf_counter() - started)
+        return result_analysis
+
+    async def _call_statistics_async(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+    ) -> AnswersStatistics:
+        attempt = 1
+        while True:
+            try:
+                return await self._attempt_statistics_async(
+                    foxy_stat, answers_analysis, breaker
+                )
+            except FoxyError as error:
+                delay = self._retry_delay(error, attempt, breaker)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt_statistics_async(
+        self,
+        foxy_stat: FoxyStatistics,
+        answers_analysis: AnswersAnalysis,
+        breaker: CircuitBreaker | None,
+    ) -> AnswersStatistics:
+        batched = self._batcher is not None and _batches(foxy_stat)
+        if self._rate_limiter is not None and not batched:
+            await self._rate_limiter.acquire_async(answers_analysis.social_platform)
+        started = time.perf_counter()
+        if self._batcher is not None and batched:
+            call = self._batcher.submit(
+                (type(foxy_stat).__name__, answers_analysis.social_platform),
+                answers_analysis,
+                functools.partial(self._flush_batch, foxy_stat),
+                foxy_stat.max_batch_size,
+            )
+        elif self._max_workers is not None and not foxy_stat.native_async:
+            call = self._run_in_thread(foxy_stat.get_statistics, answers_analysis)
+        else:
+            call = foxy_stat.get_statistics_async(answers_analysis=answers_analysis)
+        try:
+            result_analysis = await within_deadline(
+                call, {"module": type(foxy_stat).__name__}
+            )
+        except FoxyError as error:
+            if error in self._batch_failures:
+                # Already counted once for the whole batch in _flush_batch.
+                breaker = None
+            self._finish_attempt(foxy_stat, answers_analysis, breaker, started, error)
+            raise
+        except asyncio.CancelledError:
+            self._cancel_attempt(foxy_stat, answers_analysis, started)
+            raise
+        self._finish_attempt(foxy_stat, answers_analysis, breaker, started, None)
+        return result_analysis
+
+    async def _flush_batch(
+        self, foxy_stat: FoxyStatistics, batch: list[AnswersAnalysis]
+    ) -> list[AnswersStatistics | FoxyError]:
+        """One batch call for items grouped by module and social platform."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(batch[0].social_platform)
+        try:
+            if _overrides(foxy_stat, FoxyStatistics, "get_statistics_batch_async"):
+                return await foxy_stat.get_statistics_batch_async(batch)
+            return await self._run_in_thread(foxy_stat.get_statistics_batch, batch)
+        except FoxyError as error:
+            # Every item gets this error; the breaker and the retry budget
+            # count it once instead of once per item.
+            self._batch_failures[error] = None
+            breaker = self._breaker_for(foxy_stat)
+            if breaker is not None:
+                breaker.record(error)
+            raise
+
+    async def get_statistics_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 32,
+        timeout: float | None = None,
+    ) -> list[AnswersStatistics | FoxyError]:
+        """Collect statistics for many URLs, at most ``concurrency`` at a time.
+
+        Results are returned in input order; a URL that fails is represented
+        by its ``FoxyError`` instead of failing the whole batch. ``timeout``
+        applies to each URL.
+        """
+        if concurrency <= 0:
+            raise InvalidUsageError(
+                "concurrency must be positive", details={"concurrency": concurrency}
+            )
+        url_list = list(urls)
+        results: list[AnswersStatistics | FoxyError | None] = [None] * len(url_list)
+        pending = iter(enumerate(url_list))
+
+        async def worker() -> None:
+            for index, url in pending:
+                results[index] = await self._get_statistics_or_error(url, timeout)
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(concurrency, len(url_list))))
+        )
+        return cast(list[AnswersStatistics | FoxyError], results)
+
+    async def iter_statistics(
+        self,
+        urls: Iterable[str] | AsyncIterable[str],
+        concurrency: int = 32,
+        timeout: float | None = None,
+    ) -> AsyncIterator[tuple[str, AnswersStatistics | FoxyError]]:
+        """Yield ``(url, statistics or FoxyError)`` pairs as lookups finish.
+
+        The source is consumed lazily and never more than ``concurrency``
+        lookups are in flight, so memory stays flat for unbounded sources
+        such as queues. Closing the generator cancels pending lookups.
+        ``timeout`` applies to each URL.
+        """
+        if concurrency <= 0:
+            raise InvalidUsageError(
+                "concurrency must be positive", details={"concurrency": concurrency}
+            )
+        source = (
+            aiter(urls) if isinstance(urls, AsyncIterable) else _as_async_iter(urls)
+        )
+        in_flight: dict[asyncio.Future[AnswersStatistics | FoxyError], str] = {}
+        next_url: asyncio.Future[str | None] | None = None
+        exhausted = False
+        try:
+            while True:
+                if next_url is None and not exhausted and len(in_flight) < concurrency:
+                    next_url = asyncio.ensure_future(anext(source, None))
+                waiting: set[asyncio.Future[Any]] = set(in_flight)
+                if next_url is not None:
+                    waiting.add(next_url)
+                if not waiting:
+                    return
+                done, _ = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_url is not None and next_url in done:
+                    url = next_url.result()
+                    next_url = None
+                    if url is None:
+                        exhausted = True
+                    else:
+                        task = asyncio.ensure_future(
+                            self._get_statistics_or_error(url, timeout)
+                        )
+                        in_flight[task] = url
+                for finished in done:
+                    url = in_flight.pop(finished, None)
+                    if url is not None:
+                        yield url, finished.result()
+        finally:
+            for pending in in_flight:
+                pending.cancel()
+            if next_url is not None:
+                next_url.cancel()
+
+    async def _get_statistics_or_error(
+        self, url: str, timeout: float | None
+    ) -> AnswersStatistics | FoxyError:
+        try:
+            return await self.get_statistics_async(url, timeout=timeout)
+        except FoxyError as error:
+            return error
+
+    def _schedule_refresh(self, url: str) -> None:
+        key = canonical_url(url)
+        if key in self._refreshing:
+            return
+        # The refresh outlives the request that found the stale entry, so it
+        # runs in a fresh context: no caller deadline and no caller trace.
+        task = asyncio.create_task(self._refresh(url), context=contextvars.Context())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, url: str) -> None:
+        try:
+            with deadline(self._timeout):
+                await within_deadline(self._fetch_statistics_async(url), {"url": url})
+        except FoxyError:
+            # Keep serving the stale answer until it ages out of the cache.
+            pass
+
+
+def _exhausted(message: str, details: dict[str, Any], stage: str) -> FoxyError:
+    if expired():
+        return exhausted_error("Deadline exceeded", details, stage, TimeoutError)
+    return exhausted_error(message, details, stage)
+
+
+def _content_details(answers_analysis: AnswersAnalysis) -> dict[str, Any]:
+    return {
+        "url": answers_analysis.url,
+        "social_platform": answers_analysis.social_platform,
+        "type_content": answers_analysis.type_content,
+    }
+
+
+def _batches(foxy_stat: FoxyStatistics) -> bool:
+    """Whether ``foxy_stat`` implements a real batch call."""
+    return _overrides(
+        foxy_stat, FoxyStatistics, "get_statistics_batch_async"
+    ) or _overrides(foxy_stat, FoxyStatistics, "get_statistics_batch")
+
+
+def _overrides(module: object, base: type, name: str) -> bool:
+    """Whether ``module`` replaces the default ``base.name`` implementation."""
+    return getattr(type(module), name) is not getattr(base, name)
+
+
+async def _as_async_iter(urls: Iterable[str]) -> AsyncIterator[str]:
+    for url in urls:
+        yield url
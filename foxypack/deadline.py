@@ -0,0 +1,85 @@
+import asyncio
+import builtins
+import contextlib
+import contextvars
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any, TypeVar
+
+from foxypack.exceptions import FoxyError, TimeoutError
+
+T = TypeVar("T")
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "foxypack_deadline", default=None
+)
+
+
+def remaining_time() -> float | None:
+    """Seconds left for the current lookup, or ``None`` if it has no deadline.
+
+    Modules can pass this to their HTTP client so a call does not outlive
+    the budget the controller gave it.
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
+
+
+def expired() -> bool:
+    remaining = remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+@contextlib.contextmanager
+def deadline(timeout: float | None) -> Iterator[None]:
+    """Limit the enclosed calls to ``timeout`` seconds.
+
+    An enclosing deadline that ends earlier still applies.
+    """
+    if timeout is None:
+        yield
+        return
+    ends = time.monotonic() + timeout
+    current = _deadline.get()
+    token = _deadline.set(ends if current is None else min(current, ends))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def share(parts: int) -> float | None:
+    """Even share of the remaining time for one of ``parts`` attempts."""
+    remaining = remaining_time()
+    if remaining is None:
+        return None
+    return max(remaining, 0.0) / max(parts, 1)
+
+
+async def within_deadline(
+    awaitable: Awaitable[T],
+    details: dict[str, Any],
+    timeout_error: Callable[[], FoxyError] | None = None,
+) -> T:
+    """Await ``awaitable``, cancelling it with ``TimeoutError`` at the deadline.
+
+    ``timeout_error`` builds the error to raise instead, once the awaitable
+    has been cancelled. Timeouts raised by the awaitable itself, such as
+    those of an HTTP client, propagate unchanged.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return await awaitable
+    scope = asyncio.timeout(remaining)
+    try:
+        async with scope:
+            return await awaitable
+    except builtins.TimeoutError as error:
+        if not scope.expired():
+            raise
+        if timeout_error is not None:
+            # Keeps the cause set by the factory, if any.
+            raise timeout_error()
+        raise TimeoutError("Deadline exceeded", details=details) from error
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import date
 
@@ -19,6 +20,13 @@ class AnswersAnalysis(AnswersBase):
     social_platform: str
     type_content: str
 
+    def __post_init__(self) -> None:
+        # Few distinct values shared by millions of answers: keep one copy.
+        if type(self.social_platform) is str:
+            self.social_platform = sys.intern(self.social_platform)
+        if type(self.type_content) is str:
+            self.type_content = sys.intern(self.type_content)
+
 
 @dataclass(slots=True, kw_only=True)
 class AnswersStatistics(AnswersBase):
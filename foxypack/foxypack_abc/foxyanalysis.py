@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from foxypack.foxypack_abc.answers import AnswersAnalysis
 
@@ -7,9 +7,29 @@ from foxypack.foxypack_abc.answers import AnswersAnalysis
 class FoxyAnalysis(ABC):
     """Abstract class for analysis media content statistics"""
 
+    # Hosts served by the module, e.g. ("youtube.com", "youtu.be").
+    # Subdomains match their parent host ("m.youtube.com" -> "youtube.com").
+    supported_hosts: ClassVar[tuple[str, ...]] = ()
+
+    # Regular expressions matched against the start of the full URL,
+    # used when a host alone is not enough to pick the module.
+    supported_url_patterns: ClassVar[tuple[str, ...]] = ()
+
+    def supports(self, url: str) -> bool:
+        """Cheap pre-check; return False to be skipped without raising."""
+        return True
+
     @abstractmethod
     def get_analysis(self, url: str) -> AnswersAnalysis: ...
 
+    async def get_analysis_async(self, url: str) -> AnswersAnalysis:
+        """Native async analysis for modules that do I/O (short links, oEmbed).
+
+        Optional: the controller runs modules that do not override it in a
+        worker thread so that ``get_analysis`` never blocks the event loop.
+        """
+        return self.get_analysis(url)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, FoxyAnalysis):
             return False
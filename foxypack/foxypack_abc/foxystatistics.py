@@ -1,6 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, ClassVar
 
+from foxypack.exceptions import FoxyError
 from foxypack.foxypack_abc.answers import (
     AnswersAnalysis,
     AnswersStatistics,
@@ -10,6 +13,22 @@ from foxypack.foxypack_abc.answers import (
 class FoxyStatistics(ABC):
     """Abstract class for collecting media content statistics"""
 
+    # Set to False when get_statistics_async only wraps get_statistics; a
+    # controller with a thread pool then runs get_statistics in the pool.
+    native_async: ClassVar[bool] = True
+
+    # AnswersAnalysis.social_platform / type_content values the module can
+    # answer; empty means any. The controller never offers it anything else.
+    supported_platforms: ClassVar[tuple[str, ...]] = ()
+    supported_content_types: ClassVar[tuple[str, ...]] = ()
+
+    # Most items the upstream API accepts in one get_statistics_batch call.
+    max_batch_size: ClassVar[int] = 50
+
+    def supports(self, answers_analysis: AnswersAnalysis) -> bool:
+        """Cheap pre-check; return False to be skipped without raising."""
+        return True
+
     @abstractmethod
     def get_statistics(
         self, answers_analysis: AnswersAnalysis
@@ -20,6 +39,36 @@ class FoxyStatistics(ABC):
         self, answers_analysis: AnswersAnalysis
     ) -> AnswersStatistics: ...
 
+    def get_statistics_batch(
+        self, answers_analysis: Sequence[AnswersAnalysis]
+    ) -> list[AnswersStatistics | FoxyError]:
+        """Statistics for several items, ideally in one upstream request.
+
+        Optional: results are in input order and an item that failed is
+        represented by its ``FoxyError``. The default calls
+        ``get_statistics`` for each item.
+        """
+        results: list[AnswersStatistics | FoxyError] = []
+        for item in answers_analysis:
+            try:
+                results.append(self.get_statistics(item))
+            except FoxyError as error:
+                results.append(error)
+        return results
+
+    async def get_statistics_batch_async(
+        self, answers_analysis: Sequence[AnswersAnalysis]
+    ) -> list[AnswersStatistics | FoxyError]:
+        """Async ``get_statistics_batch``; defaults to concurrent single calls."""
+
+        async def one(item: AnswersAnalysis) -> AnswersStatistics | FoxyError:
+            try:
+                return await self.get_statistics_async(item)
+            except FoxyError as error:
+                return error
+
+        return list(await asyncio.gather(*(one(item) for item in answers_analysis)))
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, FoxyStatistics):
             return False
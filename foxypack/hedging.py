@@ -0,0 +1,62 @@
+import threading
+from collections import deque
+
+from foxypack.exceptions import ConfigurationError
+
+
+class HedgingPolicy:
+    """When to start a backup statistics module in the async path.
+
+    If the running module has not answered after ``delay`` seconds another
+    module is started in parallel, up to ``max_hedges`` extra modules per
+    call. With ``percentile`` set, the delay becomes that percentile of the
+    module's recent successful latencies once ``min_samples`` are known.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.1,
+        percentile: float | None = None,
+        max_hedges: int = 1,
+        window: int = 256,
+        min_samples: int = 20,
+    ) -> None:
+        if delay < 0 or max_hedges < 1 or window < 1:
+            raise ConfigurationError(
+                "Invalid hedging policy",
+                details={"delay": delay, "max_hedges": max_hedges, "window": window},
+            )
+        if percentile is not None and not 0 < percentile < 100:
+            raise ConfigurationError(
+                "Hedging percentile must be between 0 and 100",
+                details={"percentile": percentile},
+            )
+        self.delay = delay
+        self.percentile = percentile
+        self.max_hedges = max_hedges
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, module: object, latency: float) -> None:
+        """Remember the latency of a successful call to ``module``."""
+        if self.percentile is None:
+            return
+        name = type(module).__name__
+        with self._lock:
+            samples = self._latencies.get(name)
+            if samples is None:
+                samples = self._latencies[name] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def hedge_delay(self, module: object) -> float:
+        """Seconds to wait for ``module`` before starting a backup."""
+        if self.percentile is None:
+            return self.delay
+        with self._lock:
+            samples = sorted(self._latencies.get(type(module).__name__, ()))
+        if len(samples) < self.min_samples:
+            return self.delay
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return samples[index]
@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict
+
+from foxypack.exceptions import ConfigurationError
+from foxypack.foxypack_abc.answers import (
+    AnswersAnalysis,
+    AnswersSocialContainer,
+    AnswersSocialContent,
+    AnswersStatistics,
+)
+
+
+class AnalysisPool:
+    """Hands out one shared ``AnswersAnalysis`` per distinct analysis.
+
+    A controller with a pool returns the pooled instance for every lookup
+    of the same URL, and points ``analysis_status`` of statistics answers
+    at it, so repeated re-counts of a URL set share their analysis objects.
+    Pooled instances are shared and must be treated as read-only. At most
+    ``maxsize`` analyses are kept, least recently used first out. Only plain
+    ``AnswersAnalysis`` instances are pooled; subclasses carry fields the
+    key does not cover and are returned as they are.
+    """
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        if maxsize <= 0:
+            raise ConfigurationError(
+                "Pool maxsize must be positive", details={"maxsize": maxsize}
+            )
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str, str], AnswersAnalysis] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def intern(self, answers_analysis: AnswersAnalysis) -> AnswersAnalysis:
+        if type(answers_analysis) is not AnswersAnalysis:
+            return answers_analysis
+        key = (
+            answers_analysis.url,
+            answers_analysis.social_platform,
+            answers_analysis.type_content,
+        )
+        with self._lock:
+            shared = self._entries.get(key)
+            if shared is not None:
+                self._entries.move_to_end(key)
+                return shared
+            self._entries[key] = answers_analysis
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return answers_analysis
+
+    def share(self, statistics: AnswersStatistics) -> AnswersStatistics:
+        """Point ``statistics.analysis_status`` at the pooled analysis."""
+        if not isinstance(statistics, (AnswersSocialContent, AnswersSocialContainer)):
+            return statistics
+        analysis = statistics.analysis_status
+        shared = self.intern(analysis)
+        if shared is not analysis:
+            statistics.analysis_status = shared
+        return statistics
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
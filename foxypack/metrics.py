@@ -0,0 +1,96 @@
+import bisect
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class FoxyMetrics:
+    """Instrumentation interface used by ``FoxyPack``; records nothing.
+
+    ``stage`` is ``"analysis"`` or ``"statistics"``, ``module`` the module
+    class name and ``outcome`` either ``"ok"``, ``"circuit_open"``,
+    ``"cancelled"`` for a hedged call that lost the race, or the error type
+    name as reported by ``FoxyError.to_dict``.
+    """
+
+    def observe(
+        self,
+        stage: str,
+        module: str,
+        platform: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        pass
+
+
+@dataclass(slots=True)
+class MetricSeries:
+    """Call count, outcomes and latency histogram of one labelled series."""
+
+    buckets: Sequence[float]
+    bucket_counts: list[int]
+    outcomes: dict[str, int] = field(default_factory=dict)
+    count: int = 0
+    total: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        cumulative = 0
+        histogram: dict[str, int] = {}
+        for bound, bucket_count in zip(
+            [*self.buckets, float("inf")], self.bucket_counts, strict=True
+        ):
+            cumulative += bucket_count
+            histogram[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "outcomes": dict(self.outcomes),
+            "buckets": histogram,
+        }
+
+
+class InMemoryMetrics(FoxyMetrics):
+    """Thread-safe in-process aggregator that can be scraped with ``snapshot``."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, str, str], MetricSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        stage: str,
+        module: str,
+        platform: str,
+        outcome: str,
+        duration: float,
+    ) -> None:
+        key = (stage, module, platform)
+        index = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = MetricSeries(
+                    buckets=self.buckets, bucket_counts=[0] * (len(self.buckets) + 1)
+                )
+            series.count += 1
+            series.total += duration
+            series.bucket_counts[index] += 1
+            series.outcomes[outcome] = series.outcomes.get(outcome, 0) + 1
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Cumulative histograms and outcome counters per label set."""
+        with self._lock:
+            return [
+                {"stage": stage, "module": module, "platform": platform}
+                | series.to_dict()
+                for (stage, module, platform), series in self._series.items()
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
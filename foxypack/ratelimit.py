@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from foxypack.deadline import remaining_time
+from foxypack.exceptions import ConfigurationError, TimeoutError
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """Request budget: ``rate`` requests per second with ``burst`` capacity."""
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.burst < 1:
+            raise ConfigurationError(
+                "Rate limit needs a positive rate and burst",
+                details={"rate": self.rate, "burst": self.burst},
+            )
+
+
+class TokenBucket:
+    """Token bucket shared by sync and async callers.
+
+    Every caller reserves a token up front and then sleeps until the
+    reservation matures, so waiters are served in arrival order without
+    polling. A cancelled waiter gives its token back, and a wait that would
+    overrun the caller's deadline fails with ``TimeoutError`` right away
+    without taking a token.
+    """
+
+    def __init__(
+        self, limit: RateLimit, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """Take one token and return the seconds to wait before using it.
+
+        Returns ``None`` without taking a token if the wait would be longer
+        than ``max_wait``.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.limit.rate,
+            )
+            self._updated = now
+            delay = max(1 - self._tokens, 0.0) / self.limit.rate
+            if max_wait is not None and delay > max_wait:
+                return None
+            self._tokens -= 1
+            return delay
+
+    def release(self) -> None:
+        """Give back a token whose reservation was abandoned."""
+        with self._lock:
+            self._tokens = min(float(self.limit.burst), self._tokens + 1)
+
+    def acquire(self) -> None:
+        delay = self._reserve_within_deadline()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve_within_deadline()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+
+    def _reserve_within_deadline(self) -> float:
+        remaining = remaining_time()
+        delay = self.reserve(remaining)
+        if delay is None:
+            raise TimeoutError(
+                "Rate limit wait exceeds the deadline",
+                details={"rate": self.limit.rate, "remaining": remaining},
+            )
+        return delay
+
+
+class RateLimiter:
+    """Token buckets keyed by ``AnswersAnalysis.social_platform``.
+
+    Platforms missing from ``limits`` use ``default`` (one bucket per
+    platform) or are not limited when no default is given.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit] | None = None,
+        default: RateLimit | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._default = default
+        self._clock = clock
+        self._buckets = {
+            platform: TokenBucket(limit, clock)
+            for platform, limit in (limits or {}).items()
+        }
+        self._lock = threading.Lock()
+
+    def bucket_for(self, platform: str) -> TokenBucket | None:
+        bucket = self._buckets.get(platform)
+        if bucket is not None or self._default is None:
+            return bucket
+        with self._lock:
+            return self._buckets.setdefault(
+                platform, TokenBucket(self._default, self._clock)
+            )
+
+    def acquire(self, platform: str) -> None:
+        bucket = self.bucket_for(platform)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, platform: str) -> None:
+        bucket = self.bucket_for(platform)
+        if bucket is not None:
+            await bucket.acquire_async()
@@ -0,0 +1,89 @@
+import random
+import threading
+
+from foxypack.exceptions import (
+    ConfigurationError,
+    ServiceUnavailableError,
+    TimeoutError,
+)
+
+
+class RetryBudget:
+    """Limits retries to a share of the requests made through a controller.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, up to
+    ``max_tokens`` saved. During an outage retries therefore add at most
+    ``ratio`` extra load instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        if ratio < 0 or max_tokens < 0:
+            raise ConfigurationError(
+                "Retry budget values must not be negative",
+                details={"ratio": ratio, "max_tokens": max_tokens},
+            )
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """Retries transient collection errors with capped exponential backoff.
+
+    Only errors in ``retry_on`` are retried; permanent errors such as
+    ``ContentNotFoundError`` fail immediately. Delays use full jitter: a
+    random value between zero and ``base_delay * 2 ** retry`` capped at
+    ``max_delay``.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        retry_on: tuple[type[Exception], ...] = (ServiceUnavailableError, TimeoutError),
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        if max_attempts < 1 or base_delay < 0 or max_delay < 0:
+            raise ConfigurationError(
+                "Invalid retry policy",
+                details={
+                    "max_attempts": max_attempts,
+                    "base_delay": base_delay,
+                    "max_delay": max_delay,
+                },
+            )
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.budget = budget if budget is not None else RetryBudget()
+        self._rng = rng or random.Random()
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Whether to retry after ``attempt`` (1-based) failed with ``error``."""
+        if attempt >= self.max_attempts or not isinstance(error, self.retry_on):
+            return False
+        return self.budget.withdraw()
+
+    def backoff(self, attempt: int) -> float:
+        """Delay in seconds before the retry following ``attempt``."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return self._rng.uniform(0, ceiling)
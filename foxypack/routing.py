@@ -0,0 +1,233 @@
+import re
+from collections.abc import Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from foxypack.exceptions import ConfigurationError
+from foxypack.foxypack_abc.answers import AnswersAnalysis
+from foxypack.foxypack_abc.foxyanalysis import FoxyAnalysis
+from foxypack.foxypack_abc.foxystatistics import FoxyStatistics
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase a host and drop the port and the leading "www." label."""
+    host = host.strip().lower().rstrip(".")
+    if ":" in host:
+        host = host.split(":", 1)[0]
+    return host.removeprefix("www.")
+
+
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "ref_src",
+        "si",
+    }
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonical_url(url: str) -> str:
+    """Canonical form of a URL used as a cache key.
+
+    Scheme and host are lowercased, default ports, fragments, tracking
+    parameters (``utm_*`` and ``TRACKING_PARAMS``) and trailing slashes are
+    dropped, and the remaining query parameters are sorted.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url.strip()
+    scheme = parts.scheme.lower()
+    host = normalize_host(parts.hostname or "")
+    if port is not None and _DEFAULT_PORTS.get(scheme) != port:
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    query = ""
+    if parts.query:
+        params = [
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not name.startswith("utm_") and name not in TRACKING_PARAMS
+        ]
+        params.sort()
+        query = urlencode(params)
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class AnalysisRouter:
+    """Lookup table that maps a URL to the analysis modules declaring it.
+
+    Modules are indexed by ``supported_hosts`` and ``supported_url_patterns``.
+    Modules that declare neither are kept as unrouted and offered every URL
+    after the routed candidates, as before routing existed. Candidates whose
+    ``supports`` override rejects the URL are dropped.
+
+    URL patterns are combined into one regular expression when none of them
+    has groups of its own; otherwise they are matched one by one, in order.
+    """
+
+    def __init__(self, modules: Iterable[FoxyAnalysis]) -> None:
+        self._by_host: dict[str, list[FoxyAnalysis]] = {}
+        self._by_group: dict[str, FoxyAnalysis] = {}
+        self._checked: frozenset[FoxyAnalysis] = frozenset()
+        unrouted: list[FoxyAnalysis] = []
+        patterns: list[tuple[re.Pattern[str], FoxyAnalysis]] = []
+        checked: list[FoxyAnalysis] = []
+
+        for module in modules:
+            if type(module).supports is not FoxyAnalysis.supports:
+                checked.append(module)
+            if not module.supported_hosts and not module.supported_url_patterns:
+                unrouted.append(module)
+                continue
+            for host in module.supported_hosts:
+                routed = self._by_host.setdefault(normalize_host(host), [])
+                if module not in routed:
+                    routed.append(module)
+            for pattern in module.supported_url_patterns:
+                try:
+                    patterns.append((re.compile(pattern), module))
+                except re.error as error:
+                    raise ConfigurationError(
+                        "Invalid supported URL pattern",
+                        details={
+                            "module": type(module).__name__,
+                            "pattern": pattern,
+                        },
+                        cause=error,
+                    ) from error
+
+        self._unrouted = tuple(unrouted)
+        self._checked = frozenset(checked)
+        self._patterns = tuple(patterns)
+        self._matcher = self._combine(patterns)
+
+    def _combine(
+        self, patterns: list[tuple[re.Pattern[str], FoxyAnalysis]]
+    ) -> re.Pattern[str] | None:
+        # Group names and backreferences would clash or shift once joined.
+        if not patterns or any(compiled.groups for compiled, _ in patterns):
+            return None
+        alternatives = []
+        for index, (compiled, module) in enumerate(patterns):
+            group = f"_route{index}"
+            alternatives.append(f"(?P<{group}>{compiled.pattern})")
+            self._by_group[group] = module
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            # For example inline global flags, only allowed at the start.
+            self._by_group.clear()
+            return None
+
+    @property
+    def unrouted(self) -> tuple[FoxyAnalysis, ...]:
+        return self._unrouted
+
+    def _match(self, url: str) -> FoxyAnalysis | None:
+        """Module of the first pattern matching ``url``."""
+        if self._matcher is not None:
+            match = self._matcher.match(url)
+            if match is None or match.lastgroup is None:
+                return None
+            return self._by_group[match.lastgroup]
+        for compiled, module in self._patterns:
+            if compiled.match(url):
+                return module
+        return None
+
+    def route(self, url: str) -> list[FoxyAnalysis]:
+        """Return the candidate modules for ``url`` in the order to try them."""
+        candidates: list[FoxyAnalysis] = []
+
+        if self._by_host:
+            try:
+                host = urlsplit(url).hostname
+            except ValueError:
+                host = None
+            if host:
+                host = normalize_host(host)
+                while True:
+                    routed = self._by_host.get(host)
+                    if routed:
+                        candidates.extend(routed)
+                        break
+                    _, dot, host = host.partition(".")
+                    if not dot:
+                        break
+
+        matched = self._match(url)
+        if matched is not None and matched not in candidates:
+            candidates.append(matched)
+
+        candidates.extend(self._unrouted)
+        if self._checked:
+            candidates = [
+                module
+                for module in candidates
+                if module not in self._checked or module.supports(url)
+            ]
+        return candidates
+
+
+class StatisticsDispatcher:
+    """Dispatch table from ``(social_platform, type_content)`` to modules.
+
+    Built from ``supported_platforms`` and ``supported_content_types``;
+    each combination is resolved once and then served from the table.
+    ``supports`` is only called for modules that override it.
+    """
+
+    def __init__(self, modules: Iterable[FoxyStatistics]) -> None:
+        self._modules = tuple(
+            (
+                module,
+                frozenset(module.supported_platforms),
+                frozenset(module.supported_content_types),
+            )
+            for module in modules
+        )
+        self._checked = frozenset(
+            module
+            for module, _, _ in self._modules
+            if type(module).supports is not FoxyStatistics.supports
+        )
+        self._table: dict[tuple[str, str], tuple[FoxyStatistics, ...]] = {}
+
+    def applicable(
+        self, answers_analysis: AnswersAnalysis
+    ) -> tuple[FoxyStatistics, ...]:
+        """Eligible modules whose ``supports`` check accepts the analysis."""
+        eligible = self.modules_for(
+            answers_analysis.social_platform, answers_analysis.type_content
+        )
+        if not self._checked:
+            return eligible
+        return tuple(
+            module
+            for module in eligible
+            if module not in self._checked or module.supports(answers_analysis)
+        )
+
+    def modules_for(
+        self, social_platform: str, type_content: str
+    ) -> tuple[FoxyStatistics, ...]:
+        key = (social_platform, type_content)
+        eligible = self._table.get(key)
+        if eligible is None:
+            eligible = self._table[key] = tuple(
+                module
+                for module, platforms, content_types in self._modules
+                if (not platforms or social_platform in platforms)
+                and (not content_types or type_content in content_types)
+            )
+        return eligible
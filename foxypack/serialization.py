@@ -0,0 +1,432 @@
+"""Encoders and decoders for answer models.
+
+Every answer class gets its own encode and decode functions, generated
+from its fields on first use, for three formats:
+
+* plain dicts (``to_dict``/``from_dict``) with ISO dates, ready for JSON;
+* JSON Lines streams (``JSONLinesWriter``/``read_json_lines``);
+* a compact binary format (``encode_binary``/``decode_binary``) that
+  stores numbers and dates (as ordinals) in one ``struct`` per class.
+
+Top-level records carry the class name, so ``AnswersStatistics``
+subclasses decode to the right type; nested answers carry it only when
+they are an instance of a subclass of the declared field type. Custom
+answer classes are picked up automatically when encoded, or up front with
+``register``; class names must be unique among registered classes.
+"""
+
+import dataclasses
+import json
+import struct
+import threading
+import types
+import typing
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import date
+from typing import IO, Any, TypeVar
+
+from foxypack.exceptions import ConfigurationError, InvalidUsageError
+from foxypack.foxypack_abc.answers import (
+    AnswersAnalysis,
+    AnswersBase,
+    AnswersSocialContainer,
+    AnswersSocialContent,
+)
+
+A = TypeVar("A", bound=AnswersBase)
+
+TYPE_KEY = "type"
+_MAGIC = b"FXB\x02"
+_NULL = 0xFFFFFFFF
+_NAME = struct.Struct("<B")
+# Leading byte of a nested answer in the binary format.
+_ABSENT, _DECLARED, _TAGGED = 0, 1, 2
+
+_FIXED = {int: "q", float: "d", bool: "?"}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Field:
+    name: str
+    kind: type
+    optional: bool
+
+
+class _Codec:
+    __slots__ = (
+        "_binary",
+        "cls",
+        "fields",
+        "from_dict",
+        "to_dict",
+    )
+
+    def __init__(self, cls: type[AnswersBase]) -> None:
+        self.cls = cls
+        self.fields = _fields(cls)
+        if any(field.name == TYPE_KEY for field in self.fields):
+            raise ConfigurationError(
+                "Answer field name clashes with the type tag",
+                details={"type": cls.__name__, "field": TYPE_KEY},
+            )
+        self.to_dict: Callable[[Any], dict[str, Any]] = self._compile_to_dict()
+        self.from_dict: Callable[[Mapping[str, Any]], Any] = self._compile_from_dict()
+        self._binary: tuple[Callable[..., None], Callable[..., Any]] | None = None
+
+    def _compile_to_dict(self) -> Callable[[Any], dict[str, Any]]:
+        items = []
+        for field in self.fields:
+            value = f"obj.{field.name}"
+            if field.kind is date:
+                value = f"_iso({value})"
+            elif _is_answer(field.kind):
+                value = f"_nested_to_dict({value}, {field.kind.__name__})"
+                if field.optional:
+                    value = f"{value} if obj.{field.name} is not None else None"
+            items.append(f"{field.name!r}: {value}")
+        return _compile(
+            "to_dict", "obj", f"return {{{', '.join(items)}}}", self._namespace()
+        )
+
+    def _compile_from_dict(self) -> Callable[[Mapping[str, Any]], Any]:
+        items = []
+        for field in self.fields:
+            value = f"data[{field.name!r}]"
+            if field.kind is date:
+                value = f"_from_iso({value})"
+            elif _is_answer(field.kind):
+                value = f"_nested_from_dict({value}, {field.kind.__name__})"
+                if field.optional:
+                    value = f"{value} if data[{field.name!r}] is not None else None"
+            items.append(f"{field.name}={value}")
+        return _compile(
+            "from_dict", "data", f"return cls({', '.join(items)})", self._namespace()
+        )
+
+    def binary(self) -> tuple[Callable[..., None], Callable[..., Any]]:
+        """``(encode(obj, out), decode(buffer, offset) -> (obj, offset))``."""
+        if self._binary is None:
+            self._binary = self._compile_binary()
+        return self._binary
+
+    def _compile_binary(self) -> tuple[Callable[..., None], Callable[..., Any]]:
+        layout = "<"
+        packed: list[str] = []
+        unpacked: list[str] = []
+        prepare: list[str] = []
+        tail_encode: list[str] = []
+        tail_decode: list[str] = []
+        build: list[str] = []
+        for index, field in enumerate(self.fields):
+            name = field.name
+            local = f"v{index}"
+            if field.kind is str:
+                layout += "I"
+                prepare.append(
+                    f"{local} = obj.{name}.encode() if obj.{name} is not None else None"
+                )
+                packed.append(f"len({local}) if {local} is not None else _NULL")
+                tail_encode.append(f"if {local} is not None: out += {local}")
+                unpacked.append(local)
+                tail_decode += [
+                    f"if {local} == _NULL: {local} = None",
+                    "else:",
+                    f"    end = offset + {local}",
+                    f"    {local} = str(buffer[offset:end], 'utf-8')",
+                    "    offset = end",
+                ]
+            elif field.kind is date:
+                layout += "i"
+                packed.append(
+                    f"obj.{name}.toordinal() if obj.{name} is not None else 0"
+                )
+                unpacked.append(local)
+                tail_decode.append(
+                    f"{local} = _date.fromordinal({local}) if {local} else None"
+                )
+            elif field.kind in _FIXED:
+                if field.optional:
+                    raise _unsupported(self.cls, field)
+                layout += _FIXED[field.kind]
+                packed.append(f"obj.{name}")
+                unpacked.append(local)
+            elif _is_answer(field.kind):
+                kind = field.kind.__name__
+                tail_encode.append(f"_encode_nested(obj.{name}, {kind}, out)")
+                tail_decode.append(
+                    f"{local}, offset = _decode_nested(buffer, offset, {kind})"
+                )
+            else:
+                raise _unsupported(self.cls, field)
+            build.append(f"{name}={local}")
+        namespace = self._namespace() | {"_struct": struct.Struct(layout)}
+        head_encode = []
+        head_decode = []
+        if packed:
+            head_encode.append(f"out += _struct.pack({', '.join(packed)})")
+            head_decode += [
+                f"{', '.join(unpacked)}, = _struct.unpack_from(buffer, offset)",
+                "offset += _struct.size",
+            ]
+        encode = _compile(
+            "encode",
+            "obj, out",
+            "\n".join([*prepare, *head_encode, *tail_encode] or ["pass"]),
+            namespace,
+        )
+        decode = _compile(
+            "decode",
+            "buffer, offset",
+            "\n".join(
+                [
+                    *head_decode,
+                    *tail_decode,
+                    f"return cls({', '.join(build)}), offset",
+                ]
+            ),
+            namespace,
+        )
+        return encode, decode
+
+    def _namespace(self) -> dict[str, Any]:
+        return {
+            "cls": self.cls,
+            "_codec": _codec,
+            "_nested_to_dict": _nested_to_dict,
+            "_nested_from_dict": _nested_from_dict,
+            "_encode_nested": _encode_nested,
+            "_decode_nested": _decode_nested,
+            "_iso": _iso,
+            "_from_iso": _from_iso,
+            "_date": date,
+            "_NULL": _NULL,
+        } | {
+            field.kind.__name__: field.kind
+            for field in self.fields
+            if _is_answer(field.kind)
+        }
+
+
+_codecs: dict[type, _Codec] = {}
+_classes: dict[str, type[AnswersBase]] = {}
+_lock = threading.Lock()
+
+
+def register(cls: type[A]) -> type[A]:
+    """Make ``cls`` decodable by name; usable as a class decorator."""
+    _codec(cls)
+    return cls
+
+
+def to_dict(answer: AnswersBase) -> dict[str, Any]:
+    """``answer`` as a JSON-ready dict tagged with its class name."""
+    return {TYPE_KEY: type(answer).__name__} | _codec(type(answer)).to_dict(answer)
+
+
+def from_dict(data: Mapping[str, Any], cls: type[A] | None = None) -> A:
+    """Rebuild an answer from ``to_dict`` output, as ``cls`` if given."""
+    target = cls if cls is not None else _class_named(data.get(TYPE_KEY))
+    try:
+        return typing.cast(A, _codec(target).from_dict(data))
+    except (KeyError, TypeError, ValueError) as error:
+        raise InvalidUsageError(
+            "Malformed answer data", details={"type": target.__name__}, cause=error
+        ) from error
+
+
+def encode_binary(answer: AnswersBase) -> bytes:
+    out = bytearray(_MAGIC)
+    try:
+        _write_name(type(answer), out)
+        _codec(type(answer)).binary()[0](answer, out)
+    except struct.error as error:
+        raise InvalidUsageError(
+            "Answer does not fit the binary format",
+            details={"type": type(answer).__name__},
+            cause=error,
+        ) from error
+    return bytes(out)
+
+
+def decode_binary(data: bytes | bytearray | memoryview) -> AnswersBase:
+    buffer = memoryview(data)
+    if buffer[: len(_MAGIC)] != _MAGIC:
+        raise InvalidUsageError("Not a binary answer record")
+    try:
+        cls, offset = _read_name(buffer, len(_MAGIC))
+        answer, offset = _codec(cls).binary()[1](buffer, offset)
+    except (struct.error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidUsageError("Corrupt binary answer record", cause=error) from error
+    if offset != len(buffer):
+        raise InvalidUsageError(
+            "Trailing data after binary answer record",
+            details={"size": len(buffer), "used": offset},
+        )
+    return typing.cast(AnswersBase, answer)
+
+
+class JSONLinesWriter:
+    """Writes answers to a text stream, one JSON object per line."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def write(self, answer: AnswersBase) -> None:
+        self.stream.write(self._encoder.encode(to_dict(answer)))
+        self.stream.write("\n")
+
+    def write_all(self, answers: Iterable[AnswersBase]) -> int:
+        count = 0
+        for answer in answers:
+            self.write(answer)
+            count += 1
+        return count
+
+
+def read_json_lines(lines: Iterable[str]) -> Iterator[AnswersBase]:
+    """Decode answers from JSON Lines, such as an open text file."""
+    decoder = json.JSONDecoder()
+    for line in lines:
+        if line.strip():
+            yield from_dict(decoder.decode(line))
+
+
+def _codec(cls: type) -> _Codec:
+    codec = _codecs.get(cls)
+    if codec is not None:
+        return codec
+    if not (isinstance(cls, type) and issubclass(cls, AnswersBase)):
+        raise InvalidUsageError(
+            "Only answer models can be serialized", details={"type": repr(cls)}
+        )
+    with _lock:
+        codec = _codecs.get(cls)
+        if codec is None:
+            # Register first so self-referencing fields resolve.
+            registered = _classes.setdefault(cls.__name__, cls)
+            if registered is not cls:
+                raise ConfigurationError(
+                    "Another answer class with this name is registered",
+                    details={
+                        "type": _qualified(cls),
+                        "registered": _qualified(registered),
+                    },
+                )
+            codec = _codecs[cls] = _Codec(cls)
+    return codec
+
+
+def _qualified(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _class_named(name: object, kind: type = AnswersBase) -> type[AnswersBase]:
+    cls = _classes.get(name) if isinstance(name, str) else None
+    if cls is None:
+        raise InvalidUsageError("Unknown answer type", details={"type": name})
+    if not issubclass(cls, kind):
+        raise InvalidUsageError(
+            "Answer type does not match the field",
+            details={"type": name, "expected": kind.__name__},
+        )
+    return cls
+
+
+def _nested_to_dict(value: AnswersBase, kind: type) -> dict[str, Any]:
+    cls = type(value)
+    data = _codec(cls).to_dict(value)
+    if cls is kind:
+        return data
+    return {TYPE_KEY: cls.__name__} | data
+
+
+def _nested_from_dict(data: Mapping[str, Any], kind: type) -> Any:
+    cls = kind if TYPE_KEY not in data else _class_named(data[TYPE_KEY], kind)
+    return _codec(cls).from_dict(data)
+
+
+def _encode_nested(value: AnswersBase | None, kind: type, out: bytearray) -> None:
+    if value is None:
+        out += _NAME.pack(_ABSENT)
+        return
+    cls = type(value)
+    if cls is kind:
+        out += _NAME.pack(_DECLARED)
+    else:
+        out += _NAME.pack(_TAGGED)
+        _write_name(cls, out)
+    _codec(cls).binary()[0](value, out)
+
+
+def _decode_nested(buffer: memoryview, offset: int, kind: type) -> tuple[Any, int]:
+    (flag,) = _NAME.unpack_from(buffer, offset)
+    offset += _NAME.size
+    if flag == _ABSENT:
+        return None, offset
+    cls = kind
+    if flag == _TAGGED:
+        cls, offset = _read_name(buffer, offset, kind)
+    elif flag != _DECLARED:
+        raise ValueError(f"Unknown nested answer flag {flag}")
+    return _codec(cls).binary()[1](buffer, offset)
+
+
+def _write_name(cls: type, out: bytearray) -> None:
+    name = cls.__name__.encode()
+    out += _NAME.pack(len(name))
+    out += name
+
+
+def _read_name(
+    buffer: memoryview, offset: int, kind: type = AnswersBase
+) -> tuple[type[AnswersBase], int]:
+    (length,) = _NAME.unpack_from(buffer, offset)
+    offset += _NAME.size
+    end = offset + length
+    return _class_named(str(buffer[offset:end], "utf-8"), kind), end
+
+
+def _fields(cls: type) -> tuple[_Field, ...]:
+    hints = typing.get_type_hints(cls)
+    result = []
+    for field in dataclasses.fields(cls):
+        kind = hints[field.name]
+        optional = False
+        if isinstance(kind, types.UnionType) or typing.get_origin(kind) is typing.Union:
+            members = [arg for arg in typing.get_args(kind) if arg is not type(None)]
+            optional = len(members) < len(typing.get_args(kind))
+            kind = members[0] if len(members) == 1 else object
+        result.append(_Field(field.name, kind, optional))
+    return tuple(result)
+
+
+def _is_answer(kind: type) -> bool:
+    return isinstance(kind, type) and issubclass(kind, AnswersBase)
+
+
+def _unsupported(cls: type, field: _Field) -> ConfigurationError:
+    return ConfigurationError(
+        "Field type is not supported by the binary format",
+        details={"type": cls.__name__, "field": field.name, "kind": repr(field.kind)},
+    )
+
+
+def _compile(name: str, args: str, body: str, namespace: dict[str, Any]) -> Any:
+    source = f"def {name}({args}):\n" + "".join(
+        f"    {line}\n" for line in body.splitlines()
+    )
+    exec(source, namespace)  # noqa: S102 - source is built from field names
+    return namespace[name]
+
+
+def _iso(value: date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _from_iso(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value is not None else None
+
+
+for _cls in (AnswersAnalysis, AnswersSocialContainer, AnswersSocialContent):
+    register(_cls)
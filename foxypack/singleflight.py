@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar, cast
+
+from foxypack.deadline import remaining_time
+from foxypack.exceptions import TimeoutError
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Lets concurrent callers with the same key share one in-flight call.
+
+    The first caller for a key runs the call; callers arriving before it
+    finishes wait and receive the same result or exception; a waiting
+    thread gives up with ``TimeoutError`` at its own deadline. Threads and
+    coroutines are tracked separately; a coroutine call runs in a task of
+    its own with an empty ``contextvars`` context.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call[T]] = {}
+        self._tasks: dict[str, asyncio.Task[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            remaining = remaining_time()
+            timeout = None if remaining is None else max(remaining, 0.0)
+            if not call.done.wait(timeout):
+                raise TimeoutError(
+                    "Deadline exceeded waiting for a shared call",
+                    details={"key": key},
+                )
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.result)
+        try:
+            result = call.result = func()
+            return result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or task.get_loop() is not loop:
+            # A fresh context, so the shared call does not inherit the
+            # leader's context variables, such as its deadline.
+            task = loop.create_task(_await(func), context=contextvars.Context())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # The shared call runs as its own task, so one caller being cancelled
+        # does not cancel it for the others.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: "asyncio.Task[T]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
+
+
+async def _await(func: Callable[[], Awaitable[T]]) -> T:
+    return await func()
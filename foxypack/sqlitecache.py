@@ -0,0 +1,218 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from foxypack.cache import CacheBackend, CacheStats
+from foxypack.exceptions import ConfigurationError, FoxyError
+
+V = TypeVar("V")
+
+_SCHEMA = (
+    (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY,"
+        " value BLOB NOT NULL,"
+        " expires_at REAL NOT NULL,"
+        " stale_until REAL NOT NULL"
+        ")"
+    ),
+    "CREATE INDEX IF NOT EXISTS entries_stale_until ON entries (stale_until)",
+)
+
+
+class SQLiteCache(CacheBackend[V]):
+    """Cache backend kept in an SQLite database file in WAL mode.
+
+    Entries survive restarts and can be shared by several processes on the
+    same host: every thread and process opens its own connection and
+    writers wait up to ``busy_timeout`` seconds for each other. Lifetimes use
+    the wall clock since they are compared across processes.
+
+    The file holds at most about ``maxsize`` entries: every
+    ``compact_every`` writes (or on ``compact()``) expired entries are
+    removed first, then the ones closest to expiry.
+
+    Values are stored with ``dumps``/``loads``, pickle by default, so the
+    file must only be writable by trusted code. For answer models pass
+    ``dumps=encode_binary, loads=decode_binary`` from
+    ``foxypack.serialization``, which is faster, smaller and does not run
+    code on load.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        maxsize: int = 100_000,
+        ttl: float | None = None,
+        compact_every: int = 256,
+        busy_timeout: float = 5.0,
+        dumps: Callable[[V], bytes] = pickle.dumps,
+        loads: Callable[[bytes], V] = pickle.loads,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if maxsize <= 0 or compact_every <= 0:
+            raise ConfigurationError(
+                "Invalid SQLite cache size",
+                details={"maxsize": maxsize, "compact_every": compact_every},
+            )
+        if ttl is not None and ttl <= 0:
+            raise ConfigurationError("Cache ttl must be positive", details={"ttl": ttl})
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.compact_every = compact_every
+        self.busy_timeout = busy_timeout
+        self.stats = CacheStats()
+        self._dumps = dumps
+        self._loads = loads
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        # A connection inherited through fork must not be used by the child.
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def __len__(self) -> int:
+        row = self._connection().execute("SELECT count(*) FROM entries").fetchone()
+        return int(row[0])
+
+    def get_entry(self, key: str, allow_stale: bool = True) -> tuple[V, bool] | None:
+        item = self._read(key)
+        now = self._clock()
+        outcome: tuple[V, bool] | None = None
+        expired = False
+        if item is not None:
+            value, expires_at, stale_until = item
+            if expires_at > now:
+                outcome = value, True
+            elif stale_until <= now:
+                expired = True
+            elif allow_stale:
+                outcome = value, False
+        if expired:
+            self._connection().execute(
+                "DELETE FROM entries WHERE key = ? AND stale_until <= ?", (key, now)
+            )
+        with self._lock:
+            if outcome is None:
+                self.stats.misses += 1
+                self.stats.expirations += int(expired)
+            elif outcome[1]:
+                self.stats.hits += 1
+            else:
+                self.stats.stale_hits += 1
+        return outcome
+
+    def peek(self, key: str) -> tuple[V, float, float] | None:
+        item = self._read(key)
+        if item is None:
+            return None
+        value, expires_at, stale_until = item
+        now = self._clock()
+        return value, expires_at - now, stale_until - now
+
+    def _read(self, key: str) -> tuple[V, float, float] | None:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at, stale_until FROM entries WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            value = self._loads(row[0])
+        except (
+            pickle.UnpicklingError,
+            AttributeError,
+            EOFError,
+            FoxyError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            # Written by an incompatible version; treat it as missing.
+            self.delete(key)
+            return None
+        return value, row[1], row[2]
+
+    def set(
+        self, key: str, value: V, ttl: float | None = None, stale_ttl: float = 0.0
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+        self._connection().execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+            (key, self._dumps(value), expires_at, expires_at + stale_ttl),
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.compact_every == 0
+        if due:
+            self.compact()
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM entries")
+
+    def compact(self) -> None:
+        """Drop expired entries, then the ones closest to expiry over ``maxsize``."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            expired = connection.execute(
+                "DELETE FROM entries WHERE stale_until <= ?", (self._clock(),)
+            ).rowcount
+            count = connection.execute("SELECT count(*) FROM entries").fetchone()[0]
+            evicted = 0
+            if count > self.maxsize:
+                evicted = connection.execute(
+                    "DELETE FROM entries WHERE key IN"
+                    " (SELECT key FROM entries ORDER BY stale_until LIMIT ?)",
+                    (count - self.maxsize,),
+                ).rowcount
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.stats.expirations += int(expired)
+            self.stats.evictions += evicted
+
+    def close(self) -> None:
+        """Close the connections opened by this process."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
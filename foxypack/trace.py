@@ -0,0 +1,141 @@
+import contextlib
+import contextvars
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from typing import Any
+
+from foxypack.exceptions import FoxyError, UnsupportedOperationError
+
+
+@dataclass(frozen=True, slots=True)
+class AttemptRecord:
+    """One call to an analysis or statistics module made for a lookup.
+
+    ``started`` is the offset in seconds from the start of the lookup and
+    ``outcome`` is ``"ok"``, ``"circuit_open"``, ``"cancelled"`` for a
+    hedged call that lost the race, or the error type name.
+    """
+
+    stage: str
+    module: str
+    platform: str
+    outcome: str
+    started: float
+    duration: float
+    error: FoxyError | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "module": self.module,
+            "platform": self.platform,
+            "outcome": self.outcome,
+            "started": self.started,
+            "duration": self.duration,
+            "error": str(self.error) if self.error is not None else None,
+        }
+
+
+class _Trace:
+    __slots__ = ("origin", "records")
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.records: list[AttemptRecord] = []
+
+
+_current: contextvars.ContextVar[_Trace | None] = contextvars.ContextVar(
+    "foxypack_trace", default=None
+)
+
+
+@contextlib.contextmanager
+def tracing(trace: list[AttemptRecord] | None = None) -> Iterator[None]:
+    """Record attempts made in this context, appending them to ``trace``.
+
+    Nested lookups, such as the analysis done for a statistics lookup,
+    share the trace of the outermost one.
+    """
+    if _current.get() is not None:
+        yield
+        return
+    current = _Trace()
+    token = _current.set(current)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+        if trace is not None:
+            trace.extend(current.records)
+
+
+def record_attempt(
+    stage: str,
+    module: object,
+    platform: str,
+    outcome: str,
+    started: float,
+    duration: float,
+    error: FoxyError | None = None,
+) -> None:
+    """Add an attempt that began at ``perf_counter`` time ``started``."""
+    current = _current.get()
+    if current is None:
+        return
+    current.records.append(
+        AttemptRecord(
+            stage=stage,
+            module=type(module).__name__,
+            platform=platform,
+            outcome=outcome,
+            started=started - current.origin,
+            duration=duration,
+            error=error,
+        )
+    )
+
+
+def replay(records: Iterable[AttemptRecord], started: float) -> None:
+    """Add ``records`` of a trace that began at ``perf_counter`` time ``started``."""
+    current = _current.get()
+    if current is None:
+        return
+    shift = started - current.origin
+    current.records.extend(
+        replace(record, started=record.started + shift) for record in records
+    )
+
+
+def attempts(stage: str | None = None) -> list[AttemptRecord]:
+    """Attempts of ``stage``, or of every stage, recorded so far in the lookup."""
+    current = _current.get()
+    if current is None:
+        return []
+    if stage is None:
+        return list(current.records)
+    return [record for record in current.records if record.stage == stage]
+
+
+def exhausted_error(
+    message: str,
+    details: dict[str, Any],
+    stage: str | None,
+    error_type: type[FoxyError] = UnsupportedOperationError,
+) -> FoxyError:
+    """``error_type`` error carrying the failed attempts of ``stage``.
+
+    A ``stage`` of ``None`` takes the attempts of every stage.
+
+    The attempt records go to ``details["attempts"]`` and the module errors
+    are grouped in an ``ExceptionGroup`` set as ``cause``.
+    """
+    records = attempts(stage)
+    errors = [record.error for record in records if record.error is not None]
+    error = error_type(
+        message,
+        details=details | {"attempts": [record.to_dict() for record in records]},
+        cause=ExceptionGroup(message, errors) if errors else None,
+    )
+    error.__cause__ = error.cause
+    return error
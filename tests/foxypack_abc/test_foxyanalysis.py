@@ -86,3 +86,12 @@ def test_invalid_link_analysis():
         FakeAnalysis().get_analysis(
             "https://invalidmedia.com/qsgqsdr?content_id=video_fdasfdgfs"
         )
+
+
+@pytest.mark.asyncio
+async def test_default_analysis_async_delegates_to_sync():
+    """Test default async analysis falls back to the sync implementation"""
+    fake_analysis = await FakeAnalysis().get_analysis_async(
+        "https://fakesocialmedia.com/qsgqsdrr"
+    )
+    assert fake_analysis.type_content == "channel"
@@ -0,0 +1,127 @@
+from collections import Counter
+
+import pytest
+
+from foxypack import (
+    AdaptiveBalancer,
+    ConfigurationError,
+    FoxyPack,
+    ServiceUnavailableError,
+)
+from foxypack.foxypack_abc.answers import AnswersSocialContainer
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class ModuleA:
+    pass
+
+
+class ModuleB:
+    pass
+
+
+class ModuleC:
+    pass
+
+
+class FailingFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        raise ServiceUnavailableError()
+
+
+class HealthyFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"alpha": 0}, {"alpha": 1.5}, {"tolerance": 0.5}, {"min_success": 1}],
+)
+def test_balancer_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        AdaptiveBalancer(**kwargs)
+
+
+def test_balancer_tries_unknown_modules_first_then_cheapest():
+    balancer = AdaptiveBalancer()
+    a, b, c = ModuleA(), ModuleB(), ModuleC()
+    balancer.record(a, "P", latency=1.0, success=True)
+    balancer.record(b, "P", latency=0.1, success=True)
+
+    assert balancer.order([a, b, c], "P") == [c, b, a]
+
+
+def test_balancer_penalises_failing_modules():
+    balancer = AdaptiveBalancer(alpha=0.5)
+    a, b = ModuleA(), ModuleB()
+    balancer.record(a, "P", latency=0.1, success=True)
+    balancer.record(a, "P", latency=0.1, success=False)
+    balancer.record(a, "P", latency=0.1, success=False)
+    balancer.record(b, "P", latency=0.2, success=True)
+
+    assert balancer.order([a, b], "P") == [b, a]
+    assert balancer.snapshot()[("ModuleA", "P")].success == pytest.approx(0.25)
+
+
+def test_balancer_orders_fast_failing_modules_after_healthy_ones():
+    balancer = AdaptiveBalancer()
+    a, b = ModuleA(), ModuleB()
+    balancer.record(a, "P", latency=0.00001, success=True)
+    for _ in range(30):
+        balancer.record(a, "P", latency=0.000013, success=False)
+        balancer.record(b, "P", latency=0.05, success=True)
+
+    assert balancer.order([a, b], "P") == [b, a]
+
+
+def test_balancer_keeps_platforms_separate():
+    balancer = AdaptiveBalancer()
+    a, b = ModuleA(), ModuleB()
+    balancer.record(a, "P1", latency=0.1, success=True)
+    balancer.record(b, "P1", latency=1.0, success=True)
+    balancer.record(a, "P2", latency=1.0, success=True)
+    balancer.record(b, "P2", latency=0.1, success=True)
+
+    assert balancer.order([a, b], "P1")[0] is a
+    assert balancer.order([a, b], "P2")[0] is b
+
+
+def test_balancer_round_robins_equivalent_modules_by_weight():
+    balancer = AdaptiveBalancer(tolerance=3)
+    a, b = ModuleA(), ModuleB()
+    balancer.record(a, "P", latency=0.1, success=True)
+    balancer.record(b, "P", latency=0.2, success=True)
+
+    firsts = Counter(type(balancer.order([a, b], "P")[0]).__name__ for _ in range(300))
+
+    assert firsts["ModuleA"] == 200
+    assert firsts["ModuleB"] == 100
+
+
+def test_foxypack_balancer_moves_failing_module_to_the_back():
+    failing = FailingFakeStatistics()
+    healthy = HealthyFakeStatistics()
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={failing, healthy},
+        balancer=AdaptiveBalancer(),
+    )
+
+    for _ in range(10):
+        result = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+        assert isinstance(result, AnswersSocialContainer)
+
+    assert failing.calls <= 1
+    assert healthy.calls == 10
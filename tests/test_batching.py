@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+
+from foxypack import (
+    AnswersAnalysis,
+    CircuitBreakers,
+    CircuitState,
+    ConfigurationError,
+    ContentNotFoundError,
+    FoxyPack,
+    ImplementationContractError,
+    MicroBatcher,
+    RetryBudget,
+    RetryPolicy,
+    ServiceUnavailableError,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+URLS = [f"https://fakesocialmedia.com/channel{index}" for index in range(10)]
+
+
+class BatchFakeStatistics(FakeStatistics):
+    max_batch_size = 4
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+        self.single_calls = 0
+
+    async def get_statistics_async(self, answers_analysis):
+        self.single_calls += 1
+        return self.get_statistics(answers_analysis)
+
+    async def get_statistics_batch_async(self, answers_analysis):
+        self.batches.append(len(answers_analysis))
+        return [self.get_statistics(item) for item in answers_analysis]
+
+
+class SyncBatchFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    def get_statistics_batch(self, answers_analysis):
+        self.batches.append(len(answers_analysis))
+        return [self.get_statistics(item) for item in answers_analysis]
+
+
+async def echo(items: list[int]) -> list[int]:
+    return [item * 10 for item in items]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_flushes_full_batches_and_after_max_wait():
+    sizes: list[int] = []
+
+    async def flush(items: list[int]) -> list[int]:
+        sizes.append(len(items))
+        return await echo(items)
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(max_size=2, max_wait=0.01)
+    results = await asyncio.gather(
+        *(batcher.submit("key", item, flush) for item in range(5))
+    )
+
+    assert results == [0, 10, 20, 30, 40]
+    assert sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_keeps_keys_apart_and_honours_limit():
+    sizes: list[tuple[str, int]] = []
+
+    def flush_for(key: str):
+        async def flush(items: list[int]) -> list[int]:
+            sizes.append((key, len(items)))
+            return await echo(items)
+
+        return flush
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(max_size=10, max_wait=0.01)
+    await asyncio.gather(
+        *(batcher.submit("a", item, flush_for("a"), limit=2) for item in range(4)),
+        batcher.submit("b", 1, flush_for("b")),
+    )
+
+    assert sorted(sizes) == [("a", 2), ("a", 2), ("b", 1)]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_routes_item_errors_to_their_caller():
+    async def flush(items: list[int]):
+        return [ContentNotFoundError() if item == 1 else item for item in items]
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(max_size=3)
+    results = await asyncio.gather(
+        *(batcher.submit("key", item, flush) for item in range(3)),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ContentNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_rejects_wrong_result_count():
+    async def flush(items: list[int]) -> list[int]:
+        return []
+
+    batcher: MicroBatcher[int, int] = MicroBatcher()
+    with pytest.raises(ImplementationContractError):
+        await batcher.submit("key", 1, flush)
+
+
+def test_micro_batcher_validates_window():
+    with pytest.raises(ConfigurationError):
+        MicroBatcher(max_size=0)
+
+
+def test_default_batch_calls_single_statistics():
+    analysis = AnswersAnalysis(
+        url="https://fakesocialmedia.com/qsgqsdrr",
+        social_platform="FakeSocialMedia",
+        type_content="channel",
+    )
+
+    results = FakeStatistics().get_statistics_batch([analysis, analysis])
+
+    assert [result.system_id for result in results] == ["CH_001", "CH_001"]
+
+
+@pytest.mark.asyncio
+async def test_controller_groups_lookups_into_module_batches():
+    module = BatchFakeStatistics()
+    foxypack = FoxyPack(batcher=MicroBatcher(max_size=50, max_wait=0.2)).with_module(
+        FakeAnalysis(), module
+    )
+
+    results = await foxypack.get_statistics_many(URLS)
+
+    assert [result.analysis_status.url for result in results] == URLS
+    assert module.batches == [4, 4, 2]
+    assert module.single_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_controller_runs_sync_batches_in_a_thread():
+    module = SyncBatchFakeStatistics()
+    foxypack = FoxyPack(batcher=MicroBatcher(max_size=5, max_wait=0.2)).with_module(
+        FakeAnalysis(), module
+    )
+
+    results = await foxypack.get_statistics_many(URLS)
+
+    assert len(results) == len(URLS)
+    assert module.batches == [5, 5]
+
+
+@pytest.mark.asyncio
+async def test_controller_without_batcher_uses_single_calls():
+    module = BatchFakeStatistics()
+    foxypack = FoxyPack().with_module(FakeAnalysis(), module)
+
+    await foxypack.get_statistics_many(URLS[:3])
+
+    assert module.batches == []
+    assert module.single_calls == 3
+
+
+class FlakyBatchFakeStatistics(BatchFakeStatistics):
+    max_batch_size = 50
+
+    async def get_statistics_batch_async(self, answers_analysis):
+        if not self.batches:
+            self.batches.append(len(answers_analysis))
+            raise ServiceUnavailableError()
+        return await super().get_statistics_batch_async(answers_analysis)
+
+
+@pytest.mark.asyncio
+async def test_controller_counts_batch_wide_failure_once():
+    module = FlakyBatchFakeStatistics()
+    breakers = CircuitBreakers(failure_threshold=2)
+    budget = RetryBudget(ratio=0, max_tokens=5)
+    foxypack = FoxyPack(
+        batcher=MicroBatcher(max_size=50, max_wait=0.05),
+        circuit_breakers=breakers,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay=0, budget=budget),
+    ).with_module(FakeAnalysis(), module)
+
+    results = await foxypack.get_statistics_many(URLS)
+
+    assert [result.analysis_status.url for result in results] == URLS
+    assert module.batches == [10, 10]
+    assert budget.tokens == 4
+    assert breakers.states() == {"FlakyBatchFakeStatistics": CircuitState.CLOSED}
@@ -0,0 +1,342 @@
+import asyncio
+
+import pytest
+
+from foxypack import (
+    AdaptiveBalancer,
+    AnswersAnalysis,
+    ConfigurationError,
+    ContentAccessError,
+    ContentNotFoundError,
+    ContentPrivateError,
+    ContentRegionRestrictedError,
+    FoxyPack,
+    LRUCache,
+    NegativeCache,
+    StatisticsCache,
+)
+from foxypack.routing import canonical_url
+from foxypack.trace import tracing
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingFakeAnalysis(FakeAnalysis):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_analysis(self, url: str):
+        self.calls += 1
+        return super().get_analysis(url)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTPS://FakeSocialMedia.com/abc/", "https://fakesocialmedia.com/abc"),
+        ("https://www.fakesocialmedia.com/abc", "https://fakesocialmedia.com/abc"),
+        ("https://fakesocialmedia.com:443/abc", "https://fakesocialmedia.com/abc"),
+        ("http://fakesocialmedia.com:8080/abc", "http://fakesocialmedia.com:8080/abc"),
+        (
+            "https://fakesocialmedia.com/abc?utm_source=x&b=2&fbclid=y&a=1#frag",
+            "https://fakesocialmedia.com/abc?a=1&b=2",
+        ),
+        ("https://fakesocialmedia.com/AbC", "https://fakesocialmedia.com/AbC"),
+    ],
+)
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_lru_cache_hit_and_miss_counters():
+    cache: LRUCache[str] = LRUCache(maxsize=2)
+
+    assert cache.get("a") is None
+    cache.set("a", "1")
+    assert cache.get("a") == "1"
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str] = LRUCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats.evictions == 1
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache: LRUCache[str] = LRUCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", "1")
+    cache.set("b", "2", ttl=30)
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+    assert cache.stats.expirations == 1
+
+
+@pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}])
+def test_lru_cache_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        LRUCache(**kwargs)
+
+
+def test_foxypack_analysis_cache_reuses_result_for_equivalent_urls():
+    analysis = CountingFakeAnalysis()
+    cache = LRUCache(maxsize=16)
+    foxypack = FoxyPack(analysis_cache=cache).with_module(analysis)
+
+    first = foxypack.get_analysis("https://fakesocialmedia.com/qsgqsdrr")
+    second = foxypack.get_analysis(
+        "https://WWW.fakesocialmedia.com/qsgqsdrr/?utm_source=feed"
+    )
+
+    assert second is first
+    assert analysis.calls == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+class CountingFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+    async def get_statistics_async(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+
+def test_lru_cache_returns_stale_entries_within_stale_window():
+    clock = FakeClock()
+    cache: LRUCache[str] = LRUCache(maxsize=2, clock=clock)
+    cache.set("a", "1", ttl=10, stale_ttl=5)
+
+    clock.now = 12
+    assert cache.get("a") is None
+    assert cache.get_entry("a") == ("1", False)
+    assert cache.stats.stale_hits == 1
+
+    clock.now = 15
+    assert cache.get_entry("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_statistics_cache_ttl_for_prefers_most_specific_key():
+    cache = StatisticsCache(
+        ttl=100,
+        ttls={
+            ("FakeSocialMedia", "video"): 10,
+            ("FakeSocialMedia", None): 20,
+            (None, "channel"): 30,
+        },
+    )
+
+    def analysis(platform, type_content):
+        return AnswersAnalysis(
+            url="https://x", social_platform=platform, type_content=type_content
+        )
+
+    assert cache.ttl_for(analysis("FakeSocialMedia", "video")) == 10
+    assert cache.ttl_for(analysis("FakeSocialMedia", "channel")) == 20
+    assert cache.ttl_for(analysis("Other", "channel")) == 30
+    assert cache.ttl_for(analysis("Other", "video")) == 100
+
+
+def test_foxypack_statistics_cache_serves_fresh_answers():
+    statistics = CountingFakeStatistics()
+    foxypack = FoxyPack(statistics_cache=StatisticsCache(ttl=60)).with_module(
+        FakeAnalysis(), statistics
+    )
+
+    first = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+    second = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr/")
+
+    assert second is first
+    assert statistics.calls == 1
+
+
+def test_foxypack_statistics_cache_refetches_stale_answers_in_sync_path():
+    clock = FakeClock()
+    statistics = CountingFakeStatistics()
+    cache = StatisticsCache(ttl=10, stale_ttl=60, clock=clock)
+    foxypack = FoxyPack(statistics_cache=cache).with_module(FakeAnalysis(), statistics)
+
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+    clock.now = 11
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert statistics.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_foxypack_statistics_cache_serves_stale_and_refreshes_in_background():
+    clock = FakeClock()
+    statistics = CountingFakeStatistics()
+    cache = StatisticsCache(ttl=10, stale_ttl=60, clock=clock)
+    foxypack = FoxyPack(statistics_cache=cache).with_module(FakeAnalysis(), statistics)
+    url = "https://fakesocialmedia.com/qsgqsdrr"
+
+    first = await foxypack.get_statistics_async(url)
+    clock.now = 11
+    stale = await foxypack.get_statistics_async(url)
+    again = await foxypack.get_statistics_async(url)
+
+    assert stale is first
+    assert again is first
+    assert statistics.calls == 1
+
+    await asyncio.gather(*foxypack._refreshing.values())
+    assert statistics.calls == 2
+    assert cache.lookup(url)[1] is True
+
+
+@pytest.mark.asyncio
+async def test_foxypack_background_refresh_does_not_use_caller_trace():
+    clock = FakeClock()
+    cache = StatisticsCache(ttl=10, stale_ttl=60, clock=clock)
+    foxypack = FoxyPack(statistics_cache=cache, timeout=5).with_module(
+        FakeAnalysis(), CountingFakeStatistics()
+    )
+    url = "https://fakesocialmedia.com/qsgqsdrr"
+    await foxypack.get_statistics_async(url)
+    clock.now = 11
+    trace = []
+
+    with tracing(trace):
+        await foxypack.get_statistics_async(url, timeout=0.01)
+        await asyncio.gather(*foxypack._refreshing.values())
+
+    assert trace == []
+    assert cache.lookup(url)[1] is True
+
+
+class MissingContentStatistics(FakeStatistics):
+    def __init__(self, error) -> None:
+        super().__init__()
+        self.error = error
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        raise self.error
+
+    async def get_statistics_async(self, answers_analysis):
+        return self.get_statistics(answers_analysis)
+
+
+def test_negative_cache_ttl_follows_error_hierarchy():
+    cache = NegativeCache(ttls={ContentAccessError: 5, ContentPrivateError: 1})
+
+    assert cache.ttl_for(ContentPrivateError()) == 1
+    assert cache.ttl_for(ContentNotFoundError()) == 5
+    assert (
+        NegativeCache(ttls={ContentPrivateError: 1}).ttl_for(ContentNotFoundError())
+        is None
+    )
+
+
+def test_negative_cache_expires_per_error_type():
+    clock = FakeClock()
+    cache = NegativeCache(
+        ttls={ContentNotFoundError: 100, ContentPrivateError: 10}, clock=clock
+    )
+    not_found = ContentNotFoundError(url="https://fakesocialmedia.com/a")
+    cache.store("https://fakesocialmedia.com/a", not_found)
+    cache.store("https://fakesocialmedia.com/b", ContentPrivateError())
+
+    clock.now = 10
+    cached = cache.lookup("https://fakesocialmedia.com/a/")
+    assert isinstance(cached, ContentNotFoundError)
+    assert cached.url == not_found.url
+    assert cache.lookup("https://fakesocialmedia.com/b") is None
+
+
+def test_negative_cache_hands_out_fresh_copies_without_traceback():
+    cache = NegativeCache()
+    try:
+        raise ContentNotFoundError("gone")
+    except ContentNotFoundError as error:
+        cache.store("https://fakesocialmedia.com/a", error)
+
+    first = cache.lookup("https://fakesocialmedia.com/a")
+    second = cache.lookup("https://fakesocialmedia.com/a")
+
+    assert first is not second
+    assert first.__traceback__ is None
+    assert first.message == "gone"
+
+
+def test_foxypack_negative_cache_returns_cached_error_without_calling_module():
+    missing = MissingContentStatistics(
+        ContentNotFoundError("gone", content_id="qsgqsdrr", platform="FakeSocialMedia")
+    )
+    foxypack = FoxyPack(negative_cache=NegativeCache()).with_module(
+        FakeAnalysis(), missing
+    )
+
+    raised = []
+    for _ in range(3):
+        with pytest.raises(ContentNotFoundError) as exc_info:
+            foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+        assert exc_info.value.content_id == "qsgqsdrr"
+        raised.append(exc_info.value)
+
+    assert missing.calls == 1
+    assert raised[1] is not raised[2]
+
+
+@pytest.mark.asyncio
+async def test_foxypack_negative_cache_applies_to_async_path():
+    missing = MissingContentStatistics(ContentPrivateError("private"))
+    foxypack = FoxyPack(negative_cache=NegativeCache()).with_module(
+        FakeAnalysis(), missing
+    )
+
+    for _ in range(3):
+        with pytest.raises(ContentPrivateError):
+            await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert missing.calls == 1
+
+
+def test_foxypack_permanent_error_short_circuits_fallback():
+    missing = MissingContentStatistics(ContentRegionRestrictedError())
+    fallback = CountingFakeStatistics()
+    balancer = AdaptiveBalancer()
+    balancer.record(missing, "FakeSocialMedia", latency=0.001, success=True)
+    balancer.record(fallback, "FakeSocialMedia", latency=1.0, success=True)
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={missing, fallback},
+        balancer=balancer,
+    )
+
+    with pytest.raises(ContentRegionRestrictedError):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert missing.calls == 1
+    assert fallback.calls == 0
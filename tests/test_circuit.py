@@ -0,0 +1,158 @@
+import pytest
+
+from foxypack import (
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitState,
+    ConfigurationError,
+    ContentNotFoundError,
+    FoxyPack,
+    ServiceUnavailableError,
+    TimeoutError,
+    UnsupportedOperationError,
+)
+from foxypack.foxypack_abc.answers import AnswersSocialContainer
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DownFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        raise ServiceUnavailableError()
+
+    async def get_statistics_async(self, answers_analysis):
+        self.calls += 1
+        raise TimeoutError()
+
+
+class BackupFakeStatistics(FakeStatistics):
+    pass
+
+
+def test_circuit_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+    breaker.record(ServiceUnavailableError())
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record(TimeoutError())
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow() is False
+
+
+def test_circuit_breaker_ignores_non_tripping_errors():
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record(ServiceUnavailableError())
+    breaker.record(ContentNotFoundError())
+    breaker.record(ServiceUnavailableError())
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 1
+
+
+def test_circuit_breaker_half_open_allows_single_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record(ServiceUnavailableError())
+
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+
+    breaker.record(None)
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow() is True
+
+
+def test_circuit_breaker_failed_trial_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+    for _ in range(3):
+        breaker.record(ServiceUnavailableError())
+
+    clock.now = 10
+    assert breaker.allow() is True
+    breaker.record(TimeoutError())
+
+    assert breaker.state is CircuitState.OPEN
+    clock.now = 15
+    assert breaker.allow() is False
+
+
+def test_circuit_breaker_abandoned_trial_expires():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+    breaker.record(ServiceUnavailableError())
+
+    clock.now = 10
+    assert breaker.allow() is True
+    clock.now = 20
+    assert breaker.allow() is True
+
+
+@pytest.mark.parametrize("kwargs", [{"failure_threshold": 0}, {"recovery_timeout": 0}])
+def test_circuit_breakers_reject_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        CircuitBreakers(**kwargs)
+
+
+def test_foxypack_skips_open_circuit():
+    down = DownFakeStatistics()
+    breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={down},
+        circuit_breakers=breakers,
+    )
+
+    for _ in range(5):
+        with pytest.raises(UnsupportedOperationError):
+            foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert down.calls == 2
+    assert breakers.states() == {"DownFakeStatistics": CircuitState.OPEN}
+
+
+def test_foxypack_falls_back_while_circuit_is_open():
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={DownFakeStatistics(), BackupFakeStatistics()},
+        circuit_breakers=breakers,
+    )
+
+    for _ in range(3):
+        result = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+        assert isinstance(result, AnswersSocialContainer)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_skips_open_circuit_async():
+    down = DownFakeStatistics()
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={down},
+        circuit_breakers=breakers,
+    )
+
+    for _ in range(3):
+        with pytest.raises(UnsupportedOperationError):
+            await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert down.calls == 1
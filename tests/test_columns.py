@@ -0,0 +1,209 @@
+import sys
+from datetime import date
+
+import pytest
+
+from foxypack import (
+    AnswersAnalysis,
+    AnswersSocialContainer,
+    AnswersSocialContent,
+    AnswersStatistics,
+    ConfigurationError,
+    FoxyPack,
+    InvalidUsageError,
+    StatisticsColumns,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+def analysis(platform: str, type_content: str = "video") -> AnswersAnalysis:
+    return AnswersAnalysis(
+        url=f"https://{platform.lower()}.com/{type_content}",
+        social_platform=platform,
+        type_content=type_content,
+    )
+
+
+ANSWERS: list[AnswersStatistics] = [
+    AnswersSocialContent(
+        system_id="V1",
+        title="First",
+        views=100,
+        publish_date=date(2024, 1, 15),
+        analysis_status=analysis("YouTube"),
+    ),
+    AnswersSocialContent(
+        system_id="V2",
+        title="Second",
+        views=50,
+        publish_date=None,
+        analysis_status=analysis("TikTok"),
+    ),
+    AnswersSocialContent(
+        system_id="V3",
+        title="Third",
+        views=7,
+        publish_date=date(2023, 5, 1),
+        analysis_status=analysis("YouTube"),
+    ),
+    AnswersSocialContainer(
+        system_id="C1",
+        title="Channel",
+        subscribers=2000,
+        creation_date=date(2020, 3, 15),
+        analysis_status=analysis("YouTube", "channel"),
+    ),
+]
+
+
+@pytest.fixture
+def columns() -> StatisticsColumns:
+    columns = StatisticsColumns()
+    columns.extend(ANSWERS)
+    return columns
+
+
+def test_columns_store_typed_arrays(columns):
+    assert len(columns) == 4
+    assert columns.views.typecode == "q"
+    assert list(columns.views) == [100, 50, 7, 0]
+    assert list(columns.subscribers) == [0, 0, 0, 2000]
+    assert columns.date[1] == 0
+    assert columns.categories("social_platform") == ["YouTube", "TikTok"]
+    assert list(columns.social_platform.codes) == [0, 1, 0, 0]
+
+
+def test_columns_rebuild_rows(columns):
+    assert list(columns) == ANSWERS
+
+
+def test_columns_aggregations(columns):
+    assert columns.total("views") == 157
+    assert columns.sum("views", by="social_platform") == {"YouTube": 107, "TikTok": 50}
+    assert columns.count(by="type_content") == {"video": 3, "channel": 1}
+    assert columns.mean("subscribers", by="kind") == {
+        "content": 0,
+        "container": 2000,
+    }
+    assert columns.count(by="answer_type") == {
+        "AnswersSocialContent": 3,
+        "AnswersSocialContainer": 1,
+    }
+
+
+def test_columns_sum_many_groups_in_one_pass():
+    columns = StatisticsColumns()
+    columns.extend(
+        AnswersSocialContent(
+            system_id=str(index),
+            title="",
+            views=index,
+            publish_date=None,
+            analysis_status=analysis(f"Platform{index % 7}"),
+        )
+        for index in range(700)
+    )
+
+    totals = columns.sum("views", by="social_platform")
+
+    assert totals == {
+        f"Platform{group}": sum(range(group, 700, 7)) for group in range(7)
+    }
+    assert columns.count(by="social_platform") == {
+        f"Platform{group}": 100 for group in range(7)
+    }
+
+
+class ChannelContainer(AnswersSocialContainer):
+    pass
+
+
+def test_columns_keep_subclass_kind(columns):
+    channel = ChannelContainer(
+        system_id="C2",
+        title="Subclass",
+        subscribers=42,
+        creation_date=None,
+        analysis_status=analysis("YouTube", "channel"),
+    )
+
+    columns.append(channel)
+    row = columns.row(4)
+
+    assert isinstance(row, AnswersSocialContainer)
+    assert row.subscribers == 42
+    assert columns.answer_type[4] == "ChannelContainer"
+    assert columns.kind[4] == "container"
+
+
+def test_column_export_is_zero_copy(columns):
+    view = columns.column("views")
+
+    assert view.format == "q"
+    assert view.tolist() == [100, 50, 7, 0]
+    view[0] = 1
+    assert columns.views[0] == 1
+    with pytest.raises(BufferError):
+        columns.append(ANSWERS[0])
+    view.release()
+    columns.append(ANSWERS[0])
+    assert len(columns) == 5
+
+
+def test_columns_to_numpy(columns):
+    numpy = pytest.importorskip("numpy")
+
+    views = columns.to_numpy("views")
+    codes = columns.to_numpy("social_platform")
+
+    assert views.dtype == numpy.int64
+    assert int(views.sum()) == 157
+    assert codes.tolist() == [0, 1, 0, 0]
+
+
+def test_columns_to_numpy_without_numpy(columns, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ConfigurationError):
+        columns.to_numpy("views")
+
+
+def test_columns_reject_unknown_columns_and_answers(columns):
+    with pytest.raises(InvalidUsageError):
+        columns.total("title")
+    with pytest.raises(InvalidUsageError):
+        columns.sum("views", by="url")
+    with pytest.raises(InvalidUsageError):
+        columns.append(AnswersStatistics())
+
+
+def test_columns_reject_counters_outside_int64(columns):
+    answer = AnswersSocialContent(
+        system_id="V9",
+        title="Huge",
+        views=2**63,
+        publish_date=None,
+        analysis_status=analysis("YouTube"),
+    )
+
+    with pytest.raises(InvalidUsageError):
+        columns.append(answer)
+    assert len(columns.views) == len(columns.subscribers) == len(columns.url) == 4
+
+
+@pytest.mark.asyncio
+async def test_columns_fill_from_iter_statistics():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), FakeStatistics())
+    columns = StatisticsColumns()
+    urls = [
+        "https://fakesocialmedia.com/qsgqsdrr",
+        "https://fakesocialmedia.com/qsgqsdr?content_id=video_fdasfdgfs",
+        "https://othersocialmedia.com/missing",
+    ]
+
+    errors = await columns.fill(foxypack.iter_statistics(urls))
+
+    assert len(columns) == 2
+    assert list(errors) == [urls[2]]
+    assert columns.count(by="kind") == {"container": 1, "content": 1}
@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from datetime import date
 
 import pytest
@@ -6,6 +9,7 @@ from foxypack import FoxyPack
 from foxypack.exceptions import (
     ConfigurationError,
     FoxyError,
+    InvalidUsageError,
     UnsupportedOperationError,
 )
 from foxypack.foxypack_abc.answers import (
@@ -332,3 +336,218 @@ def test_foxypack_with_initial_queues_and_adding_more_deduplicates_same_classes(
 
     assert len(foxypack._queue_foxy_analysis) == 1
     assert len(foxypack._queue_foxy_statistics) == 1
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_statistics_many_keeps_input_order_and_errors():
+    foxypack = FoxyPack().with_module(
+        foxy_analysis=FakeAnalysis(),
+        foxy_statistics=FakeStatistics(),
+    )
+
+    results = await foxypack.get_statistics_many(
+        [
+            "https://fakesocialmedia.com/qsgqsdrr",
+            "https://invalidmedia.com/qsgqsdrr",
+            "https://fakesocialmedia.com/qsgqsdr?content_id=video_fdasfdgfs",
+        ],
+        concurrency=2,
+    )
+
+    assert len(results) == 3
+    assert isinstance(results[0], AnswersSocialContainer)
+    assert isinstance(results[1], UnsupportedOperationError)
+    assert isinstance(results[2], AnswersSocialContent)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_statistics_many_respects_concurrency():
+    in_flight = 0
+    peak = 0
+
+    class TrackingFakeStat(FakeStatistics):
+        async def get_statistics_async(self, answers_analysis):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.get_statistics(answers_analysis)
+
+    foxypack = FoxyPack().with_module(FakeAnalysis(), TrackingFakeStat())
+
+    results = await foxypack.get_statistics_many(
+        (f"https://fakesocialmedia.com/channel{i}" for i in range(20)),
+        concurrency=3,
+    )
+
+    assert len(results) == 20
+    assert all(isinstance(result, AnswersSocialContainer) for result in results)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_statistics_many_rejects_invalid_concurrency():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), FakeStatistics())
+
+    with pytest.raises(InvalidUsageError):
+        await foxypack.get_statistics_many([], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_iter_statistics_yields_results_and_errors():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), FakeStatistics())
+    urls = [
+        "https://fakesocialmedia.com/qsgqsdrr",
+        "https://invalidmedia.com/qsgqsdrr",
+    ]
+
+    results = dict([pair async for pair in foxypack.iter_statistics(urls)])
+
+    assert isinstance(results[urls[0]], AnswersSocialContainer)
+    assert isinstance(results[urls[1]], UnsupportedOperationError)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_iter_statistics_bounds_in_flight_and_reads_lazily():
+    in_flight = 0
+    peak = 0
+    produced = 0
+
+    class TrackingFakeStat(FakeStatistics):
+        async def get_statistics_async(self, answers_analysis):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return self.get_statistics(answers_analysis)
+
+    async def endless_urls():
+        nonlocal produced
+        while True:
+            produced += 1
+            yield f"https://fakesocialmedia.com/channel{produced}"
+
+    foxypack = FoxyPack().with_module(FakeAnalysis(), TrackingFakeStat())
+    stream = foxypack.iter_statistics(endless_urls(), concurrency=4)
+
+    received = 0
+    async for _, result in stream:
+        assert isinstance(result, AnswersSocialContainer)
+        received += 1
+        if received == 50:
+            break
+    await stream.aclose()
+
+    assert peak <= 4
+    assert produced <= received + 5
+
+
+@pytest.mark.asyncio
+async def test_foxypack_iter_statistics_yields_as_completed():
+    class SlowFirstStat(FakeStatistics):
+        async def get_statistics_async(self, answers_analysis):
+            if answers_analysis.url.endswith("slow"):
+                await asyncio.sleep(0.05)
+            return self.get_statistics(answers_analysis)
+
+    foxypack = FoxyPack().with_module(FakeAnalysis(), SlowFirstStat())
+    urls = ["https://fakesocialmedia.com/slow", "https://fakesocialmedia.com/fast"]
+
+    order = [url async for url, _ in foxypack.iter_statistics(urls)]
+
+    assert order == list(reversed(urls))
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_analysis_async_runs_sync_analysis_in_thread():
+    main_thread = threading.get_ident()
+    seen_threads = []
+
+    class ThreadRecordingAnalysis(FakeAnalysis):
+        def get_analysis(self, url: str):
+            seen_threads.append(threading.get_ident())
+            return super().get_analysis(url)
+
+    foxypack = FoxyPack().with_module(ThreadRecordingAnalysis())
+
+    analysis = await foxypack.get_analysis_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert analysis.type_content == "channel"
+    assert seen_threads and seen_threads[0] != main_thread
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_analysis_async_prefers_native_async_analysis():
+    class NativeAsyncAnalysis(FakeAnalysis):
+        def get_analysis(self, url: str):
+            raise AssertionError("sync path must not be used")
+
+        async def get_analysis_async(self, url: str):
+            await asyncio.sleep(0)
+            return FakeAnalysis().get_analysis(url)
+
+    foxypack = FoxyPack().with_module(NativeAsyncAnalysis(), FakeStatistics())
+
+    statistics = await foxypack.get_statistics_async(
+        "https://fakesocialmedia.com/qsgqsdrr"
+    )
+
+    assert isinstance(statistics, AnswersSocialContainer)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_get_analysis_async_invalid_url_raises_unsupported():
+    foxypack = FoxyPack().with_module(FakeAnalysis())
+
+    with pytest.raises(UnsupportedOperationError):
+        await foxypack.get_analysis_async("https://invalidmedia.com/qsgqsdrr")
+
+
+class BlockingFakeStat(FakeStatistics):
+    native_async = False
+
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get_statistics(self, answers_analysis):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return super().get_statistics(answers_analysis)
+
+    async def get_statistics_async(self, answers_analysis):
+        return self.get_statistics(answers_analysis)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_runs_sync_only_statistics_in_thread_pool():
+    statistics = BlockingFakeStat()
+
+    with FoxyPack(max_workers=4).with_module(FakeAnalysis(), statistics) as foxypack:
+        started = time.perf_counter()
+        results = await foxypack.get_statistics_many(
+            [f"https://fakesocialmedia.com/channel{i}" for i in range(4)]
+        )
+        elapsed = time.perf_counter() - started
+
+    assert all(isinstance(result, AnswersSocialContainer) for result in results)
+    assert all(name.startswith("foxypack") for name in statistics.threads)
+    assert elapsed < 0.15
+    assert foxypack._executor is None
+
+
+@pytest.mark.asyncio
+async def test_foxypack_without_thread_pool_calls_async_statistics_inline():
+    statistics = BlockingFakeStat()
+    foxypack = FoxyPack().with_module(FakeAnalysis(), statistics)
+
+    await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert statistics.threads == {threading.current_thread().name}
+
+
+def test_foxypack_rejects_invalid_max_workers():
+    with pytest.raises(ConfigurationError):
+        FoxyPack(max_workers=0)
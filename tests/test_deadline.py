@@ -0,0 +1,183 @@
+import asyncio
+import builtins
+import time
+
+import pytest
+
+from foxypack import (
+    AdaptiveBalancer,
+    ConfigurationError,
+    FoxyPack,
+    InvalidUsageError,
+    ServiceUnavailableError,
+    TimeoutError,
+    remaining_time,
+)
+from foxypack.deadline import deadline, share, within_deadline
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class HangingFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = False
+
+    async def get_statistics_async(self, answers_analysis):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.get_statistics(answers_analysis)
+
+
+class SlowFailingFakeStatistics(FakeStatistics):
+    def get_statistics(self, answers_analysis):
+        time.sleep(0.15)
+        raise ServiceUnavailableError()
+
+
+class BudgetFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.budgets: list[float | None] = []
+
+    def get_statistics(self, answers_analysis):
+        self.budgets.append(remaining_time())
+        return super().get_statistics(answers_analysis)
+
+
+def test_nested_deadline_keeps_the_earlier_end():
+    assert remaining_time() is None
+    with deadline(1.0):
+        with deadline(10.0):
+            assert 0 < remaining_time() <= 1.0
+        with deadline(0.5):
+            assert share(2) <= 0.25
+    assert remaining_time() is None
+
+
+def test_modules_see_their_share_of_the_deadline():
+    module = BudgetFakeStatistics()
+    foxypack = FoxyPack().with_module(FakeAnalysis(), module)
+
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", timeout=1.0)
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert 0 < module.budgets[0] <= 1.0
+    assert module.budgets[1] is None
+
+
+def test_sync_lookup_raises_timeout_when_the_budget_runs_out():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), SlowFailingFakeStatistics())
+
+    with pytest.raises(TimeoutError) as exc_info:
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", timeout=0.1)
+
+    assert exc_info.value.details["attempts"][0]["outcome"] == (
+        "ServiceUnavailableError"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_lookup_cancels_hanging_module():
+    module = HangingFakeStatistics()
+    foxypack = FoxyPack().with_module(FakeAnalysis(), module)
+
+    started = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        await foxypack.get_statistics_async(
+            "https://fakesocialmedia.com/qsgqsdrr", timeout=0.1
+        )
+
+    assert time.perf_counter() - started < 1
+    assert module.cancelled
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_raises_the_given_timeout_error():
+    with deadline(0.01), pytest.raises(TimeoutError) as error:
+        await within_deadline(
+            asyncio.sleep(1),
+            {},
+            lambda: TimeoutError("Lookup timed out", details={"attempts": []}),
+        )
+
+    assert error.value.details == {"attempts": []}
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_keeps_timeouts_raised_by_the_awaitable():
+    async def client_timeout():
+        raise builtins.TimeoutError("read timed out")
+
+    with deadline(1.0), pytest.raises(builtins.TimeoutError) as error:
+        await within_deadline(client_timeout(), {})
+
+    assert not isinstance(error.value, TimeoutError)
+
+
+class FailingFakeStatistics(FakeStatistics):
+    async def get_statistics_async(self, answers_analysis):
+        raise ServiceUnavailableError()
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_error_carries_attempts():
+    balancer = AdaptiveBalancer()
+    balancer.record(FailingFakeStatistics(), "FakeSocialMedia", 0.001, True)
+    balancer.record(HangingFakeStatistics(), "FakeSocialMedia", 1.0, True)
+    foxypack = (
+        FoxyPack(balancer=balancer)
+        .with_module(FakeAnalysis(), FailingFakeStatistics())
+        .with_module(FakeAnalysis(), HangingFakeStatistics())
+    )
+
+    with pytest.raises(TimeoutError) as error:
+        await foxypack.get_statistics_async(
+            "https://fakesocialmedia.com/qsgqsdrr", timeout=0.1
+        )
+
+    modules = [record["module"] for record in error.value.details["attempts"]]
+    assert "FailingFakeStatistics" in modules
+    assert isinstance(error.value.__cause__, ExceptionGroup)
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_is_split_across_fallback_modules():
+    balancer = AdaptiveBalancer()
+    balancer.record(HangingFakeStatistics(), "FakeSocialMedia", 0.001, True)
+    balancer.record(FakeStatistics(), "FakeSocialMedia", 1.0, True)
+    foxypack = (
+        FoxyPack(balancer=balancer)
+        .with_module(FakeAnalysis(), HangingFakeStatistics())
+        .with_module(FakeAnalysis(), FakeStatistics())
+    )
+
+    result = await foxypack.get_statistics_async(
+        "https://fakesocialmedia.com/qsgqsdrr", timeout=0.5
+    )
+
+    assert result.system_id == "CH_001"
+
+
+@pytest.mark.asyncio
+async def test_controller_timeout_applies_to_batch_lookups():
+    foxypack = FoxyPack(timeout=0.1).with_module(
+        FakeAnalysis(), HangingFakeStatistics()
+    )
+
+    results = await foxypack.get_statistics_many(
+        ["https://fakesocialmedia.com/qsgqsdrr"] * 3
+    )
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+
+
+def test_timeout_must_be_positive():
+    with pytest.raises(ConfigurationError):
+        FoxyPack(timeout=0)
+    foxypack = FoxyPack().with_module(FakeAnalysis(), FakeStatistics())
+    with pytest.raises(InvalidUsageError):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", timeout=-1)
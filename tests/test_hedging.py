@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+import pytest
+
+from foxypack import (
+    AdaptiveBalancer,
+    ConfigurationError,
+    FoxyPack,
+    HedgingPolicy,
+    ServiceUnavailableError,
+    UnsupportedOperationError,
+)
+from foxypack.foxypack_abc.answers import AnswersSocialContainer
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class DelayedFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.delay = 0.0
+        self.fail = False
+        self.started = 0
+        self.cancelled = 0
+
+    async def get_statistics_async(self, answers_analysis):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ServiceUnavailableError()
+        return self.get_statistics(answers_analysis)
+
+
+class PrimaryFakeStatistics(DelayedFakeStatistics):
+    pass
+
+
+class BackupFakeStatistics(DelayedFakeStatistics):
+    pass
+
+
+def hedged_foxypack(policy: HedgingPolicy):
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={PrimaryFakeStatistics(), BackupFakeStatistics()},
+        hedging_policy=policy,
+    )
+    first, second = foxypack._queue_foxy_statistics
+    return foxypack, first, second
+
+
+def test_hedging_policy_uses_fixed_delay_without_percentile():
+    policy = HedgingPolicy(delay=0.05)
+    policy.record(PrimaryFakeStatistics(), 1.0)
+
+    assert policy.hedge_delay(PrimaryFakeStatistics()) == 0.05
+
+
+def test_hedging_policy_uses_latency_percentile_after_min_samples():
+    policy = HedgingPolicy(delay=0.05, percentile=90, min_samples=10)
+    module = PrimaryFakeStatistics()
+    for latency in range(1, 10):
+        policy.record(module, latency / 100)
+    assert policy.hedge_delay(module) == 0.05
+
+    policy.record(module, 0.10)
+    assert policy.hedge_delay(module) == pytest.approx(0.10)
+    assert policy.hedge_delay(BackupFakeStatistics()) == 0.05
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"delay": -1}, {"max_hedges": 0}, {"percentile": 100}]
+)
+def test_hedging_policy_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        HedgingPolicy(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_hedges_slow_primary_and_cancels_loser():
+    foxypack, first, second = hedged_foxypack(HedgingPolicy(delay=0.01))
+    first.delay = 1.0
+
+    started = time.perf_counter()
+    result = await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0)
+
+    assert isinstance(result, AnswersSocialContainer)
+    assert elapsed < 0.5
+    assert second.started == 1
+    assert first.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_foxypack_hedging_records_cancelled_loser_in_balancer():
+    balancer = AdaptiveBalancer()
+    primary, backup = PrimaryFakeStatistics(), BackupFakeStatistics()
+    primary.delay = 1.0
+    balancer.record(backup, "FakeSocialMedia", 0.01, True)
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={primary, backup},
+        hedging_policy=HedgingPolicy(delay=0.01),
+        balancer=balancer,
+    )
+    trace = []
+
+    await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr", trace)
+
+    health = balancer.snapshot()[("PrimaryFakeStatistics", "FakeSocialMedia")]
+    assert health.success == 0.0
+    assert health.latency >= 0.01
+    assert balancer.order([primary, backup], "FakeSocialMedia") == [backup, primary]
+    assert ("PrimaryFakeStatistics", "cancelled") in [
+        (record.module, record.outcome) for record in trace
+    ]
+
+
+@pytest.mark.asyncio
+async def test_foxypack_does_not_hedge_fast_primary():
+    foxypack, first, second = hedged_foxypack(HedgingPolicy(delay=0.5))
+
+    await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert first.started == 1
+    assert second.started == 0
+
+
+@pytest.mark.asyncio
+async def test_foxypack_hedging_falls_back_immediately_on_failure():
+    foxypack, first, second = hedged_foxypack(HedgingPolicy(delay=10))
+    first.fail = True
+
+    started = time.perf_counter()
+    result = await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert isinstance(result, AnswersSocialContainer)
+    assert time.perf_counter() - started < 1
+    assert second.started == 1
+
+
+@pytest.mark.asyncio
+async def test_foxypack_hedging_raises_when_all_modules_fail():
+    foxypack, first, second = hedged_foxypack(HedgingPolicy(delay=0.001))
+    first.fail = second.fail = True
+    first.delay = 0.01
+
+    with pytest.raises(UnsupportedOperationError):
+        await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
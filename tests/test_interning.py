@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+
+from foxypack import (
+    AnalysisPool,
+    AnswersAnalysis,
+    AnswersSocialContent,
+    ConfigurationError,
+    FoxyPack,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+URL = "https://fakesocialmedia.com/qsgqsdrr"
+
+
+def analysis(url: str = URL, platform: str = "Fake") -> AnswersAnalysis:
+    # Built at runtime so equal values start out as distinct objects.
+    return AnswersAnalysis(
+        url=url, social_platform=f"{platform}Social", type_content="channel"
+    )
+
+
+def test_analysis_strings_are_interned():
+    first, second = analysis(), analysis()
+
+    assert first.social_platform is second.social_platform
+    assert first.type_content is second.type_content
+
+
+def test_pool_returns_shared_instance():
+    pool = AnalysisPool()
+    first = pool.intern(analysis())
+
+    assert pool.intern(analysis()) is first
+    assert pool.intern(analysis("https://fakesocialmedia.com/other")) is not first
+    assert len(pool) == 2
+
+
+def test_pool_shares_statistics_analysis():
+    pool = AnalysisPool()
+    shared = pool.intern(analysis())
+    answer = AnswersSocialContent(
+        system_id="V1",
+        title="Video",
+        views=1,
+        publish_date=date(2024, 1, 1),
+        analysis_status=analysis(),
+    )
+
+    assert pool.share(answer) is answer
+    assert answer.analysis_status is shared
+
+
+@dataclass(slots=True, kw_only=True)
+class ChannelAnalysis(AnswersAnalysis):
+    channel_id: str
+
+
+def test_pool_keeps_analysis_subclasses_apart():
+    pool = AnalysisPool()
+    pool.intern(analysis())
+    channel = ChannelAnalysis(
+        url=URL, social_platform="FakeSocial", type_content="channel", channel_id="C1"
+    )
+
+    assert pool.intern(channel) is channel
+    assert pool.intern(analysis()) is not channel
+    assert len(pool) == 1
+
+
+def test_pool_evicts_least_recently_used():
+    pool = AnalysisPool(maxsize=2)
+    first = pool.intern(analysis("https://fakesocialmedia.com/a"))
+    pool.intern(analysis("https://fakesocialmedia.com/b"))
+    pool.intern(analysis("https://fakesocialmedia.com/a"))
+    pool.intern(analysis("https://fakesocialmedia.com/c"))
+
+    assert len(pool) == 2
+    assert pool.intern(analysis("https://fakesocialmedia.com/a")) is first
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_pool_rejects_invalid_maxsize():
+    with pytest.raises(ConfigurationError):
+        AnalysisPool(maxsize=0)
+
+
+def test_controller_reuses_pooled_analysis():
+    foxypack = FoxyPack(analysis_pool=AnalysisPool()).with_module(
+        FakeAnalysis(), FakeStatistics()
+    )
+
+    first = foxypack.get_analysis(URL)
+
+    assert foxypack.get_analysis(URL) is first
+    assert foxypack.get_statistics(URL).analysis_status is first
+
+
+@pytest.mark.asyncio
+async def test_controller_reuses_pooled_analysis_async():
+    foxypack = FoxyPack(analysis_pool=AnalysisPool()).with_module(
+        FakeAnalysis(), FakeStatistics()
+    )
+
+    first = await foxypack.get_analysis_async(URL)
+    statistics = await foxypack.get_statistics_async(URL)
+
+    assert statistics.analysis_status is first
@@ -0,0 +1,93 @@
+import pytest
+
+from foxypack import (
+    CircuitBreakers,
+    FoxyMetrics,
+    FoxyPack,
+    InMemoryMetrics,
+    ServiceUnavailableError,
+    UnsupportedOperationError,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class DownFakeStatistics(FakeStatistics):
+    def get_statistics(self, answers_analysis):
+        raise ServiceUnavailableError()
+
+
+def series(metrics: InMemoryMetrics, stage: str, module: str) -> dict:
+    matches = [
+        item
+        for item in metrics.snapshot()
+        if item["stage"] == stage and item["module"] == module
+    ]
+    assert len(matches) == 1
+    return matches[0]
+
+
+def test_foxy_metrics_base_class_is_a_no_op():
+    FoxyMetrics().observe("statistics", "Module", "Platform", "ok", 0.1)
+
+
+def test_in_memory_metrics_builds_cumulative_histogram():
+    metrics = InMemoryMetrics(buckets=(0.1, 1.0))
+    metrics.observe("statistics", "M", "P", "ok", 0.05)
+    metrics.observe("statistics", "M", "P", "ok", 0.1)
+    metrics.observe("statistics", "M", "P", "TimeoutError", 5.0)
+
+    item = series(metrics, "statistics", "M")
+
+    assert item["platform"] == "P"
+    assert item["count"] == 3
+    assert item["sum"] == pytest.approx(5.15)
+    assert item["outcomes"] == {"ok": 2, "TimeoutError": 1}
+    assert item["buckets"] == {"0.1": 2, "1.0": 2, "inf": 3}
+
+
+def test_in_memory_metrics_reset():
+    metrics = InMemoryMetrics()
+    metrics.observe("analysis", "M", "P", "ok", 0.01)
+    metrics.reset()
+
+    assert metrics.snapshot() == []
+
+
+def test_foxypack_records_analysis_and_statistics_calls():
+    metrics = InMemoryMetrics()
+    foxypack = FoxyPack(metrics=metrics).with_module(FakeAnalysis(), FakeStatistics())
+
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    analysis = series(metrics, "analysis", "FakeAnalysis")
+    statistics = series(metrics, "statistics", "FakeStatistics")
+    assert analysis["count"] == 1
+    assert analysis["platform"] == "FakeSocialMedia"
+    assert statistics["outcomes"] == {"ok": 1}
+
+
+def test_foxypack_records_failures_by_error_type_and_open_circuits():
+    metrics = InMemoryMetrics()
+    foxypack = FoxyPack(
+        metrics=metrics,
+        circuit_breakers=CircuitBreakers(failure_threshold=1),
+    ).with_module(FakeAnalysis(), DownFakeStatistics())
+
+    for _ in range(2):
+        with pytest.raises(UnsupportedOperationError):
+            foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    item = series(metrics, "statistics", "DownFakeStatistics")
+    assert item["outcomes"] == {"ServiceUnavailableError": 1, "circuit_open": 1}
+
+
+@pytest.mark.asyncio
+async def test_foxypack_records_async_calls():
+    metrics = InMemoryMetrics()
+    foxypack = FoxyPack(metrics=metrics).with_module(FakeAnalysis(), FakeStatistics())
+
+    await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert series(metrics, "analysis", "FakeAnalysis")["count"] == 1
+    assert series(metrics, "statistics", "FakeStatistics")["sum"] >= 0.1
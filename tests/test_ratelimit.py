@@ -0,0 +1,151 @@
+import asyncio
+import time
+
+import pytest
+
+from foxypack import (
+    ConfigurationError,
+    FoxyPack,
+    RateLimit,
+    RateLimiter,
+    TimeoutError,
+    TokenBucket,
+)
+from foxypack.deadline import deadline
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_rate_limit_rejects_invalid_values(rate, burst):
+    with pytest.raises(ConfigurationError):
+        RateLimit(rate=rate, burst=burst)
+
+
+def test_token_bucket_allows_burst_then_queues_reservations():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=2, burst=3), clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=1, burst=2), clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 100
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_reserve_respects_max_wait():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=2, burst=1), clock)
+    bucket.reserve()
+
+    assert bucket.reserve(max_wait=0.1) is None
+    assert bucket.reserve(max_wait=1.0) == pytest.approx(0.5)
+
+
+def test_token_bucket_fails_fast_when_wait_overruns_deadline():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=1, burst=1), clock)
+    bucket.acquire()
+
+    started = time.perf_counter()
+    with deadline(0.5), pytest.raises(TimeoutError):
+        bucket.acquire()
+
+    assert time.perf_counter() - started < 0.1
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_cancelled_waiter_gives_token_back():
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=1, burst=1), clock)
+    bucket.reserve()
+    waiter = asyncio.ensure_future(bucket.acquire_async())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_rate_limiter_uses_default_per_platform_and_skips_unlimited():
+    limiter = RateLimiter(
+        limits={"FakeSocialMedia": RateLimit(rate=10, burst=1)},
+    )
+
+    assert limiter.bucket_for("FakeSocialMedia") is not None
+    assert limiter.bucket_for("Other") is None
+
+    limiter = RateLimiter(default=RateLimit(rate=10))
+    first = limiter.bucket_for("A")
+    assert first is not None
+    assert limiter.bucket_for("A") is first
+    assert limiter.bucket_for("B") is not first
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_serves_async_waiters_in_arrival_order():
+    bucket = TokenBucket(RateLimit(rate=100, burst=1))
+    order = []
+
+    async def waiter(index):
+        await bucket.acquire_async()
+        order.append(index)
+
+    await asyncio.gather(*(waiter(index) for index in range(5)))
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_foxypack_rate_limits_sync_statistics_by_platform():
+    limiter = RateLimiter({"FakeSocialMedia": RateLimit(rate=50, burst=1)})
+    foxypack = FoxyPack(rate_limiter=limiter).with_module(
+        FakeAnalysis(), FakeStatistics()
+    )
+
+    started = time.perf_counter()
+    for _ in range(4):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_foxypack_rate_limits_async_statistics_by_platform():
+    class InstantFakeStatistics(FakeStatistics):
+        async def get_statistics_async(self, answers_analysis):
+            return self.get_statistics(answers_analysis)
+
+    limiter = RateLimiter({"FakeSocialMedia": RateLimit(rate=50, burst=2)})
+    foxypack = FoxyPack(rate_limiter=limiter).with_module(
+        FakeAnalysis(), InstantFakeStatistics()
+    )
+
+    started = time.perf_counter()
+    await foxypack.get_statistics_many(
+        [f"https://fakesocialmedia.com/channel{i}" for i in range(5)]
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.05
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from foxypack import (
+    CircuitBreakers,
+    ConfigurationError,
+    ContentNotFoundError,
+    FoxyPack,
+    RetryBudget,
+    RetryPolicy,
+    ServiceUnavailableError,
+    UnsupportedOperationError,
+)
+from foxypack.foxypack_abc.answers import AnswersSocialContainer
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class FlakyFakeStatistics(FakeStatistics):
+    def __init__(self, failures: int, error: Exception | None = None) -> None:
+        super().__init__()
+        self.failures = failures
+        self.error = error or ServiceUnavailableError()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return super().get_statistics(answers_analysis)
+
+    async def get_statistics_async(self, answers_analysis):
+        return self.get_statistics(answers_analysis)
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.001, max_delay=0.001, **kwargs)
+
+
+def test_retry_budget_spends_and_replenishes_tokens():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
+    budget.deposit()
+    assert budget.withdraw() is False
+    budget.deposit()
+    assert budget.withdraw() is True
+
+
+def test_retry_budget_caps_saved_tokens():
+    budget = RetryBudget(ratio=1, max_tokens=2)
+    for _ in range(10):
+        budget.deposit()
+
+    assert budget.tokens == 2
+
+
+def test_retry_policy_only_retries_transient_errors():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry(ServiceUnavailableError(), 1) is True
+    assert policy.should_retry(ServiceUnavailableError(), 3) is False
+    assert policy.should_retry(ContentNotFoundError(), 1) is False
+
+
+def test_retry_policy_backoff_uses_capped_full_jitter():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, rng=random.Random(7))
+
+    delays = [policy.backoff(attempt) for attempt in (1, 2, 3, 4) for _ in range(50)]
+
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert max(policy.backoff(1) for _ in range(50)) <= 0.1
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"max_attempts": 0}, {"base_delay": -1}, {"max_delay": -1}]
+)
+def test_retry_policy_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ConfigurationError):
+        RetryPolicy(**kwargs)
+
+
+def test_foxypack_retries_transient_errors():
+    statistics = FlakyFakeStatistics(failures=2)
+    foxypack = FoxyPack(retry_policy=fast_policy(max_attempts=3)).with_module(
+        FakeAnalysis(), statistics
+    )
+
+    result = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert isinstance(result, AnswersSocialContainer)
+    assert statistics.calls == 3
+
+
+def test_foxypack_does_not_retry_permanent_errors():
+    statistics = FlakyFakeStatistics(failures=1, error=ContentNotFoundError())
+    foxypack = FoxyPack(retry_policy=fast_policy()).with_module(
+        FakeAnalysis(), statistics
+    )
+
+    with pytest.raises(ContentNotFoundError):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert statistics.calls == 1
+
+
+def test_foxypack_stops_retrying_when_budget_is_spent():
+    statistics = FlakyFakeStatistics(failures=100)
+    policy = fast_policy(max_attempts=5, budget=RetryBudget(ratio=0, max_tokens=2))
+    foxypack = FoxyPack(retry_policy=policy).with_module(FakeAnalysis(), statistics)
+
+    for _ in range(3):
+        with pytest.raises(UnsupportedOperationError):
+            foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert statistics.calls == 3 + 2
+
+
+def test_foxypack_stops_retrying_when_circuit_opens():
+    statistics = FlakyFakeStatistics(failures=100)
+    foxypack = FoxyPack(
+        retry_policy=fast_policy(max_attempts=5),
+        circuit_breakers=CircuitBreakers(failure_threshold=2),
+    ).with_module(FakeAnalysis(), statistics)
+
+    with pytest.raises(UnsupportedOperationError):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert statistics.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_foxypack_retries_transient_errors_async():
+    statistics = FlakyFakeStatistics(failures=1)
+    foxypack = FoxyPack(retry_policy=fast_policy()).with_module(
+        FakeAnalysis(), statistics
+    )
+
+    result = await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert isinstance(result, AnswersSocialContainer)
+    assert statistics.calls == 2
@@ -0,0 +1,290 @@
+import pytest
+
+from foxypack import (
+    AnswersAnalysis,
+    ConfigurationError,
+    FoxyAnalysis,
+    FoxyPack,
+    UnsupportedOperationError,
+)
+from foxypack.routing import AnalysisRouter, StatisticsDispatcher, normalize_host
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class VideoHostAnalysis(FoxyAnalysis):
+    supported_hosts = ("videohost.com", "vh.be")
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        return AnswersAnalysis(
+            url=url, social_platform="VideoHost", type_content="video"
+        )
+
+
+class ShortLinkAnalysis(FoxyAnalysis):
+    supported_url_patterns = (r"https?://links\.example\.com/v/",)
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        return AnswersAnalysis(url=url, social_platform="Links", type_content="video")
+
+
+class CountingAnalysis(FoxyAnalysis):
+    supported_hosts = ("counted.com",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        self.calls += 1
+        return AnswersAnalysis(url=url, social_platform="Counted", type_content="post")
+
+
+@pytest.mark.parametrize(
+    "host, expected",
+    [
+        ("VideoHost.com", "videohost.com"),
+        ("www.videohost.com", "videohost.com"),
+        ("videohost.com:443", "videohost.com"),
+        ("videohost.com.", "videohost.com"),
+    ],
+)
+def test_normalize_host(host, expected):
+    assert normalize_host(host) == expected
+
+
+def test_router_routes_by_host_and_subdomain():
+    module = VideoHostAnalysis()
+    router = AnalysisRouter([module, ShortLinkAnalysis()])
+
+    assert router.route("https://videohost.com/watch?v=1") == [module]
+    assert router.route("https://WWW.VideoHost.com/watch?v=1") == [module]
+    assert router.route("https://m.videohost.com/watch?v=1") == [module]
+    assert router.route("http://vh.be:8080/abc") == [module]
+
+
+def test_router_routes_by_pattern():
+    module = ShortLinkAnalysis()
+    router = AnalysisRouter([VideoHostAnalysis(), module])
+
+    assert router.route("https://links.example.com/v/123") == [module]
+    assert router.route("https://links.example.com/other/123") == []
+
+
+class PostIdAnalysis(FoxyAnalysis):
+    supported_url_patterns = (r"https?://posts\.example\.com/(?P<id>\d+)",)
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        return AnswersAnalysis(url=url, social_platform="Posts", type_content="post")
+
+
+class ClipIdAnalysis(FoxyAnalysis):
+    supported_url_patterns = (
+        r"https?://clips\.example\.com/(?P<id>\d+)",
+        r"https?://clips\.example\.com/(\d+)/\1",
+    )
+
+    def get_analysis(self, url: str) -> AnswersAnalysis:
+        return AnswersAnalysis(url=url, social_platform="Clips", type_content="video")
+
+
+def test_router_matches_patterns_sharing_group_names():
+    posts, clips = PostIdAnalysis(), ClipIdAnalysis()
+    router = AnalysisRouter([posts, clips])
+
+    assert router.route("https://posts.example.com/12") == [posts]
+    assert router.route("https://clips.example.com/7/7") == [clips]
+    assert router.route("https://clips.example.com/x") == []
+
+
+def test_foxypack_analyzes_with_patterns_sharing_group_names():
+    foxypack = FoxyPack().with_module(PostIdAnalysis()).with_module(ClipIdAnalysis())
+
+    result = foxypack.get_analysis("https://clips.example.com/7")
+
+    assert result.social_platform == "Clips"
+
+
+class BrokenPatternAnalysis(ShortLinkAnalysis):
+    supported_url_patterns = (r"https?://broken\.example\.com/(",)
+
+
+def test_router_rejects_invalid_pattern_naming_the_module():
+    with pytest.raises(ConfigurationError) as error:
+        AnalysisRouter([BrokenPatternAnalysis()])
+
+    assert error.value.details["module"] == "BrokenPatternAnalysis"
+
+
+def test_router_appends_unrouted_modules_after_routed():
+    routed = VideoHostAnalysis()
+    legacy = FakeAnalysis()
+    router = AnalysisRouter([legacy, routed])
+
+    assert router.unrouted == (legacy,)
+    assert router.route("https://videohost.com/watch") == [routed, legacy]
+    assert router.route("https://unknown.com/") == [legacy]
+
+
+def test_foxypack_routes_directly_to_declared_module():
+    counting = CountingAnalysis()
+    foxypack = FoxyPack().with_module(VideoHostAnalysis()).with_module(counting)
+
+    analysis = foxypack.get_analysis("https://videohost.com/watch?v=1")
+
+    assert analysis.social_platform == "VideoHost"
+    assert counting.calls == 0
+
+
+def test_foxypack_unmatched_url_fails_fast_without_unrouted_modules():
+    counting = CountingAnalysis()
+    foxypack = FoxyPack().with_module(VideoHostAnalysis()).with_module(counting)
+
+    with pytest.raises(UnsupportedOperationError) as exc_info:
+        foxypack.get_analysis("https://unknown.com/abc")
+
+    assert exc_info.value.details == {"url": "https://unknown.com/abc"}
+    assert counting.calls == 0
+
+
+def test_foxypack_rebuilds_router_after_with_module():
+    foxypack = FoxyPack().with_module(VideoHostAnalysis())
+
+    with pytest.raises(UnsupportedOperationError):
+        foxypack.get_analysis("https://links.example.com/v/1")
+
+    foxypack.with_module(ShortLinkAnalysis())
+
+    assert foxypack.get_analysis("https://links.example.com/v/1").social_platform == (
+        "Links"
+    )
+
+
+class VideoOnlyStatistics(FakeStatistics):
+    supported_platforms = ("VideoHost",)
+    supported_content_types = ("video",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+
+class FakeSocialMediaStatistics(FakeStatistics):
+    supported_platforms = ("FakeSocialMedia",)
+
+
+def test_statistics_dispatcher_filters_by_platform_and_content_type():
+    video_only = VideoOnlyStatistics()
+    fake_only = FakeSocialMediaStatistics()
+    anything = FakeStatistics()
+    dispatcher = StatisticsDispatcher([video_only, fake_only, anything])
+
+    assert dispatcher.modules_for("VideoHost", "video") == (video_only, anything)
+    assert dispatcher.modules_for("VideoHost", "channel") == (anything,)
+    assert dispatcher.modules_for("FakeSocialMedia", "video") == (
+        fake_only,
+        anything,
+    )
+
+
+def test_statistics_dispatcher_reuses_resolved_entries():
+    dispatcher = StatisticsDispatcher([VideoOnlyStatistics()])
+
+    first = dispatcher.modules_for("VideoHost", "video")
+
+    assert dispatcher.modules_for("VideoHost", "video") is first
+    assert dispatcher.modules_for("Other", "video") == ()
+
+
+def test_foxypack_only_calls_eligible_statistics_modules():
+    video_only = VideoOnlyStatistics()
+    foxypack = FoxyPack(
+        queue_foxy_analysis={FakeAnalysis()},
+        queue_foxy_statistics={video_only, FakeSocialMediaStatistics()},
+    )
+
+    result = foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert result.analysis_status.social_platform == "FakeSocialMedia"
+    assert video_only.calls == 0
+
+
+def test_foxypack_without_eligible_statistics_module_raises_unsupported():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), VideoOnlyStatistics())
+
+    with pytest.raises(UnsupportedOperationError) as exc_info:
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert exc_info.value.details["social_platform"] == "FakeSocialMedia"
+
+
+class ChannelOnlyAnalysis(FakeAnalysis):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def supports(self, url: str) -> bool:
+        return "content_id=" not in url
+
+    def get_analysis(self, url: str):
+        self.calls += 1
+        return super().get_analysis(url)
+
+
+class ChannelOnlyStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def supports(self, answers_analysis) -> bool:
+        return answers_analysis.type_content == "channel"
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+
+def test_router_skips_modules_rejecting_the_url():
+    module = ChannelOnlyAnalysis()
+    router = AnalysisRouter([module])
+
+    assert router.route("https://fakesocialmedia.com/qsgqsdrr") == [module]
+    assert router.route("https://fakesocialmedia.com/x?content_id=video_1") == []
+
+
+def test_foxypack_skips_analysis_module_without_calling_it():
+    module = ChannelOnlyAnalysis()
+    foxypack = FoxyPack().with_module(module)
+
+    with pytest.raises(UnsupportedOperationError):
+        foxypack.get_analysis("https://fakesocialmedia.com/x?content_id=video_1")
+
+    assert module.calls == 0
+
+
+def test_statistics_dispatcher_applies_supports_check():
+    channel_only = ChannelOnlyStatistics()
+    anything = FakeStatistics()
+    dispatcher = StatisticsDispatcher([channel_only, anything])
+
+    def analysis(type_content):
+        return AnswersAnalysis(
+            url="https://fakesocialmedia.com/x",
+            social_platform="FakeSocialMedia",
+            type_content=type_content,
+        )
+
+    assert dispatcher.applicable(analysis("channel")) == (channel_only, anything)
+    assert dispatcher.applicable(analysis("video")) == (anything,)
+
+
+def test_foxypack_skips_statistics_module_without_calling_it():
+    channel_only = ChannelOnlyStatistics()
+    foxypack = FoxyPack().with_module(FakeAnalysis(), channel_only)
+
+    with pytest.raises(UnsupportedOperationError):
+        foxypack.get_statistics("https://fakesocialmedia.com/x?content_id=video_1")
+
+    assert channel_only.calls == 0
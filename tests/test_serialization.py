@@ -0,0 +1,219 @@
+import dataclasses
+import io
+from datetime import date
+
+import pytest
+
+from foxypack import (
+    AnswersAnalysis,
+    AnswersSocialContainer,
+    AnswersSocialContent,
+    AnswersStatistics,
+    ConfigurationError,
+    InvalidUsageError,
+    SQLiteCache,
+)
+from foxypack.serialization import (
+    JSONLinesWriter,
+    decode_binary,
+    encode_binary,
+    from_dict,
+    read_json_lines,
+    register,
+    to_dict,
+)
+
+ANALYSIS = AnswersAnalysis(
+    url="https://fakesocialmedia.com/qsgqsdr?content_id=video_fdasfdgfs",
+    social_platform="FakeSocialMedia",
+    type_content="video",
+)
+ANSWERS = [
+    ANALYSIS,
+    AnswersSocialContent(
+        system_id="VID_001",
+        title="Обзор смартфона 2024 🎥",
+        views=125000,
+        publish_date=date(2024, 1, 15),
+        analysis_status=ANALYSIS,
+    ),
+    AnswersSocialContainer(
+        system_id="CH_001",
+        title="",
+        subscribers=-1,
+        creation_date=None,
+        analysis_status=ANALYSIS,
+    ),
+]
+
+
+@register
+@dataclasses.dataclass(slots=True, kw_only=True)
+class RatedContent(AnswersStatistics):
+    rating: float
+    verified: bool
+    note: str | None
+    source: AnswersAnalysis | None
+
+
+@register
+@dataclasses.dataclass(slots=True, kw_only=True)
+class ChannelAnalysis(AnswersAnalysis):
+    channel: str
+
+
+@pytest.mark.parametrize("answer", ANSWERS)
+def test_dict_round_trip(answer):
+    data = to_dict(answer)
+
+    assert data["type"] == type(answer).__name__
+    assert from_dict(data) == answer
+
+
+def test_dict_uses_iso_dates_and_nested_dicts():
+    data = to_dict(ANSWERS[1])
+
+    assert data["publish_date"] == "2024-01-15"
+    assert data["analysis_status"] == {
+        "url": ANALYSIS.url,
+        "social_platform": "FakeSocialMedia",
+        "type_content": "video",
+    }
+
+
+@pytest.mark.parametrize("answer", ANSWERS)
+def test_binary_round_trip(answer):
+    assert decode_binary(encode_binary(answer)) == answer
+
+
+def test_binary_is_smaller_than_json_lines():
+    stream = io.StringIO()
+    JSONLinesWriter(stream).write(ANSWERS[1])
+
+    assert len(encode_binary(ANSWERS[1])) < len(stream.getvalue().encode())
+
+
+def test_json_lines_round_trip():
+    stream = io.StringIO()
+    assert JSONLinesWriter(stream).write_all(ANSWERS) == 3
+
+    lines = stream.getvalue().splitlines(keepends=True)
+    assert len(lines) == 3
+    assert list(read_json_lines(io.StringIO(stream.getvalue()))) == ANSWERS
+
+
+@pytest.mark.parametrize(
+    "answer",
+    [
+        RatedContent(rating=4.5, verified=True, note="ok", source=ANALYSIS),
+        RatedContent(rating=-1.0, verified=False, note=None, source=None),
+    ],
+)
+def test_registered_custom_answers_round_trip(answer):
+    assert from_dict(to_dict(answer)) == answer
+    assert decode_binary(encode_binary(answer)) == answer
+
+
+def test_nested_subclasses_keep_their_type():
+    analysis = ChannelAnalysis(
+        url=ANALYSIS.url,
+        social_platform="FakeSocialMedia",
+        type_content="video",
+        channel="CH_001",
+    )
+    answer = dataclasses.replace(ANSWERS[1], analysis_status=analysis)
+
+    data = to_dict(answer)
+
+    assert data["analysis_status"]["type"] == "ChannelAnalysis"
+    for decoded in (from_dict(data), decode_binary(encode_binary(answer))):
+        assert type(decoded.analysis_status) is ChannelAnalysis
+        assert decoded == answer
+
+
+def test_nested_type_must_match_the_field():
+    data = to_dict(ANSWERS[1])
+    data["analysis_status"]["type"] = "AnswersSocialContent"
+
+    with pytest.raises(InvalidUsageError):
+        from_dict(data)
+
+
+def test_register_rejects_clashing_class_names():
+    def make():
+        @dataclasses.dataclass(slots=True, kw_only=True)
+        class Clashing(AnswersStatistics):
+            pass
+
+        return Clashing
+
+    register(make())
+    with pytest.raises(ConfigurationError):
+        register(make())
+
+
+def test_from_dict_can_force_the_class():
+    data = to_dict(ANALYSIS)
+    del data["type"]
+
+    assert from_dict(data, AnswersAnalysis) == ANALYSIS
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"type": "Unknown"},
+        {"url": "x"},
+        {"type": "AnswersAnalysis", "url": "x"},
+        {**to_dict(ANSWERS[1]), "publish_date": "yesterday"},
+    ],
+)
+def test_from_dict_rejects_malformed_data(data):
+    with pytest.raises(InvalidUsageError):
+        from_dict(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"not a record",
+        encode_binary(ANSWERS[1])[:-3],
+        encode_binary(ANSWERS[1]) + b"\x00",
+    ],
+)
+def test_decode_binary_rejects_corrupt_records(data):
+    with pytest.raises(InvalidUsageError):
+        decode_binary(data)
+
+
+def test_encode_binary_rejects_out_of_range_numbers():
+    answer = dataclasses.replace(ANSWERS[1], views=2**70)
+
+    with pytest.raises(InvalidUsageError):
+        encode_binary(answer)
+
+
+def test_serialization_rejects_non_answers():
+    with pytest.raises(InvalidUsageError):
+        to_dict(object())
+
+
+def test_binary_rejects_unsupported_field_types():
+    @dataclasses.dataclass(slots=True, kw_only=True)
+    class Tagged(AnswersStatistics):
+        tags: list[str]
+
+    answer = Tagged(tags=["a"])
+    assert from_dict(to_dict(answer)) == answer
+    with pytest.raises(ConfigurationError):
+        encode_binary(answer)
+
+
+def test_sqlite_cache_with_binary_codec(tmp_path):
+    cache: SQLiteCache[AnswersStatistics] = SQLiteCache(
+        tmp_path / "cache.db", dumps=encode_binary, loads=decode_binary
+    )
+    cache.set("key", ANSWERS[1])
+
+    assert cache.get("key") == ANSWERS[1]
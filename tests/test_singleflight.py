@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from foxypack import (
+    FoxyPack,
+    ServiceUnavailableError,
+    TimeoutError,
+    UnsupportedOperationError,
+)
+from foxypack.deadline import deadline
+from foxypack.singleflight import SingleFlight
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class CountingFakeStatistics(FakeStatistics):
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__()
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_statistics(self, answers_analysis):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        if self.fail:
+            raise ServiceUnavailableError()
+        return super().get_statistics(answers_analysis)
+
+    async def get_statistics_async(self, answers_analysis):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise ServiceUnavailableError()
+        return super().get_statistics(answers_analysis)
+
+
+def test_single_flight_shares_result_between_threads():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    def slow() -> int:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: flight.do("key", slow), range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+
+
+def test_single_flight_shares_exception_between_threads():
+    flight: SingleFlight[int] = SingleFlight()
+
+    def failing() -> int:
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call(_):
+        try:
+            return flight.do("key", failing)
+        except ValueError as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        errors = list(pool.map(call, range(3)))
+
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flight.do("key", lambda: 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_leader_cancellation():
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def slow() -> int:
+        await asyncio.sleep(0.05)
+        return 7
+
+    leader = asyncio.ensure_future(flight.do_async("key", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do_async("key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 7
+
+
+@pytest.mark.asyncio
+async def test_foxypack_coalesces_concurrent_async_calls():
+    statistics = CountingFakeStatistics()
+    foxypack = FoxyPack(coalesce=True).with_module(FakeAnalysis(), statistics)
+
+    results = await asyncio.gather(
+        *(
+            foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+            for _ in range(10)
+        ),
+        foxypack.get_statistics_async("https://www.fakesocialmedia.com/qsgqsdrr/"),
+    )
+
+    assert statistics.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_coalesced_callers_share_errors():
+    statistics = CountingFakeStatistics(fail=True)
+    foxypack = FoxyPack(coalesce=True).with_module(FakeAnalysis(), statistics)
+
+    results = await asyncio.gather(
+        *(
+            foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+            for _ in range(5)
+        ),
+        return_exceptions=True,
+    )
+
+    assert statistics.calls == 1
+    assert all(isinstance(result, UnsupportedOperationError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_foxypack_coalesced_callers_keep_their_own_deadlines():
+    statistics = CountingFakeStatistics()
+    foxypack = FoxyPack(coalesce=True).with_module(FakeAnalysis(), statistics)
+    url = "https://fakesocialmedia.com/qsgqsdrr"
+    leader_trace, follower_trace = [], []
+
+    leader, follower = await asyncio.gather(
+        foxypack.get_statistics_async(url, leader_trace, timeout=0.01),
+        foxypack.get_statistics_async(url, follower_trace, timeout=5),
+        return_exceptions=True,
+    )
+
+    assert isinstance(leader, TimeoutError)
+    assert follower.analysis_status.url == url
+    assert statistics.calls == 1
+    assert [(record.module, record.outcome) for record in follower_trace] == [
+        ("FakeAnalysis", "ok"),
+        ("CountingFakeStatistics", "ok"),
+    ]
+    assert all(record.started >= 0 for record in follower_trace)
+
+
+def test_single_flight_thread_follower_keeps_its_deadline():
+    flight: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+
+    def slow() -> int:
+        started.set()
+        time.sleep(0.5)
+        return 1
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(flight.do, "key", slow)
+        started.wait()
+        begun = time.perf_counter()
+        with deadline(0.05), pytest.raises(TimeoutError):
+            flight.do("key", slow)
+        assert time.perf_counter() - begun < 0.3
+        assert leader.result() == 1
+
+
+def test_foxypack_coalesces_concurrent_sync_calls():
+    statistics = CountingFakeStatistics()
+    foxypack = FoxyPack(coalesce=True).with_module(FakeAnalysis(), statistics)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(
+            pool.map(
+                lambda _: foxypack.get_statistics(
+                    "https://fakesocialmedia.com/qsgqsdrr"
+                ),
+                range(5),
+            )
+        )
+
+    assert statistics.calls == 1
+    assert all(result is results[0] for result in results)
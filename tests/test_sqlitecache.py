@@ -0,0 +1,223 @@
+import multiprocessing
+import threading
+from datetime import date
+
+import pytest
+
+from foxypack import (
+    AnswersAnalysis,
+    AnswersSocialContent,
+    ConfigurationError,
+    FoxyPack,
+    LRUCache,
+    SQLiteCache,
+    StatisticsCache,
+    TieredCache,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingFakeStatistics(FakeStatistics):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_statistics(self, answers_analysis):
+        self.calls += 1
+        return super().get_statistics(answers_analysis)
+
+
+def content(title: str = "Video") -> AnswersSocialContent:
+    return AnswersSocialContent(
+        system_id="VID_001",
+        title=title,
+        views=10,
+        publish_date=date(2024, 1, 15),
+        analysis_status=AnswersAnalysis(
+            url="https://fakesocialmedia.com/v",
+            social_platform="FakeSocialMedia",
+            type_content="video",
+        ),
+    )
+
+
+def write_entries(path: str, worker: int) -> None:
+    cache: SQLiteCache[int] = SQLiteCache(path)
+    for index in range(50):
+        cache.set(f"{worker}-{index}", index)
+    cache.close()
+
+
+def test_sqlite_cache_round_trips_answers(tmp_path):
+    cache: SQLiteCache[AnswersSocialContent] = SQLiteCache(tmp_path / "cache.db")
+
+    cache.set("key", content())
+
+    assert cache.get("key") == content()
+    assert cache.get("other") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_sqlite_cache_survives_reopening(tmp_path):
+    first: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db", ttl=60)
+    first.set("key", "value")
+    first.close()
+
+    second: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db")
+
+    assert second.get("key") == "value"
+
+
+def test_sqlite_cache_expiry_and_stale_entries(tmp_path):
+    clock = FakeClock()
+    cache: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db", clock=clock)
+    cache.set("key", "value", ttl=10, stale_ttl=20)
+
+    clock.now += 15
+    assert cache.get_entry("key") == ("value", False)
+    assert cache.get("key") is None
+
+    clock.now += 20
+    assert cache.get_entry("key") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_compaction_bounds_size(tmp_path):
+    clock = FakeClock()
+    cache: SQLiteCache[int] = SQLiteCache(
+        tmp_path / "cache.db", maxsize=5, compact_every=4, clock=clock
+    )
+    cache.set("expired", 0, ttl=1)
+    clock.now += 2
+    for index in range(8):
+        cache.set(str(index), index, ttl=100 + index)
+
+    cache.compact()
+
+    assert len(cache) == 5
+    assert cache.get("expired") is None
+    assert cache.get("0") is None
+    assert cache.get("7") == 7
+    assert cache.stats.expirations == 1
+
+
+def test_sqlite_cache_ignores_undecodable_entries(tmp_path):
+    cache: SQLiteCache[str] = SQLiteCache(
+        tmp_path / "cache.db", dumps=str.encode, loads=lambda data: data.decode()
+    )
+    cache.set("key", "value")
+    broken: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db")
+
+    assert broken.get("key") is None
+    assert len(broken) == 0
+
+
+def test_sqlite_cache_is_shared_between_threads_and_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=write_entries, args=(path, worker))
+        for worker in range(2)
+    ]
+    threads = [
+        threading.Thread(target=write_entries, args=(path, worker))
+        for worker in range(2, 4)
+    ]
+    for runner in [*processes, *threads]:
+        runner.start()
+    for runner in [*processes, *threads]:
+        runner.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert len(SQLiteCache(path)) == 200
+
+
+@pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"compact_every": 0}, {"ttl": 0}])
+def test_sqlite_cache_rejects_invalid_configuration(tmp_path, kwargs):
+    with pytest.raises(ConfigurationError):
+        SQLiteCache(tmp_path / "cache.db", **kwargs)
+
+
+def test_tiered_cache_promotes_back_entries_with_their_lifetime(tmp_path):
+    clock = FakeClock()
+    back: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db", clock=clock)
+    back.set("key", "value", ttl=10)
+    front: LRUCache[str] = LRUCache(clock=clock)
+    cache = TieredCache(front, back)
+
+    assert cache.get("key") == "value"
+    assert front.peek("key") == ("value", 10, 10)
+    assert cache.get("key") == "value"
+    assert back.stats.hits == 0
+    assert (cache.stats.hits, cache.stats.misses) == (2, 0)
+
+    clock.now += 11
+    assert cache.get("key") is None
+
+
+def test_tiered_cache_writes_and_deletes_both_tiers(tmp_path):
+    back: SQLiteCache[str] = SQLiteCache(tmp_path / "cache.db")
+    front: LRUCache[str] = LRUCache()
+    cache = TieredCache(front, back)
+
+    cache.set("key", "value", ttl=60)
+    assert front.get("key") == back.get("key") == "value"
+
+    cache.delete("key")
+    assert front.get("key") is None and back.get("key") is None
+
+
+def test_statistics_cache_on_disk_survives_controller_restart(tmp_path):
+    def controller(module: CountingFakeStatistics) -> FoxyPack:
+        backend = TieredCache(LRUCache(), SQLiteCache(tmp_path / "cache.db"))
+        return FoxyPack(
+            statistics_cache=StatisticsCache(ttl=60, backend=backend)
+        ).with_module(FakeAnalysis(), module)
+
+    first = CountingFakeStatistics()
+    answer = controller(first).get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+    second = CountingFakeStatistics()
+    cached = controller(second).get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert cached == answer
+    assert (first.calls, second.calls) == (1, 0)
+
+
+class ThreadRecordingSQLiteCache(SQLiteCache):
+    def __init__(self, path) -> None:
+        super().__init__(path)
+        self.threads: set[int] = set()
+
+    def get_entry(self, key, allow_stale=True):
+        self.threads.add(threading.get_ident())
+        return super().get_entry(key, allow_stale)
+
+    def set(self, key, value, ttl=None, stale_ttl=0.0):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ttl, stale_ttl)
+
+
+@pytest.mark.asyncio
+async def test_async_path_keeps_sqlite_io_off_the_event_loop(tmp_path):
+    backend = ThreadRecordingSQLiteCache(tmp_path / "cache.db")
+    cache = StatisticsCache(ttl=60, backend=TieredCache(LRUCache(), backend))
+    foxypack = FoxyPack(statistics_cache=cache).with_module(
+        FakeAnalysis(), CountingFakeStatistics()
+    )
+
+    assert cache.blocking
+    await foxypack.get_statistics_async("https://fakesocialmedia.com/qsgqsdrr")
+
+    assert backend.threads
+    assert threading.get_ident() not in backend.threads
+    assert not StatisticsCache().blocking
@@ -0,0 +1,107 @@
+import pytest
+
+from foxypack import (
+    AttemptRecord,
+    FoxyPack,
+    RetryPolicy,
+    ServiceUnavailableError,
+    StatisticsCache,
+    TimeoutError,
+    UnsupportedOperationError,
+)
+from tests.foxypack_abc.test_foxyanalysis import FakeAnalysis
+from tests.foxypack_abc.test_foxystatistics import FakeStatistics
+
+
+class DownFakeStatistics(FakeStatistics):
+    def get_statistics(self, answers_analysis):
+        raise ServiceUnavailableError()
+
+    async def get_statistics_async(self, answers_analysis):
+        raise ServiceUnavailableError()
+
+
+class SlowFakeStatistics(FakeStatistics):
+    def get_statistics(self, answers_analysis):
+        raise TimeoutError()
+
+    async def get_statistics_async(self, answers_analysis):
+        raise TimeoutError()
+
+
+def test_trace_records_every_attempt_of_a_lookup():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), FakeStatistics())
+    trace: list[AttemptRecord] = []
+
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", trace=trace)
+
+    assert [(record.stage, record.module, record.outcome) for record in trace] == [
+        ("analysis", "FakeAnalysis", "ok"),
+        ("statistics", "FakeStatistics", "ok"),
+    ]
+    assert trace[0].started <= trace[1].started
+    assert all(record.duration >= 0 for record in trace)
+
+
+def test_trace_includes_retried_attempts():
+    foxypack = FoxyPack(
+        retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001)
+    ).with_module(FakeAnalysis(), DownFakeStatistics())
+    trace: list[AttemptRecord] = []
+
+    with pytest.raises(UnsupportedOperationError):
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", trace=trace)
+
+    outcomes = [record.outcome for record in trace if record.stage == "statistics"]
+    assert outcomes == ["ServiceUnavailableError"] * 3
+
+
+def test_final_error_carries_attempts_and_grouped_causes():
+    foxypack = (
+        FoxyPack()
+        .with_module(FakeAnalysis(), DownFakeStatistics())
+        .with_module(FakeAnalysis(), SlowFakeStatistics())
+    )
+
+    with pytest.raises(UnsupportedOperationError) as exc_info:
+        foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+
+    error = exc_info.value
+    attempts = error.details["attempts"]
+    assert {attempt["module"] for attempt in attempts} == {
+        "DownFakeStatistics",
+        "SlowFakeStatistics",
+    }
+    assert error.details["social_platform"] == "FakeSocialMedia"
+    assert isinstance(error.cause, ExceptionGroup)
+    assert error.__cause__ is error.cause
+    assert {type(cause) for cause in error.cause.exceptions} == {
+        ServiceUnavailableError,
+        TimeoutError,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_trace_and_final_error():
+    foxypack = FoxyPack().with_module(FakeAnalysis(), DownFakeStatistics())
+    trace: list[AttemptRecord] = []
+
+    with pytest.raises(UnsupportedOperationError) as exc_info:
+        await foxypack.get_statistics_async(
+            "https://fakesocialmedia.com/qsgqsdrr", trace=trace
+        )
+
+    assert [record.stage for record in trace] == ["analysis", "statistics"]
+    assert exc_info.value.details["attempts"] == [trace[1].to_dict()]
+
+
+def test_cached_lookup_adds_no_attempts():
+    foxypack = FoxyPack(statistics_cache=StatisticsCache()).with_module(
+        FakeAnalysis(), FakeStatistics()
+    )
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr")
+    trace: list[AttemptRecord] = []
+
+    foxypack.get_statistics("https://fakesocialmedia.com/qsgqsdrr", trace=trace)
+
+    assert trace == []